@@ -0,0 +1,348 @@
+"""
+Synthetic fixtures for the local WordPress API stand-in
+Generates deterministic books, snapshot series, Rising Stars / Popular This
+Week appearances, shoutout campaigns and book claims shaped like the
+rr-analytics/v1 responses the bot modules consume
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional
+
+from shared_utils import ALL_RS_TAGS, UNIQUE_TAGS
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Default fixture size
+DEFAULT_BOOKS = 200
+DEFAULT_SNAPSHOTS = 400
+DEFAULT_CAMPAIGNS = 60
+# Hours between two snapshots of the same book
+SNAPSHOT_INTERVAL_HOURS = 6
+# First synthetic book ID
+FIRST_BOOK_ID = 100001
+# Share of books that had a Main Rising Stars run
+RS_RUN_SHARE = 0.2
+# Days of Popular This Week scrapes kept per tag
+PTW_HISTORY_DAYS = 7
+PTW_LIST_SIZE = 50
+
+# Collections written by dump() / read by load()
+FIXTURE_FILES = ('books', 'series', 'rs_appearances', 'ptw_snapshots', 'campaigns', 'claims')
+
+TITLE_WORDS = [
+    'Ashen', 'Crown', 'Dungeon', 'Echo', 'Forge', 'Hollow', 'Iron', 'Loop', 'Mage',
+    'Night', 'Oath', 'Rift', 'Saint', 'System', 'Tower', 'Void', 'Warden', 'Wyrm'
+]
+AUTHOR_NAMES = [
+    'quillfox', 'NovaInk', 'the_tired_bard', 'RuneScribe', 'ElderMoth', 'paperdragon',
+    'StarlitPen', 'grimquill', 'LoopWriter', 'CoffeeMage'
+]
+
+
+def format_timestamp(moment: datetime) -> str:
+    """Format a datetime the way the API does ('YYYY-MM-DD HH:MM:SS')"""
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def unix_timestamp(moment: datetime) -> int:
+    """Unix seconds of a naive UTC datetime, as book-chart-data sends its timestamps"""
+    return int(moment.replace(tzinfo=timezone.utc).timestamp())
+
+
+def format_date(timestamp: int) -> str:
+    """Convert Unix seconds to 'YYYY-MM-DD' (UTC)"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+class FixtureSet:
+    """
+    Deterministic synthetic data set
+
+    Every collection is derived from (seed, entity) so the same settings
+    always produce the same data. Series are generated lazily per book,
+    which keeps large snapshot counts cheap when only a few books are used.
+    """
+
+    def __init__(self, seed: int = 1, books: int = DEFAULT_BOOKS, snapshots: int = DEFAULT_SNAPSHOTS,
+                 campaigns: int = DEFAULT_CAMPAIGNS, end_time: Optional[datetime] = None):
+        self.seed = seed
+        self.book_count = books
+        self.snapshot_count = snapshots
+        self.campaign_count = campaigns
+
+        if end_time is None:
+            end_time = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+        self.end_time = end_time
+
+        self.books: Dict[str, Dict[str, Any]] = {}
+        self.series: Dict[str, Dict[str, List]] = {}
+        self.rs_appearances: List[Dict[str, Any]] = []
+        self.ptw_snapshots: List[Dict[str, Any]] = []
+        self.campaigns: List[Dict[str, Any]] = []
+        self.claims: Dict[str, List[Dict[str, Any]]] = {}
+
+        self.generate()
+
+    def rng(self, *key) -> random.Random:
+        """Random generator for one entity"""
+        return random.Random(':'.join(str(part) for part in (self.seed,) + key))
+
+    @property
+    def book_ids(self) -> List[str]:
+        return list(self.books)
+
+    def generate(self):
+        """Build every collection except the (lazy) snapshot series"""
+        for index in range(self.book_count):
+            book_id = str(FIRST_BOOK_ID + index)
+            rng = self.rng('book', book_id)
+            title = ' '.join(rng.sample(TITLE_WORDS, 2)) + f" {rng.choice(['Saga', 'Chronicles', 'Online', 'Reborn'])}"
+            self.books[book_id] = {
+                'id': book_id,
+                'title': title,
+                'author_name': rng.choice(AUTHOR_NAMES),
+                'url': f"https://www.royalroad.com/fiction/{book_id}",
+                'status': rng.choice(['ONGOING', 'ONGOING', 'ONGOING', 'HIATUS', 'COMPLETED']),
+                'tags': rng.sample(ALL_RS_TAGS[1:], 4),
+                'rating': round(rng.uniform(3.5, 4.9), 2),
+                'pages': rng.randint(50, 3000),
+                'base_followers': int(rng.lognormvariate(5.5, 1.2)),
+                'daily_growth': rng.lognormvariate(1.5, 1.0),
+                'has_rs_run': rng.random() < RS_RUN_SHARE
+            }
+
+        self.rs_appearances = self.generate_rs_appearances()
+        self.ptw_snapshots = self.generate_ptw_snapshots()
+        self.campaigns = self.generate_campaigns()
+
+    def public_book_info(self, book_id: str) -> Optional[Dict[str, Any]]:
+        """book_info block as returned by the chart and RS endpoints"""
+        book = self.books.get(str(book_id))
+        if book is None:
+            return None
+        return {
+            'id': book['id'],
+            'title': book['title'],
+            'author_name': book['author_name'],
+            'author': book['author_name'],
+            'url': book['url'],
+            'status': book['status']
+        }
+
+    def get_series(self, book_id: str) -> Optional[Dict[str, List]]:
+        """Full snapshot history of a book, generated on first use"""
+        book_id = str(book_id)
+        if book_id not in self.books:
+            return None
+        if book_id not in self.series:
+            self.series[book_id] = self.generate_series(book_id)
+        return self.series[book_id]
+
+    def generate_series(self, book_id: str) -> Dict[str, List]:
+        """Random-walk follower/view history with a Rising Stars bump for RS books"""
+        book = self.books[book_id]
+        rng = self.rng('series', book_id)
+        start = self.end_time - timedelta(hours=SNAPSHOT_INTERVAL_HOURS * (self.snapshot_count - 1))
+        steps_per_day = 24 // SNAPSHOT_INTERVAL_HOURS
+        rs_run = self.rs_run(book_id)
+
+        followers = float(book['base_followers'])
+        views = followers * rng.uniform(20, 60)
+        chapters = rng.randint(1, 20)
+        ratings = max(1, int(followers * 0.05))
+
+        series = {name: [] for name in ('labels', 'timestamps', 'followers', 'total_views',
+                                        'average_views', 'chapters', 'overall_score', 'ratings')}
+        for step in range(self.snapshot_count):
+            moment = start + timedelta(hours=SNAPSHOT_INTERVAL_HOURS * step)
+            growth = book['daily_growth'] / steps_per_day * rng.uniform(0.2, 1.8)
+            if rs_run and rs_run[0] <= moment < rs_run[1]:
+                growth *= 8
+            followers += growth
+            views += growth * rng.uniform(15, 40)
+            if rng.random() < 0.1:
+                chapters += 1
+            if rng.random() < 0.05:
+                ratings += 1
+
+            series['labels'].append(moment.strftime('%b %d'))
+            series['timestamps'].append(unix_timestamp(moment))
+            series['followers'].append(int(followers))
+            series['total_views'].append(int(views))
+            series['average_views'].append(int(views / chapters))
+            series['chapters'].append(chapters)
+            series['overall_score'].append(book['rating'])
+            series['ratings'].append(ratings)
+
+        return series
+
+    def rs_run(self, book_id: str):
+        """
+        Main Rising Stars run of a book
+
+        Returns:
+            Tuple of (first day, day after the last day) or None
+        """
+        if not self.books[book_id]['has_rs_run']:
+            return None
+        rng = self.rng('rs', book_id)
+        days = max(1, self.snapshot_count * SNAPSHOT_INTERVAL_HOURS // 24)
+        run_length = min(days, rng.randint(3, 14))
+        first_day = self.end_time - timedelta(days=rng.randint(run_length - 1, days - 1))
+        return first_day, first_day + timedelta(days=run_length)
+
+    def generate_rs_appearances(self) -> List[Dict[str, Any]]:
+        """Daily Rising Stars appearance rows (book_id, tag, position, scraped_at), oldest first"""
+        rows = []
+        for book_id, book in self.books.items():
+            run = self.rs_run(book_id)
+            if run is None:
+                continue
+            rng = self.rng('rs-positions', book_id)
+            for tag in ['main'] + book['tags'][:2]:
+                position = rng.randint(10, 50) if tag == 'main' else rng.randint(1, 20)
+                for day in range((run[1] - run[0]).days):
+                    position = max(1, min(50, position + rng.randint(-5, 3)))
+                    scraped_at = run[0] + timedelta(days=day, hours=2)
+                    rows.append({
+                        'book_id': book_id,
+                        'tag': tag,
+                        'position': position,
+                        'scraped_at': format_timestamp(scraped_at)
+                    })
+        rows.sort(key=lambda row: row['scraped_at'])
+        return rows
+
+    def generate_ptw_snapshots(self) -> List[Dict[str, Any]]:
+        """One Popular This Week list per tag per day, oldest first"""
+        snapshots = []
+        book_ids = self.book_ids
+        for day in range(PTW_HISTORY_DAYS):
+            scraped_at = format_timestamp(self.end_time - timedelta(days=PTW_HISTORY_DAYS - 1 - day, hours=-3))
+            for tag in ALL_RS_TAGS:
+                rng = self.rng('ptw', tag, day)
+                chosen = rng.sample(book_ids, min(PTW_LIST_SIZE, len(book_ids)))
+                views = sorted((int(rng.lognormvariate(8, 1)) for _ in chosen), reverse=True)
+                snapshots.append({
+                    'tag': tag,
+                    'scraped_at': scraped_at,
+                    'books': [
+                        {
+                            'book_id': book_id,
+                            'position': position,
+                            'title': self.books[book_id]['title'],
+                            'author': self.books[book_id]['author_name'],
+                            'weekly_views': weekly_views
+                        }
+                        for position, (book_id, weekly_views) in enumerate(zip(chosen, views), 1)
+                    ]
+                })
+        return snapshots
+
+    def generate_campaigns(self) -> List[Dict[str, Any]]:
+        """Shoutout campaigns for random books"""
+        campaigns = []
+        book_ids = self.book_ids
+        for index in range(self.campaign_count):
+            rng = self.rng('campaign', index)
+            book = self.books[rng.choice(book_ids)]
+            start = self.end_time + timedelta(days=rng.randint(1, 30))
+            campaigns.append({
+                'id': index + 1,
+                'book_title': book['title'],
+                'book_url': book['url'],
+                'rr_book_id': book['id'],
+                'author_name': book['author_name'],
+                'discord_user_id': str(rng.randint(10 ** 17, 10 ** 18 - 1)),
+                'platform': 'royalroad',
+                'genre': rng.choice(UNIQUE_TAGS),
+                'min_followers': rng.choice([0, 100, 500]),
+                'max_followers': rng.choice([None, 5000, 20000]),
+                'server_id': rng.choice([None, '111111111111111111']),
+                'available_slots': rng.randint(0, 10),
+                'available_dates': json.dumps([(start + timedelta(days=d)).strftime('%Y-%m-%d') for d in range(rng.randint(1, 5))]),
+                'campaign_status': rng.choice(['active', 'active', 'active', 'paused']),
+                'created_at': format_timestamp(self.end_time - timedelta(days=rng.randint(0, 60)))
+            })
+        return campaigns
+
+    def get_claims(self, discord_user_id: str) -> List[Dict[str, Any]]:
+        """Claimed books of a user (stable per user ID)"""
+        discord_user_id = str(discord_user_id)
+        if discord_user_id not in self.claims:
+            rng = self.rng('claims', discord_user_id)
+            self.claims[discord_user_id] = [
+                {
+                    'royal_road_book_id': book_id,
+                    'book_title': self.books[book_id]['title'],
+                    'book_url': self.books[book_id]['url'],
+                    'status': 'approved'
+                }
+                for book_id in rng.sample(self.book_ids, min(len(self.book_ids), rng.randint(0, 3)))
+            ]
+        return self.claims[discord_user_id]
+
+    def dump(self, directory: str):
+        """Write every collection (including all series) to JSON files"""
+        for book_id in self.books:
+            self.get_series(book_id)
+
+        os.makedirs(directory, exist_ok=True)
+        for name in FIXTURE_FILES:
+            with open(os.path.join(directory, f"{name}.json"), 'w') as handle:
+                json.dump(getattr(self, name), handle)
+
+        with open(os.path.join(directory, 'settings.json'), 'w') as handle:
+            json.dump({
+                'seed': self.seed,
+                'books': self.book_count,
+                'snapshots': self.snapshot_count,
+                'campaigns': self.campaign_count,
+                'end_time': format_timestamp(self.end_time)
+            }, handle)
+
+        logger.info(f"[FIXTURES] Wrote {len(self.books)} books to {directory}")
+
+    @classmethod
+    def load(cls, directory: str) -> 'FixtureSet':
+        """Load a fixture set written by dump()"""
+        with open(os.path.join(directory, 'settings.json')) as handle:
+            settings = json.load(handle)
+
+        fixtures = cls.__new__(cls)
+        fixtures.seed = settings['seed']
+        fixtures.book_count = settings['books']
+        fixtures.snapshot_count = settings['snapshots']
+        fixtures.campaign_count = settings['campaigns']
+        fixtures.end_time = datetime.strptime(settings['end_time'], '%Y-%m-%d %H:%M:%S')
+
+        for name in FIXTURE_FILES:
+            with open(os.path.join(directory, f"{name}.json")) as handle:
+                setattr(fixtures, name, json.load(handle))
+
+        return fixtures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic rr-analytics fixtures")
+    parser.add_argument('output', help="Directory to write the fixture files to")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--books', type=int, default=DEFAULT_BOOKS)
+    parser.add_argument('--snapshots', type=int, default=DEFAULT_SNAPSHOTS, help="Snapshots per book")
+    parser.add_argument('--campaigns', type=int, default=DEFAULT_CAMPAIGNS)
+    parser.add_argument('--end', help="Date of the newest snapshot (YYYY-MM-DD, default: today)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    end_time = datetime.strptime(args.end, '%Y-%m-%d') if args.end else None
+    FixtureSet(args.seed, args.books, args.snapshots, args.campaigns, end_time).dump(args.output)
+
+
+if __name__ == '__main__':
+    main()
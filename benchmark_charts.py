@@ -0,0 +1,339 @@
+"""
+Chart rendering micro-benchmarks for Discord Essence Bot
+Times create_chart_image, create_average_views_chart_image,
+create_ratings_chart_image and create_rs_impact_chart over synthetic series
+of different sizes and reports wall time, peak RSS, traced allocations and
+PNG size as JSON, for each rendering strategy (pyplot vs OO API, DPI,
+downsampling)
+
+Usage:
+    python benchmark_charts.py --points 10 100 1000 10000 --output charts.json
+    python benchmark_charts.py --dpi 150 100 --api pyplot oo --downsample 0 500
+    python benchmark_charts.py --compare charts.json
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import chart_commands_module
+import rs_analysis_module
+from benchmark_handlers import percentile, git_revision
+from chart_commands_module import ChartCommandsModule
+from rs_analysis_module import RSAnalysisModule
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+DEFAULT_POINTS = (10, 100, 1000, 10000)
+DEFAULT_DAY_RANGES = (30, 365)
+DEFAULT_REPEATS = 3
+# Charts that can be benchmarked ('followers' and 'views' both use create_chart_image)
+CHARTS = ('followers', 'views', 'average_views', 'ratings', 'rs_impact')
+
+
+class PyplotShim:
+    """
+    Replacement for the 'plt' module used by the chart functions
+
+    Delegates to pyplot, optionally forcing the savefig DPI. With oo=True
+    figures are created as matplotlib.figure.Figure with an Agg canvas
+    instead of going through pyplot's figure manager.
+    """
+
+    def __init__(self, dpi: Optional[int] = None, oo: bool = False):
+        self.dpi = dpi
+        self.oo = oo
+        self.figure: Optional[Figure] = None
+
+    def __getattr__(self, name):
+        return getattr(plt, name)
+
+    def subplots(self, *args, figsize=None, **kwargs):
+        if not self.oo:
+            fig, axes = plt.subplots(*args, figsize=figsize, **kwargs)
+            self.figure = fig
+            return fig, axes
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        return self.figure, self.figure.subplots(*args, **kwargs)
+
+    def savefig(self, buffer, **kwargs):
+        if self.dpi:
+            kwargs['dpi'] = self.dpi
+        if self.oo:
+            return self.figure.savefig(buffer, **kwargs)
+        return plt.savefig(buffer, **kwargs)
+
+    def tight_layout(self, **kwargs):
+        if self.oo:
+            return self.figure.tight_layout(**kwargs)
+        return plt.tight_layout(**kwargs)
+
+    def close(self, *args):
+        if self.oo:
+            self.figure = None
+            return None
+        return plt.close(*args)
+
+
+def make_chart_data(points: int, days: int, seed: int = 1) -> Dict[str, List]:
+    """book-chart-data style series with 'points' snapshots spread over 'days'"""
+    rng = random.Random(f"{seed}:{points}:{days}")
+    end = datetime(2025, 9, 1)
+    step = timedelta(days=days) / max(points - 1, 1)
+
+    followers, views, chapters, ratings = 100.0, 5000.0, 10, 5
+    data = {name: [] for name in ('labels', 'timestamps', 'followers', 'total_views',
+                                  'average_views', 'chapters', 'overall_score', 'ratings')}
+    for index in range(points):
+        moment = end - step * (points - 1 - index)
+        followers += rng.uniform(0, 3)
+        views += rng.uniform(0, 80)
+        chapters += rng.random() < 0.05
+        ratings += rng.random() < 0.03
+        data['labels'].append(moment.strftime('%b %d'))
+        data['timestamps'].append(moment.strftime('%Y-%m-%d %H:%M:%S'))
+        data['followers'].append(int(followers))
+        data['total_views'].append(int(views))
+        data['average_views'].append(int(views / chapters))
+        data['chapters'].append(chapters)
+        data['overall_score'].append(round(4.2 + rng.uniform(-0.1, 0.1), 2))
+        data['ratings'].append(ratings)
+    return data
+
+
+def make_rs_chart_data(points: int, seed: int = 1):
+    """Daily rising-stars-chart data with a run in the middle third"""
+    rng = random.Random(f"{seed}:rs:{points}")
+    start = datetime(2025, 9, 1) - timedelta(days=points - 1)
+    dates = [(start + timedelta(days=day)).strftime('%Y-%m-%d') for day in range(points)]
+
+    followers, views = 100.0, 5000.0
+    chart_data = {'dates': dates, 'followers': [], 'total_views': []}
+    for day in range(points):
+        boost = 8 if points // 3 <= day < 2 * points // 3 else 1
+        followers += rng.uniform(0, 3) * boost
+        views += rng.uniform(0, 80) * boost
+        chart_data['followers'].append(int(followers))
+        chart_data['total_views'].append(int(views))
+
+    first, last = dates[points // 3], dates[max(points // 3, 2 * points // 3 - 1)]
+    rs_info = {
+        'first_appearance': first,
+        'last_appearance': last,
+        'best_position': 3,
+        'best_position_dates': [dates[points // 2]],
+        'days_on_list': max(1, points // 3)
+    }
+    return chart_data, rs_info
+
+
+def downsample(chart_data: Dict[str, List], max_points: int) -> Dict[str, List]:
+    """Keep the last point of each of max_points equal buckets (always keeps the newest point)"""
+    length = len(next(iter(chart_data.values()), []))
+    if not max_points or length <= max_points:
+        return chart_data
+    indices = sorted({min(length - 1, (bucket + 1) * length // max_points - 1) for bucket in range(max_points)})
+    return {name: [values[i] for i in indices] for name, values in chart_data.items()}
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process (VmHWM) in KB"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        return None
+
+
+def reset_peak_rss() -> bool:
+    """Reset VmHWM so the next peak_rss_kb() covers only what follows (Linux only)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return True
+    except OSError:
+        return False
+
+
+class ChartBenchmark:
+    """Runs every (chart, size, strategy) case and collects its measurements"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        # The render functions only need helper methods, not a registered bot
+        self.chart_module = ChartCommandsModule.__new__(ChartCommandsModule)
+        self.rs_module = RSAnalysisModule.__new__(RSAnalysisModule)
+
+    def prepare(self, chart: str, points: int, days: int, max_points: int):
+        """
+        Build the input data for one case outside of the timed section
+
+        Returns:
+            A function rendering the chart and returning its PNG buffer
+        """
+        title = f"Benchmark Book ({points} points)"
+        if chart == 'rs_impact':
+            chart_data, rs_info = make_rs_chart_data(points, self.args.seed)
+            chart_data = downsample(chart_data, max_points)
+            return lambda: self.rs_module.create_rs_impact_chart(chart_data, rs_info, title)
+
+        chart_data = downsample(make_chart_data(points, days, self.args.seed), max_points)
+        if chart in ('followers', 'views'):
+            return lambda: self.chart_module.create_chart_image(chart_data, chart, title, days)
+        if chart == 'average_views':
+            return lambda: self.chart_module.create_average_views_chart_image(chart_data, title, days)
+        return lambda: self.chart_module.create_ratings_chart_image(chart_data, title, days)
+
+    def measure(self, chart: str, points: int, days: int, api: str, dpi: int, max_points: int) -> Dict[str, Any]:
+        """Time one case, then run it once more under tracemalloc for allocations"""
+        shim = PyplotShim(dpi=dpi, oo=(api == 'oo'))
+        chart_commands_module.plt = shim
+        rs_analysis_module.plt = shim
+        render = self.prepare(chart, points, days, max_points)
+        try:
+            # Warm up fonts and caches for this configuration
+            render()
+
+            reset_supported = reset_peak_rss()
+            times = []
+            png_bytes = None
+            for _ in range(self.args.repeats):
+                started = time.perf_counter()
+                buffer = render()
+                times.append((time.perf_counter() - started) * 1000)
+                png_bytes = len(buffer.getvalue()) if buffer else None
+            rss = peak_rss_kb()
+
+            tracemalloc.start()
+            render()
+            _, traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            chart_commands_module.plt = plt
+            rs_analysis_module.plt = plt
+
+        return {
+            'chart': chart,
+            'points': points,
+            'days': None if chart == 'rs_impact' else days,
+            'api': api,
+            'dpi': dpi,
+            'downsample': max_points or None,
+            'wall_ms': {
+                'p50': percentile(times, 50),
+                'min': min(times),
+                'max': max(times)
+            },
+            'peak_rss_kb': rss if reset_supported else None,
+            'process_peak_rss_kb': rss,
+            'alloc_peak_kb': traced_peak // 1024,
+            'png_bytes': png_bytes,
+            'failed': png_bytes is None
+        }
+
+    def run(self) -> Dict[str, Any]:
+        cases = []
+        for chart, points, api, dpi, max_points in itertools.product(
+            self.args.charts, self.args.points, self.args.api, self.args.dpi, self.args.downsample
+        ):
+            # RS impact data is daily, so day ranges don't apply to it
+            for days in ([None] if chart == 'rs_impact' else self.args.days):
+                result = self.measure(chart, points, days, api, dpi, max_points)
+                cases.append(result)
+                print(
+                    f"[BENCH] {case_key(result)}: {result['wall_ms']['p50']:.1f} ms, "
+                    f"{result['png_bytes']} bytes, {result['alloc_peak_kb']} KB allocated",
+                    file=sys.stderr
+                )
+
+        return {
+            'meta': {
+                'git_revision': git_revision(),
+                'python': platform.python_version(),
+                'matplotlib': matplotlib.__version__,
+                'platform': platform.platform(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'settings': {'repeats': self.args.repeats, 'seed': self.args.seed}
+            },
+            'cases': cases
+        }
+
+
+def case_key(case: Dict[str, Any]) -> str:
+    """Stable identifier of a benchmark case"""
+    return (f"{case['chart']}/{case['points']}pts/{case['days'] or 'daily'}d/"
+            f"{case['api']}/dpi{case['dpi']}/ds{case['downsample'] or 'off'}")
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Lines describing wall time and PNG size changes against a baseline run"""
+    base_cases = {case_key(case): case for case in baseline.get('cases', [])}
+    lines = []
+    for case in current['cases']:
+        base = base_cases.get(case_key(case))
+        if not base or not base['wall_ms']['p50'] or case['failed'] or base['failed']:
+            continue
+        new, old = case['wall_ms']['p50'], base['wall_ms']['p50']
+        lines.append(
+            f"{case_key(case):50} {old:9.1f} -> {new:9.1f} ms ({(new - old) / old * 100:+.1f}%), "
+            f"png {base['png_bytes']} -> {case['png_bytes']} bytes"
+        )
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chart rendering")
+    parser.add_argument('--charts', nargs='*', default=list(CHARTS), choices=CHARTS)
+    parser.add_argument('--points', nargs='*', type=int, default=list(DEFAULT_POINTS))
+    parser.add_argument('--days', nargs='*', type=int, default=list(DEFAULT_DAY_RANGES), help="Day ranges the points are spread over")
+    parser.add_argument('--api', nargs='*', default=['pyplot'], choices=['pyplot', 'oo'])
+    parser.add_argument('--dpi', nargs='*', type=int, default=[150])
+    parser.add_argument('--downsample', nargs='*', type=int, default=[0], help="Max points per chart (0: off)")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="Write JSON results to this file (default: stdout)")
+    parser.add_argument('--compare', help="Baseline JSON results to compare against")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    results = ChartBenchmark(args).run()
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(results, handle, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        print("\n".join(compare(results, baseline)), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,480 @@
+"""
+End-to-end command latency benchmark for Discord Essence Bot
+Runs the real command handlers with fake Discord interactions against the
+local WordPress API stand-in and reports time-to-defer, time-to-first-followup,
+total handler time and CPU time percentiles as JSON
+
+Usage:
+    python benchmark_handlers.py --iterations 50 --output bench.json
+    python benchmark_handlers.py --iterations 50 --compare bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Any, List, Optional
+
+import aiohttp
+import discord
+from discord.ext import commands
+
+from api_fixtures import FixtureSet, DEFAULT_BOOKS, DEFAULT_SNAPSHOTS
+from book_claim_module import BookClaimModule
+from book_series_cache import BookSeriesCache
+from chart_commands_module import ChartCommandsModule
+from essence_commands_module import EssenceCommandsModule
+import json_codec
+from http_cache import ACCEPT_ENCODING
+from local_wp_api import DEFAULT_TOKEN
+from others_also_liked_module import OthersAlsoLikedModule
+from promotional_utils import get_promotional_field, add_promotional_field
+from ptw_module import PopularThisWeekModule
+from rs_analysis_module import RSAnalysisModule
+from shared_utils import ALL_RS_TAGS, UNIQUE_TAGS, tag_autocomplete
+from shoutout_module import ShoutoutModule
+from user_resolver import UserResolver
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Percentiles reported for every metric
+PERCENTILES = (50, 95, 99)
+# Metrics recorded per invocation (milliseconds)
+METRICS = ('time_to_defer_ms', 'time_to_first_followup_ms', 'total_ms', 'cpu_ms')
+# Number of distinct books the inputs cycle through (mixes cold and warm caches)
+DEFAULT_BOOK_SAMPLE = 20
+# How long to wait for the stand-in to come up (seconds)
+STANDIN_STARTUP_TIMEOUT = 30
+
+
+class FakeMessage:
+    """Message returned by followup.send(wait=True)"""
+
+    def __init__(self, interaction: 'FakeInteraction', content=None, embed=None):
+        self.interaction = interaction
+        self.id = random.randint(10 ** 17, 10 ** 18 - 1)
+        self.content = content
+        self.embed = embed
+
+    async def edit(self, **kwargs):
+        self.interaction.mark('last_edit')
+        self.embed = kwargs.get('embed', self.embed)
+        return self
+
+
+class FakeResponse:
+    """interaction.response stand-in recording when the first response happened"""
+
+    def __init__(self, interaction: 'FakeInteraction'):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self) -> bool:
+        return self.done
+
+    async def respond(self, content=None, **kwargs):
+        if self.done:
+            raise discord.InteractionResponded(self.interaction)
+        self.done = True
+        self.interaction.mark('defer')
+        if content is not None or kwargs.get('embed') is not None:
+            self.interaction.record_message(content, kwargs.get('ephemeral', False))
+
+    async def defer(self, **kwargs):
+        await self.respond(**kwargs)
+
+    async def send_message(self, content=None, **kwargs):
+        await self.respond(content, **kwargs)
+
+    async def send_modal(self, modal):
+        await self.respond()
+
+    async def edit_message(self, **kwargs):
+        await self.respond()
+
+
+class FakeFollowup:
+    """interaction.followup stand-in recording when the first followup was sent"""
+
+    def __init__(self, interaction: 'FakeInteraction'):
+        self.interaction = interaction
+
+    async def send(self, content=None, wait=False, **kwargs):
+        self.interaction.mark('first_followup')
+        self.interaction.record_message(content, kwargs.get('ephemeral', False))
+        message = FakeMessage(self.interaction, content, kwargs.get('embed'))
+        return message if wait else None
+
+    async def edit_message(self, message_id, **kwargs):
+        self.interaction.mark('last_edit')
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.name = 'benchmark'
+        self.mention = f"<#{channel_id}>"
+
+    async def send(self, *args, **kwargs):
+        return FakeMessage(None)
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = 'Benchmark Server'
+
+    def get_channel(self, channel_id):
+        return None
+
+
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.name = f"bench_user_{user_id % 1000}"
+        self.discriminator = '0'
+        self.display_name = self.name
+        self.mention = f"<@{user_id}>"
+        self.guild_permissions = discord.Permissions.none()
+
+    def __str__(self):
+        return self.name
+
+
+class FakeInteraction:
+    """
+    Minimal discord.Interaction replacement
+
+    Only the attributes the command handlers touch are provided. Times are
+    recorded relative to creation, which happens right before the handler
+    is called.
+    """
+
+    def __init__(self, user_id: int, guild_id: Optional[int] = None):
+        self.user = FakeUser(user_id)
+        self.guild = FakeGuild(guild_id) if guild_id else None
+        self.guild_id = guild_id
+        self.channel = FakeChannel(guild_id or user_id)
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.messages: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+        self.started = time.perf_counter()
+
+    def mark(self, name: str):
+        """Record the first time an event happened (last time for 'last_edit')"""
+        if name not in self.marks or name == 'last_edit':
+            self.marks[name] = time.perf_counter()
+
+    def elapsed_ms(self, name: str) -> Optional[float]:
+        if name not in self.marks:
+            return None
+        return (self.marks[name] - self.started) * 1000
+
+    def record_message(self, content, ephemeral: bool):
+        self.messages.append({'content': content, 'ephemeral': ephemeral})
+
+    @property
+    def failed(self) -> bool:
+        """Whether the handler answered with an error message"""
+        return any(
+            message['ephemeral'] and isinstance(message['content'], str) and message['content'].startswith(('❌', '⏰'))
+            for message in self.messages
+        )
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Linearly interpolated percentile of a list of values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: List[Dict[str, Optional[float]]]) -> Dict[str, Any]:
+    """Percentiles and mean of every metric"""
+    summary = {}
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples if sample[metric] is not None]
+        summary[metric] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+        summary[metric]['mean'] = sum(values) / len(values) if values else None
+    return summary
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+class HandlerBenchmark:
+    """Builds the bot modules against a stand-in API and times their handlers"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.fixtures = FixtureSet(args.seed, args.books, args.snapshots)
+        self.standin: Optional[subprocess.Popen] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.modules: Dict[str, Any] = {}
+
+        book_ids = self.fixtures.book_ids
+        self.book_sample = self.random.sample(book_ids, min(args.book_sample, len(book_ids)))
+        rs_books = [book_id for book_id in book_ids if self.fixtures.books[book_id]['has_rs_run']]
+        self.rs_book_sample = self.random.sample(rs_books, min(args.book_sample, len(rs_books))) or self.book_sample
+        self.single_word_tags = [tag for tag in UNIQUE_TAGS if ' ' not in tag]
+
+    async def start_standin(self) -> str:
+        """Start local_wp_api.py in a subprocess (so its CPU isn't counted) and wait for it"""
+        if self.args.api_url:
+            return self.args.api_url
+
+        port = free_port()
+        command = [
+            sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'local_wp_api.py'),
+            '--port', str(port), '--seed', str(self.args.seed),
+            '--books', str(self.args.books), '--snapshots', str(self.args.snapshots),
+            '--latency-ms', str(self.args.latency_ms), '--error-rate', str(self.args.error_rate),
+            '--verified-server', str(self.args.guild_id)
+        ]
+        if self.args.etags:
+            command.append('--etags')
+        if self.args.compress:
+            command.append('--compress')
+        self.standin = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + STANDIN_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                async with self.session.get(f"{url}/wp-json/rr-analytics/v1/health") as response:
+                    if response.status == 200:
+                        return url
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+
+        raise RuntimeError("Local WordPress API did not start")
+
+    async def setup(self):
+        """Create the session, stand-in and modules"""
+        self.session = aiohttp.ClientSession(
+            json_serialize=json_codec.dumps, headers={'Accept-Encoding': ACCEPT_ENCODING}
+        )
+        url = await self.start_standin()
+        token = self.args.token
+
+        # The shoutout module persists pending DMs; keep them out of the working tree
+        os.environ['DM_QUEUE_STATE_PATH'] = os.path.join(tempfile.mkdtemp(), 'pending_dms.json')
+
+        bot = commands.Bot(command_prefix='!', intents=discord.Intents.default())
+        user_resolver = UserResolver(bot)
+        series_cache = BookSeriesCache(self.session, url, token)
+
+        self.modules = {
+            'essence': EssenceCommandsModule(
+                bot, self.session, url, token,
+                get_promotional_field_func=get_promotional_field,
+                add_promotional_field_func=add_promotional_field,
+                tag_autocomplete_func=tag_autocomplete
+            ),
+            'chart': ChartCommandsModule(
+                bot, self.session, url, token,
+                get_promotional_field_func=get_promotional_field,
+                add_promotional_field_func=add_promotional_field,
+                series_cache=series_cache
+            ),
+            'rs_analysis': RSAnalysisModule(
+                bot, self.session, url, token,
+                add_promotional_field_func=add_promotional_field,
+                series_cache=series_cache
+            ),
+            'ptw': PopularThisWeekModule(bot, self.session, url, token, add_promotional_field_func=add_promotional_field),
+            'others_also_liked': OthersAlsoLikedModule(bot, self.session, url, token, add_promotional_field_func=add_promotional_field),
+            'shoutout': ShoutoutModule(bot, self.session, url, token, tag_autocomplete, user_resolver=user_resolver),
+            'book_claim': BookClaimModule(bot, self.session, url, token, user_resolver=user_resolver)
+        }
+
+        # Let the background stores finish their first sync before timing
+        await self.modules['ptw'].snapshot_store.refresh()
+        await self.modules['rs_analysis'].appearance_index.refresh()
+
+    async def teardown(self):
+        if self.session is not None:
+            await self.session.close()
+        if self.standin is not None:
+            self.standin.terminate()
+            self.standin.wait()
+
+    def commands(self) -> Dict[str, Any]:
+        """Benchmarked commands: name -> function(interaction) returning the handler coroutine"""
+        m = self.modules
+
+        def tag_pair():
+            return self.random.sample(self.single_word_tags, 2)
+
+        def claim_ids():
+            return ', '.join(self.random.sample(self.fixtures.book_ids, 3))
+
+        return {
+            'essence': lambda i: m['essence'].essence_handler(i, *tag_pair()),
+            'quick_essence': lambda i: m['essence'].quick_essence_handler(i, ' '.join(tag_pair())),
+            'rr_followers': lambda i: m['chart'].rr_followers_handler(
+                i, self.random.choice(self.book_sample), 'all', self.random.random() < 0.5
+            ),
+            'rs_chart': lambda i: m['rs_analysis'].rs_chart_handler(i, self.random.choice(self.rs_book_sample), 7, 7),
+            'ptw_list': lambda i: m['ptw'].ptw_list_handler(i, 10, None, self.random.choice(ALL_RS_TAGS)),
+            'others_also_liked': lambda i: m['others_also_liked'].others_also_liked_handler(i, self.random.choice(self.book_sample)),
+            'browse_campaigns': lambda i: m['shoutout'].handle_browse_campaigns(i),
+            'claim_multiple_books': lambda i: m['book_claim'].claim_multiple_books(i, claim_ids(), None, None, None, None, None)
+        }
+
+    async def invoke(self, handler) -> Dict[str, Any]:
+        """Run one handler call and collect its timings"""
+        interaction = FakeInteraction(self.random.randint(10 ** 17, 10 ** 18 - 1), self.args.guild_id)
+        cpu_start = time.process_time()
+        error = None
+        try:
+            await handler(interaction)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        cpu_ms = (time.process_time() - cpu_start) * 1000
+        total_ms = (time.perf_counter() - interaction.started) * 1000
+
+        return {
+            'time_to_defer_ms': interaction.elapsed_ms('defer'),
+            'time_to_first_followup_ms': interaction.elapsed_ms('first_followup'),
+            'total_ms': total_ms,
+            'cpu_ms': cpu_ms,
+            'failed': error is not None or interaction.failed,
+            'error': error
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        """Benchmark every selected command"""
+        await self.setup()
+        try:
+            available = self.commands()
+            selected = self.args.commands or list(available)
+            results = {}
+
+            for name in selected:
+                handler = available[name]
+                for _ in range(self.args.warmup):
+                    await self.invoke(handler)
+
+                samples = [await self.invoke(handler) for _ in range(self.args.iterations)]
+                failures = [sample for sample in samples if sample['failed']]
+                results[name] = {
+                    'iterations': len(samples),
+                    'failures': len(failures),
+                    'errors': sorted({sample['error'] for sample in failures if sample['error']}),
+                    **summarize(samples)
+                }
+                print(
+                    f"[BENCH] {name}: p50 {results[name]['total_ms']['p50']:.1f} ms, "
+                    f"p95 {results[name]['total_ms']['p95']:.1f} ms, {len(failures)} failure(s)",
+                    file=sys.stderr
+                )
+
+            return {
+                'meta': {
+                    'git_revision': git_revision(),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'json_backend': json_codec.JSON_BACKEND,
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'settings': {
+                        'iterations': self.args.iterations,
+                        'warmup': self.args.warmup,
+                        'seed': self.args.seed,
+                        'books': self.args.books,
+                        'snapshots': self.args.snapshots,
+                        'book_sample': self.args.book_sample,
+                        'latency_ms': self.args.latency_ms,
+                        'error_rate': self.args.error_rate,
+                        'etags': self.args.etags,
+                        'compress': self.args.compress
+                    }
+                },
+                'commands': results
+            }
+        finally:
+            await self.teardown()
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Lines describing p50/p95 changes of every metric against a baseline run"""
+    lines = []
+    for name, result in current['commands'].items():
+        base = baseline.get('commands', {}).get(name)
+        if not base:
+            continue
+        for metric in METRICS:
+            for pct in ('p50', 'p95'):
+                new, old = result[metric][pct], base[metric][pct]
+                if new is None or old is None or old == 0:
+                    continue
+                lines.append(f"{name:22} {metric:27} {pct}: {old:9.2f} -> {new:9.2f} ms ({(new - old) / old * 100:+.1f}%)")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bot command handlers against the local API stand-in")
+    parser.add_argument('--iterations', type=int, default=30, help="Timed calls per command")
+    parser.add_argument('--warmup', type=int, default=3, help="Untimed calls per command")
+    parser.add_argument('--commands', nargs='*', help="Commands to run (default: all)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--books', type=int, default=DEFAULT_BOOKS)
+    parser.add_argument('--snapshots', type=int, default=DEFAULT_SNAPSHOTS)
+    parser.add_argument('--book-sample', type=int, default=DEFAULT_BOOK_SAMPLE, help="Distinct books used as inputs")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Median simulated API latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of API requests failing")
+    parser.add_argument('--etags', action='store_true', help="Have the stand-in send ETags and answer 304s")
+    parser.add_argument('--compress', action='store_true', help="Have the stand-in compress responses")
+    parser.add_argument('--guild-id', type=int, default=111111111111111111)
+    parser.add_argument('--api-url', help="Use an already running stand-in instead of starting one")
+    parser.add_argument('--token', default=DEFAULT_TOKEN)
+    parser.add_argument('--output', help="Write JSON results to this file (default: stdout)")
+    parser.add_argument('--compare', help="Baseline JSON results to compare against")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    results = asyncio.run(HandlerBenchmark(args).run())
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(results, handle, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        print("\n".join(compare(results, baseline)), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,16 +9,23 @@ from discord.ext import commands
 import aiohttp
 import json
 import asyncio
+import time
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 from enum import Enum
 import re
-import random
+
+from user_resolver import UserResolver
+import json_codec
+import promotional_utils
 
 # Set up logging for this module
 logger = logging.getLogger('discord')
 
+# How long permission and verification lookups stay cached (seconds)
+PERMISSION_CACHE_TTL = 120
+
 class ClaimStatus(Enum):
     """Enum for claim request statuses"""
     PENDING = "pending"
@@ -33,15 +40,27 @@ class BookClaimModule:
     """
     
     def __init__(self, bot: commands.Bot, session: aiohttp.ClientSession, 
-                 wp_api_url: str, wp_bot_token: str):
+                 wp_api_url: str, wp_bot_token: str, user_resolver: Optional[UserResolver] = None):
         self.bot = bot
         self.session = session
         self.wp_api_url = wp_api_url
         self.wp_bot_token = wp_bot_token
         
+        # Cached user / DM channel lookups for notifications
+        self.user_resolver = user_resolver or UserResolver(bot)
+        
         # Initialize command counter for promotional messages
         self.command_counter = 0
         
+        # Short-lived permission cache: (user_id, server_id) -> {flag: (value, cached_at)}
+        # server_id is None for server-independent flags (authorization, bot admin)
+        self.permission_cache: Dict[Tuple[str, Optional[str]], Dict[str, Tuple[bool, float]]] = {}
+        # Server verification cache: server_id -> (verified, cached_at)
+        self.server_verification_cache: Dict[str, Tuple[bool, float]] = {}
+        # Notification channels: server_id -> channel_id (None when not configured)
+        # Kept in sync by set_notification_channel, so no TTL is needed
+        self.notification_channels: Dict[str, Optional[str]] = {}
+        
         logger.info(f"[BOOK_CLAIM_MODULE] Initializing module...")
         logger.info(f"[BOOK_CLAIM_MODULE] bot: {bot}")
         logger.info(f"[BOOK_CLAIM_MODULE] wp_api_url: {wp_api_url}")
@@ -271,7 +290,7 @@ class BookClaimModule:
             }
             
             async with self.session.post(url, json=data, headers=headers) as response:
-                result = await response.json()
+                result = await json_codec.read_json(response)
                 
                 if response.status == 200 and result.get('success'):
                     claim_id = result.get('claim_id')
@@ -429,7 +448,7 @@ class BookClaimModule:
                 }
                 
                 async with self.session.post(url, json=data, headers=headers) as response:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     
                     if response.status == 200 and result.get('success'):
                         results.append({
@@ -500,9 +519,9 @@ class BookClaimModule:
         """Handle claim approval/rejection (admin/mod only)"""
         await interaction.response.defer(ephemeral=True)
         
-        # Check user permissions
-        is_authorized = await self.check_user_authorization(interaction.user)
-        if not is_authorized:
+        # Check user permissions (authorization and bot admin resolved together)
+        permissions = await self.get_user_permissions(interaction.user)
+        if not permissions['authorized']:
             await interaction.followup.send(
                 "❌ You don't have permission to manage book claims.\n"
                 "This command is only available to administrators and moderators.",
@@ -513,7 +532,7 @@ class BookClaimModule:
         try:
             if action == "view":
                 # Check if user is bot admin
-                is_bot_owner = await self.is_bot_admin(interaction.user)
+                is_bot_owner = permissions['is_bot_admin']
                 
                 # Get pending claims
                 url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/pending"
@@ -532,7 +551,7 @@ class BookClaimModule:
                 }
                 
                 async with self.session.get(url, params=params, headers=headers) as response:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     
                     if response.status == 200 and result.get('success'):
                         all_claims = result.get('claims', [])
@@ -665,7 +684,7 @@ class BookClaimModule:
                     }
                     
                     async with self.session.post(url, json=data, headers=headers) as response:
-                        result = await response.json()
+                        result = await json_codec.read_json(response)
                         
                         if response.status == 200 and result.get('success'):
                             status_emoji = "✅" if action == "approve" else "❌"
@@ -813,7 +832,7 @@ class BookClaimModule:
             logger.info(f"[BOOK_CLAIM_MODULE] With discord_user_id: {params['discord_user_id']}")
             
             async with self.session.get(url, params=params, headers=headers) as response:
-                result = await response.json()
+                result = await json_codec.read_json(response)
                 
                 logger.info(f"[BOOK_CLAIM_MODULE] Response status: {response.status}")
                 logger.info(f"[BOOK_CLAIM_MODULE] Response data: {json.dumps(result, indent=2)}")
@@ -991,8 +1010,77 @@ class BookClaimModule:
                 return True
         return False
     
+    # Permission cache helpers
+    
+    def get_cached_permission(self, user_id: str, server_id: Optional[str], flag: str) -> Optional[bool]:
+        """Return a cached permission flag, or None if missing or expired"""
+        entry = self.permission_cache.get((user_id, server_id))
+        if not entry or flag not in entry:
+            return None
+        
+        value, cached_at = entry[flag]
+        if time.monotonic() - cached_at > PERMISSION_CACHE_TTL:
+            del entry[flag]
+            return None
+        return value
+    
+    def set_cached_permission(self, user_id: str, server_id: Optional[str], flag: str, value: bool):
+        """Store a permission flag in the cache"""
+        self.permission_cache.setdefault((user_id, server_id), {})[flag] = (value, time.monotonic())
+    
+    def invalidate_permissions(self, user_id: Optional[str] = None, server_id: Optional[str] = None):
+        """
+        Drop cached permissions after roles change
+        
+        Args:
+            user_id: Drop every entry for this user (all servers)
+            server_id: Drop every entry for this server, plus its verification status
+        
+        With no arguments the whole cache is cleared.
+        """
+        if user_id is None and server_id is None:
+            self.permission_cache.clear()
+            self.server_verification_cache.clear()
+            return
+        
+        for cached_user_id, cached_server_id in list(self.permission_cache):
+            if cached_user_id == user_id or (server_id is not None and cached_server_id == server_id):
+                del self.permission_cache[(cached_user_id, cached_server_id)]
+        
+        if server_id is not None:
+            self.server_verification_cache.pop(server_id, None)
+        
+        logger.info(f"[BOOK_CLAIM_MODULE] Permission cache invalidated (user: {user_id}, server: {server_id})")
+    
+    async def get_user_permissions(self, user: discord.User, server_id: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Resolve all claim permissions for a user in a single lookup
+        
+        Cached flags are served from memory; any missing ones are fetched
+        from WordPress concurrently instead of one request at a time.
+        
+        Returns:
+            Dict with 'authorized', 'is_bot_admin' and 'is_supermod' flags
+        """
+        authorized, is_admin, is_supermod = await asyncio.gather(
+            self.check_user_authorization(user),
+            self.is_bot_admin(user),
+            self.is_server_supermod(user, server_id)
+        )
+        
+        return {
+            'authorized': authorized,
+            'is_bot_admin': is_admin,
+            'is_supermod': is_supermod
+        }
+    
     async def check_user_authorization(self, user: discord.User) -> bool:
         """Check if user has admin/mod permissions"""
+        user_id = str(user.id)
+        cached = self.get_cached_permission(user_id, None, 'authorized')
+        if cached is not None:
+            return cached
+        
         try:
             # Check with WordPress API for user roles
             url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/check-authorization"
@@ -1008,8 +1096,10 @@ class BookClaimModule:
             
             async with self.session.get(url, params=params, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    return result.get('authorized', False)
+                    result = await json_codec.read_json(response)
+                    authorized = result.get('authorized', False)
+                    self.set_cached_permission(user_id, None, 'authorized', authorized)
+                    return authorized
                     
         except Exception as e:
             logger.error(f"[BOOK_CLAIM_MODULE] Error checking authorization: {e}")
@@ -1042,56 +1132,44 @@ class BookClaimModule:
         
         try:
             if action == "check":
-                # Check current settings
-                url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/notification-channel"
-                params = {
-                    'bot_token': self.wp_bot_token,
-                    'server_id': str(interaction.guild.id)
-                }
+                # Check current settings (always ask WordPress so the cache is refreshed)
+                channel_id = await self.get_notification_channel_id(interaction.guild.id, refresh=True)
                 
-                headers = {
-                    'Authorization': f'Bearer {self.wp_bot_token}',
-                    'User-Agent': 'Essence-Discord-Bot/1.0'
-                }
+                embed = discord.Embed(
+                    title="📋 Notification Channel Settings",
+                    color=discord.Color.blue()
+                )
                 
-                async with self.session.get(url, params=params, headers=headers) as response:
-                    result = await response.json()
-                    
-                    embed = discord.Embed(
-                        title="📋 Notification Channel Settings",
-                        color=discord.Color.blue()
-                    )
-                    
-                    if result.get('channel_id'):
-                        channel = interaction.guild.get_channel(int(result['channel_id']))
-                        if channel:
-                            embed.add_field(
-                                name="Current Channel",
-                                value=f"{channel.mention}",
-                                inline=False
-                            )
-                        else:
-                            embed.add_field(
-                                name="Current Channel",
-                                value=f"Channel ID {result['channel_id']} (channel not found)",
-                                inline=False
-                            )
+                if channel_id:
+                    channel = interaction.guild.get_channel(int(channel_id))
+                    if channel:
+                        embed.add_field(
+                            name="Current Channel",
+                            value=f"{channel.mention}",
+                            inline=False
+                        )
                     else:
                         embed.add_field(
                             name="Current Channel",
-                            value="❌ No notification channel set",
+                            value=f"Channel ID {channel_id} (channel not found)",
                             inline=False
                         )
-                    
-                    # Check if server is verified
-                    server_verified = await self.check_server_verification(str(interaction.guild.id))
+                else:
                     embed.add_field(
-                        name="Server Status",
-                        value="✅ Verified" if server_verified else "❌ Not Verified",
-                        inline=True
+                        name="Current Channel",
+                        value="❌ No notification channel set",
+                        inline=False
                     )
-                    
-                    await interaction.followup.send(embed=embed, ephemeral=True)
+                
+                # Check if server is verified
+                server_verified = await self.check_server_verification(str(interaction.guild.id))
+                embed.add_field(
+                    name="Server Status",
+                    value="✅ Verified" if server_verified else "❌ Not Verified",
+                    inline=True
+                )
+                
+                await interaction.followup.send(embed=embed, ephemeral=True)
                     
             elif action == "enable":
                 # Set this channel as notification channel
@@ -1113,9 +1191,12 @@ class BookClaimModule:
                 }
                 
                 async with self.session.post(url, json=data, headers=headers) as response:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     
                     if response.status == 200 and result.get('success'):
+                        # Write-through so claim notifications pick up the new channel
+                        self.notification_channels[str(interaction.guild.id)] = str(interaction.channel.id)
+                        
                         embed = discord.Embed(
                             title="✅ Notification Channel Set",
                             description=f"Book claim notifications will now be sent to {interaction.channel.mention}",
@@ -1177,9 +1258,11 @@ class BookClaimModule:
                 }
                 
                 async with self.session.post(url, json=data, headers=headers) as response:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     
                     if response.status == 200 and result.get('success'):
+                        self.notification_channels[str(interaction.guild.id)] = None
+                        
                         embed = discord.Embed(
                             title="✅ Notifications Disabled",
                             description="Book claim notifications have been disabled for this server.",
@@ -1260,9 +1343,11 @@ class BookClaimModule:
                 }
                 
                 async with self.session.post(url, json=data, headers=headers) as response:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     
                     if response.status == 200 and result.get('success'):
+                        self.invalidate_permissions(server_id=str(interaction.guild.id))
+                        
                         embed = discord.Embed(
                             title="✅ Server Verified",
                             description=f"{interaction.guild.name} is now verified for claim processing.",
@@ -1303,9 +1388,11 @@ class BookClaimModule:
                 }
                 
                 async with self.session.post(url, json=data, headers=headers) as response:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     
                     if response.status == 200 and result.get('success'):
+                        self.invalidate_permissions(server_id=str(interaction.guild.id))
+                        
                         await interaction.followup.send(
                             f"✅ Server {interaction.guild.name} has been unverified.",
                             ephemeral=True
@@ -1328,8 +1415,11 @@ class BookClaimModule:
         await interaction.response.defer(ephemeral=True)
         
         # Check if user is bot administrator or supermod
-        is_admin = await self.is_bot_admin(interaction.user)
-        is_supermod = await self.is_server_supermod(interaction.user, interaction.guild.id if interaction.guild else None)
+        permissions = await self.get_user_permissions(
+            interaction.user, interaction.guild.id if interaction.guild else None
+        )
+        is_admin = permissions['is_bot_admin']
+        is_supermod = permissions['is_supermod']
         
         if not is_admin and not is_supermod:
             await interaction.followup.send(
@@ -1374,9 +1464,12 @@ class BookClaimModule:
             }
             
             async with self.session.post(url, json=data, headers=headers) as response:
-                result = await response.json()
+                result = await json_codec.read_json(response)
                 
                 if response.status == 200 and result.get('success'):
+                    # Roles changed - drop the target user's cached permissions
+                    self.invalidate_permissions(user_id=str(user.id))
+                    
                     if action == "add":
                         role_display = "supermod" if role == "supermod" else "moderator"
                         embed = discord.Embed(
@@ -1497,7 +1590,7 @@ class BookClaimModule:
             }
             
             async with self.session.get(url, params=params, headers=headers) as response:
-                result = await response.json()
+                result = await json_codec.read_json(response)
                 
                 if response.status == 200 and result.get('success'):
                     moderators = result.get('moderators', [])
@@ -1553,7 +1646,7 @@ class BookClaimModule:
     
     def get_promotional_field(self, force_show=False):
         """
-        Get promotional field for embeds based on command counter
+        Get the shared promotional field, rotated by this module's command counter
         
         Args:
             force_show (bool): Force showing a promotional message regardless of counter
@@ -1561,148 +1654,55 @@ class BookClaimModule:
         Returns:
             dict: Field data with name and value, or None if no promo should be shown
         """
-        # Only show promotional messages every 2 commands (or if forced)
-        #if not force_show and self.command_counter % 2 != 0:
-        #    return None
-        
-        # Define all promotional messages
-        promo_messages = [
-            {
-                "text": "📖 You can also read Stepan Chizhov's",
-                "url": "https://www.royalroad.com/fiction/105229/",
-                "link_text": "The Dark Lady's Guide to Villainy!"
-            },
-#            {
-#                "text": "❤️ If you like this and other tools made by Stepan Chizhov:",
-#                "url": "https://www.patreon.com/stepanchizhov",
-#                "link_text": "Support his work on Patreon!"
-#            },
-            {
-                "text": "🔍 Find more analytical tools for Royal Road authors and readers!",
-                "url": "https://stepan.chizhov.com",
-                "link_text": "Visit stepan.chizhov.com"
-            },
-            {
-                "text": "💬 Need help or have suggestions?",
-                "url": "https://discord.gg/xvw9vbvrwj",
-                "link_text": "Join our Support Discord"
-            },
-            {
-                "text": "📚 Join discussions about Royal Road and analytics!",
-                "url": "https://discord.gg/7Xrrf3Q5zp",
-                "link_text": "Immersive Ink Community Discord"
-            },
-            {
-                "text": "📚 Join discussions about Royal Road and analytics!",
-                "url": "https://discord.gg/v6SVD2Gbeh",
-                "link_text": "RR Writer's Guild Community Discord"
-            }
-        ]
-        
-        # Rotate through promotional messages based on how many promos have been shown
-        promo_index = (self.command_counter // 2 - 1) % len(promo_messages)
-        promo = promo_messages[promo_index]
-        
-        # Create the Patreon goal message
-        current_amount = 38  # Update this manually
-        goal_amount = 70
-        percentage = (current_amount / goal_amount) * 100
-        bar_length = 10
-        filled_length = int(bar_length * current_amount / goal_amount)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        
-        patreon_messages = [
-            f"💸 {current_amount}/{goal_amount} followers [{bar}]\n {percentage:.0f}% Help keep these tools alive past autumn!",
-            f"🎯 {current_amount}/{goal_amount} followers [{bar}]\n My hosting bills don't pay themselves, darling",
-            f"⚡ {current_amount}/{goal_amount} followers [{bar}]\n These servers run on money, not magic (sadly)",
-            f"🔥 {current_amount}/{goal_amount} followers [{bar}]\n Winter is coming... and so are the hosting bills",
-            f"☕ {current_amount}/{goal_amount} followers [{bar}]\n Less than a coffee a month keeps the bot alive",
-            f"🚀 {current_amount}/{goal_amount} followers [{bar}]\n Fuel the rocket, or it crashes in the autumn",
-            f"💀 {current_amount}/{goal_amount} followers [{bar}]\n Save the bot from its impending doom this autumn",
-            f"🎮 {current_amount}/{goal_amount} followers [{bar}]\n Insert coin to continue (autumn deadline approaching)",
-            f"🌟 {current_amount}/{goal_amount} followers [{bar}]\n Be a hero, save a bot (and my sanity)",
-            f"⏰ {current_amount}/{goal_amount} followers [{bar}]\n Tick tock, autumn's coming for these servers",
-            f"🏴‍☠️ {current_amount}/{goal_amount} followers [{bar}]\n Even pirates need to pay for hosting",
-            f"🎭 {current_amount}/{goal_amount} followers [{bar}]\n This bot's survival: a autumn tragedy in the making?",
-            f"🍂 {current_amount}/{goal_amount} followers [{bar}]\n When autumn leaves fall, will this bot too?",
-            f"💔 {current_amount}/{goal_amount} followers [{bar}]\n Don't let our beautiful friendship end this autumn",
+        return promotional_utils.get_promotional_field(force_show, counter=self.command_counter)
     
-            # Fantasy themed
-            f"🐉 {current_amount}/{goal_amount} followers [{bar}]\n Dragons hoard gold, I just need server money",
-            f"⚔️ {current_amount}/{goal_amount} followers [{bar}]\n Join the quest to defeat the Hosting Bill Boss",
-            f"🧙 {current_amount}/{goal_amount} followers [{bar}]\n Even wizards can't conjure free servers",
-            f"🏰 {current_amount}/{goal_amount} followers [{bar}]\n Help defend the castle from autumn's server shutdown",
-            f"📜 {current_amount}/{goal_amount} followers [{bar}]\n The prophecy says: 'No coins by the end of autumn = darkness'",
-            f"🦄 {current_amount}/{goal_amount} followers [{bar}]\n Unicorns are rare, but rarer still is free hosting",
-            f"🗡️ {current_amount}/{goal_amount} followers [{bar}]\n Your coin pouch vs. the autumn deadline",
-            f"🧝 {current_amount}/{goal_amount} followers [{bar}]\n Even elves pay their hosting bills (probably)",
-            f"🔮 {current_amount}/{goal_amount} followers [{bar}]\n The crystal ball shows server death this autumn",
-            f"👑 {current_amount}/{goal_amount} followers [{bar}]\n A kingdom for a server! (Or just 70 patrons)",
-            
-            # Sci-fi themed
-            f"🚀 {current_amount}/{goal_amount} followers [{bar}]\n Houston, we have a funding problem",
-            f"👽 {current_amount}/{goal_amount} followers [{bar}]\n Even aliens think 70 patrons can sustainable support our hosting",
-            f"🛸 {current_amount}/{goal_amount} followers [{bar}]\n Warp drive offline. Reason: insufficient credits",
-            f"🤖 {current_amount}/{goal_amount} followers [{bar}]\n CRITICAL ERROR: Funding.exe will terminate in the autumn",
-            f"⚡ {current_amount}/{goal_amount} followers [{bar}]\n Flux capacitor needs 70 patrons to survive past autumn",
-            f"🌌 {current_amount}/{goal_amount} followers [{bar}]\n In space, no one can hear servers die",
-            f"🔬 {current_amount}/{goal_amount} followers [{bar}]\n Scientific fact: Servers need money to exist",
-            f"🛰️ {current_amount}/{goal_amount} followers [{bar}]\n Ground control to Major Patron: please send funds",
-            f"💫 {current_amount}/{goal_amount} followers [{bar}]\n Initiating emergency funding protocol before winter",
-            f"🎛️ {current_amount}/{goal_amount} followers [{bar}]\n System critical: Power cells depleting by winter",
-            
-            # LitRPG themed
-            f"💰 {current_amount}/{goal_amount} followers [{bar}]\n [QUEST] Save the Server - Reward: Eternal gratitude",
-            f"📊 {current_amount}/{goal_amount} followers [{bar}]\n Server HP: {percentage:.0f}% - Critical damage at autumn!",
-            f"⬆️ {current_amount}/{goal_amount} followers [{bar}]\n Level up my hosting budget! EXP to autumn: Limited",
-            f"🎲 {current_amount}/{goal_amount} followers [{bar}]\n Roll for initiative against the Hosting Bill Monster",
-            f"⚡ {current_amount}/{goal_amount} followers [{bar}]\n Mana: {percentage:.0f}% - Full depletion = autumn shutdown",
-            f"🏆 {current_amount}/{goal_amount} followers [{bar}]\n Achievement Locked: 'Survive Past Autumn'",
-            f"💎 {current_amount}/{goal_amount} followers [{bar}]\n [LEGENDARY QUEST] Prevent the Autumn Server Apocalypse",
-            f"🗺️ {current_amount}/{goal_amount} followers [{bar}]\n Main Quest: Gather 70 Patrons Before Autumn's End",
-            f"⚔️ {current_amount}/{goal_amount} followers [{bar}]\n DPS: Donations Per Server-month needed!",
-            f"🛡️ {current_amount}/{goal_amount} followers [{bar}]\n Server Shield: {percentage:.0f}% - Breaks in the autumn",
-            f"📈 {current_amount}/{goal_amount} followers [{bar}]\n Stats: Funding {percentage:.0f}% | Time: Winter approaching",
-            f"🎯 {current_amount}/{goal_amount} followers [{bar}]\n Critical Hit needed on funding boss!",
+    async def get_notification_channel_id(self, server_id: int, refresh: bool = False) -> Optional[str]:
+        """
+        Get the configured notification channel for a server
+        
+        Served from the in-memory map when known; WordPress is only asked on a
+        miss or when refresh is requested. Failed lookups are not cached.
+        """
+        server_id = str(server_id)
+        if not refresh and server_id in self.notification_channels:
+            return self.notification_channels[server_id]
+        
+        try:
+            url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/notification-channel"
+            params = {
+                'bot_token': self.wp_bot_token,
+                'server_id': server_id
+            }
             
-            # Gaming themed
-            f"🎮 {current_amount}/{goal_amount} followers [{bar}]\n Server will ragequit in the autumn without support",
-            f"👾 {current_amount}/{goal_amount} followers [{bar}]\n Final boss: Autumn Hosting Bills - ${goal_amount} to defeat",
-            f"🕹️ {current_amount}/{goal_amount} followers [{bar}]\n Game Over in the autumn? Insert coin to continue",
-            f"🏁 {current_amount}/{goal_amount} followers [{bar}]\n Racing against autumn - currently in last place",
-            f"🎯 {current_amount}/{goal_amount} followers [{bar}]\n 360 no-scope the hosting bills before winter",
-            f"💣 {current_amount}/{goal_amount} followers [{bar}]\n Defuse the autumn shutdown bomb: 70 patrons required",
-            f"🏅 {current_amount}/{goal_amount} followers [{bar}]\n Speedrun: Fund the server before winter%",
-            f"🎪 {current_amount}/{goal_amount} followers [{bar}]\n This isn't pay-to-win, it's pay-to-exist",
-            f"🔥 {current_amount}/{goal_amount} followers [{bar}]\n Combo meter: {percentage:.0f}% - Don't drop it before winter!",
+            headers = {
+                'Authorization': f'Bearer {self.wp_bot_token}',
+                'User-Agent': 'Essence-Discord-Bot/1.0'
+            }
             
-            # Mixed/General sassy
-            f"😅 {current_amount}/{goal_amount} followers [{bar}]\n Nervous laughter intensifies as winter approaches",
-            f"🎭 {current_amount}/{goal_amount} followers [{bar}]\n To be or not to be (online after autumn)",
-            f"📉 {current_amount}/{goal_amount} followers [{bar}]\n Hosting costs rise, patron support... help!",
-            f"🎪 {current_amount}/{goal_amount} followers [{bar}]\n Welcome to the 'Please Fund Me' circus!",
-            f"🌡️ {current_amount}/{goal_amount} followers [{bar}]\n Server health: {percentage:.0f}% - Terminal by winter",
-            f"⏳ {current_amount}/{goal_amount} followers [{bar}]\n The sands of time (and funding) run low",
-            f"🎨 {current_amount}/{goal_amount} followers [{bar}]\n Painting a masterpiece called 'Winter Server Death'",
-            f"🍕 {current_amount}/{goal_amount} followers [{bar}]\n Skip one pizza, save a bot's life this autumn"
-        ]
+            async with self.session.get(url, params=params, headers=headers) as response:
+                if response.status == 200:
+                    result = await json_codec.read_json(response)
+                    channel_id = result.get('channel_id')
+                    channel_id = str(channel_id) if channel_id else None
+                    self.notification_channels[server_id] = channel_id
+                    return channel_id
+                    
+        except Exception as e:
+            logger.error(f"[BOOK_CLAIM_MODULE] Error fetching notification channel for server {server_id}: {e}")
         
-        patreon_text = random.choice(patreon_messages)
+        return None
+    
+    async def preload_notification_channels(self, max_concurrency: int = 5):
+        """Warm the notification channel map for every guild the bot is in"""
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # Combine both messages into the field value
-        combined_value = (
-            f"{promo['text']}\n[**{promo['link_text']}**]({promo['url']})\n\n"
-            f"**━━━━━━━━━━━━━━━━━━━━━**\n"
-            f"We achieved our extended goal (yay!), but currently, only two generous patrons cover more than a half of all contributions. We aren't out of the woods yet! We need to have {goal_amount} patrons to make the tool sustainable by the end of November. Please consider joining even at the lowest tier!\n"
-            f"{patreon_text}\n"
-            f"[**→ Support on Patreon**](https://patreon.com/stepanchizhov/membership)"
-        )
+        async def load(guild: discord.Guild):
+            async with semaphore:
+                await self.get_notification_channel_id(guild.id, refresh=True)
         
-        return {
-            "name": "━━━━━━━━━━━━━━━━━━━━━",
-            "value": combined_value,
-            "inline": False
-        }
+        await asyncio.gather(*(load(guild) for guild in self.bot.guilds))
+        configured = sum(1 for channel_id in self.notification_channels.values() if channel_id)
+        logger.info(f"[BOOK_CLAIM_MODULE] Preloaded notification channels for {len(self.bot.guilds)} guild(s), {configured} configured")
     
     async def send_claim_notification(self, guild: discord.Guild, claim_id: int,
                                      book_title: str, book_id: int, user: Optional[discord.User],
@@ -1716,102 +1716,88 @@ class BookClaimModule:
         
         try:
             # Get configured notification channel
-            url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/notification-channel"
-            params = {
-                'bot_token': self.wp_bot_token,
-                'server_id': str(guild.id)
-            }
+            channel_id = await self.get_notification_channel_id(guild.id)
             
-            headers = {
-                'Authorization': f'Bearer {self.wp_bot_token}',
-                'User-Agent': 'Essence-Discord-Bot/1.0'
-            }
+            if not channel_id:
+                logger.info(f"[BOOK_CLAIM_MODULE] No notification channel configured for server {guild.id}")
+                return
+            
+            channel = guild.get_channel(int(channel_id))
+            if not channel:
+                logger.error(f"[BOOK_CLAIM_MODULE] Channel {channel_id} not found in guild")
+                return
+            
+            # Check if bot has permission to send messages in this channel
+            bot_member = guild.get_member(self.bot.user.id)
+            if not channel.permissions_for(bot_member).send_messages:
+                logger.error(f"[BOOK_CLAIM_MODULE] Bot lacks permission to send messages in channel {channel_id}")
+                return
+            
+            # Create notification embed based on type
+            if notification_type == "submitted":
+                embed = discord.Embed(
+                    title="📖 New Book Claim Submitted",
+                    color=discord.Color.blue()
+                )
+                embed.add_field(name="Claim ID", value=f"`#{claim_id}`", inline=True)
+                embed.add_field(name="Book", value=book_title, inline=True)
+                embed.add_field(name="Book ID", value=f"`{book_id}`", inline=True)
+                
+                if user:
+                    embed.add_field(
+                        name="Claimant",
+                        value=f"{user.mention} ({user.name})",
+                        inline=False
+                    )
+                
+                embed.add_field(
+                    name="Action Required",
+                    value="Moderators: Use `/rr-claim-approve action:View Pending` to review",
+                    inline=False
+                )
+                
+                # Add promotional field
+                promo_field = self.get_promotional_field()
+                if promo_field:
+                    embed.add_field(**promo_field)
+                
+                embed.set_footer(text=f"Submitted at {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}")
+                
+            elif notification_type == "approved":
+                # Fetch user if we only have ID
+                if user_discord_id and not user:
+                    try:
+                        user = await self.user_resolver.get_user(int(user_discord_id))
+                    except:
+                        user = None
+                
+                embed = discord.Embed(
+                    title="✅ Book Claim Approved",
+                    color=discord.Color.green()
+                )
+                embed.add_field(
+                    name="Book", 
+                    value=f"[{book_title}](https://www.royalroad.com/fiction/{book_id})",
+                    inline=True
+                )
+                
+                if user:
+                    embed.add_field(
+                        name="Author",
+                        value=f"This book is now assigned to {user.mention}!",
+                        inline=False
+                    )
+                
+                # Add promotional field (force show for approved claims)
+                promo_field = self.get_promotional_field(force_show=True)
+                if promo_field:
+                    embed.add_field(**promo_field)
+                
+                embed.set_footer(text="Congratulations to the author! 🎉")
+            
+            await channel.send(embed=embed)
+            logger.info(f"[BOOK_CLAIM_MODULE] Sent {notification_type} notification to channel {channel_id}")
             
-            async with self.session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    channel_id = result.get('channel_id')
-                    
-                    if not channel_id:
-                        logger.info(f"[BOOK_CLAIM_MODULE] No notification channel configured for server {guild.id}")
-                        return
-                    
-                    channel = guild.get_channel(int(channel_id))
-                    if not channel:
-                        logger.error(f"[BOOK_CLAIM_MODULE] Channel {channel_id} not found in guild")
-                        return
-                    
-                    # Check if bot has permission to send messages in this channel
-                    bot_member = guild.get_member(self.bot.user.id)
-                    if not channel.permissions_for(bot_member).send_messages:
-                        logger.error(f"[BOOK_CLAIM_MODULE] Bot lacks permission to send messages in channel {channel_id}")
-                        return
-                    
-                    # Create notification embed based on type
-                    if notification_type == "submitted":
-                        embed = discord.Embed(
-                            title="📖 New Book Claim Submitted",
-                            color=discord.Color.blue()
-                        )
-                        embed.add_field(name="Claim ID", value=f"`#{claim_id}`", inline=True)
-                        embed.add_field(name="Book", value=book_title, inline=True)
-                        embed.add_field(name="Book ID", value=f"`{book_id}`", inline=True)
-                        
-                        if user:
-                            embed.add_field(
-                                name="Claimant",
-                                value=f"{user.mention} ({user.name})",
-                                inline=False
-                            )
-                        
-                        embed.add_field(
-                            name="Action Required",
-                            value="Moderators: Use `/rr-claim-approve action:View Pending` to review",
-                            inline=False
-                        )
-                        
-                        # Add promotional field
-                        promo_field = self.get_promotional_field()
-                        if promo_field:
-                            embed.add_field(**promo_field)
-                        
-                        embed.set_footer(text=f"Submitted at {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}")
-                        
-                    elif notification_type == "approved":
-                        # Fetch user if we only have ID
-                        if user_discord_id and not user:
-                            try:
-                                user = await self.bot.fetch_user(int(user_discord_id))
-                            except:
-                                user = None
-                        
-                        embed = discord.Embed(
-                            title="✅ Book Claim Approved",
-                            color=discord.Color.green()
-                        )
-                        embed.add_field(
-                            name="Book", 
-                            value=f"[{book_title}](https://www.royalroad.com/fiction/{book_id})",
-                            inline=True
-                        )
-                        
-                        if user:
-                            embed.add_field(
-                                name="Author",
-                                value=f"This book is now assigned to {user.mention}!",
-                                inline=False
-                            )
-                        
-                        # Add promotional field (force show for approved claims)
-                        promo_field = self.get_promotional_field(force_show=True)
-                        if promo_field:
-                            embed.add_field(**promo_field)
-                        
-                        embed.set_footer(text="Congratulations to the author! 🎉")
-                    
-                    await channel.send(embed=embed)
-                    logger.info(f"[BOOK_CLAIM_MODULE] Sent {notification_type} notification to channel {channel_id}")
-                    
         except Exception as e:
             logger.error(f"[BOOK_CLAIM_MODULE] Failed to send notification: {e}")
     
@@ -1819,6 +1805,11 @@ class BookClaimModule:
         """Check if user is a supermod for the specified server"""
         if not server_id:
             return False
+        
+        user_id = str(user.id)
+        cached = self.get_cached_permission(user_id, str(server_id), 'is_supermod')
+        if cached is not None:
+            return cached
             
         try:
             url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/check-supermod"
@@ -1835,8 +1826,10 @@ class BookClaimModule:
             
             async with self.session.get(url, params=params, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    return result.get('is_supermod', False)
+                    result = await json_codec.read_json(response)
+                    is_supermod = result.get('is_supermod', False)
+                    self.set_cached_permission(user_id, str(server_id), 'is_supermod', is_supermod)
+                    return is_supermod
                     
         except Exception as e:
             logger.error(f"[BOOK_CLAIM_MODULE] Error checking supermod status: {e}")
@@ -1845,6 +1838,11 @@ class BookClaimModule:
     
     async def is_bot_admin(self, user: discord.User) -> bool:
         """Check if user is a bot administrator"""
+        user_id = str(user.id)
+        cached = self.get_cached_permission(user_id, None, 'is_bot_admin')
+        if cached is not None:
+            return cached
+        
         try:
             url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/check-bot-admin"
             params = {
@@ -1859,8 +1857,10 @@ class BookClaimModule:
             
             async with self.session.get(url, params=params, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    return result.get('is_admin', False)
+                    result = await json_codec.read_json(response)
+                    is_admin = result.get('is_admin', False)
+                    self.set_cached_permission(user_id, None, 'is_bot_admin', is_admin)
+                    return is_admin
                     
         except Exception as e:
             logger.error(f"[BOOK_CLAIM_MODULE] Error checking bot admin status: {e}")
@@ -1872,6 +1872,11 @@ class BookClaimModule:
         """Check if server is verified for claim processing"""
         if not server_id:
             return False
+        
+        server_id = str(server_id)
+        cached = self.server_verification_cache.get(server_id)
+        if cached and time.monotonic() - cached[1] <= PERMISSION_CACHE_TTL:
+            return cached[0]
             
         try:
             url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/check-server"
@@ -1887,8 +1892,10 @@ class BookClaimModule:
             
             async with self.session.get(url, params=params, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    return result.get('verified', False)
+                    result = await json_codec.read_json(response)
+                    verified = result.get('verified', False)
+                    self.server_verification_cache[server_id] = (verified, time.monotonic())
+                    return verified
                     
         except Exception as e:
             logger.error(f"[BOOK_CLAIM_MODULE] Error checking server verification: {e}")
@@ -1902,51 +1909,37 @@ class BookClaimModule:
             return
             
         try:
-            # Get configured notification channel from WordPress
-            url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-claim/notification-channel"
-            params = {
-                'bot_token': self.wp_bot_token,
-                'server_id': str(guild.id)
-            }
-            
-            headers = {
-                'Authorization': f'Bearer {self.wp_bot_token}',
-                'User-Agent': 'Essence-Discord-Bot/1.0'
-            }
+            # Get configured notification channel
+            channel_id = await self.get_notification_channel_id(guild.id)
             
-            async with self.session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    channel_id = result.get('channel_id')
+            if channel_id:
+                channel = guild.get_channel(int(channel_id))
+                if channel:
+                    embed = discord.Embed(
+                        title="📋 New Book Claim Request",
+                        description=f"A new claim has been submitted for review.",
+                        color=discord.Color.blue()
+                    )
+                    embed.add_field(name="Claim ID", value=f"`#{claim_id}`", inline=True)
+                    embed.add_field(name="Book", value=book_title, inline=True)
+                    embed.add_field(name="Claimant", value=f"{user.mention} ({user.name})", inline=False)
+                    embed.add_field(
+                        name="Action Required",
+                        value="Use `/rr-claim-approve action:View Pending` to review",
+                        inline=False
+                    )
+                    embed.set_footer(text=f"Submitted at {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}")
+                    
+                    await channel.send(embed=embed)
+                    logger.info(f"[BOOK_CLAIM_MODULE] Notified admins in channel {channel_id}")
                     
-                    if channel_id:
-                        channel = guild.get_channel(int(channel_id))
-                        if channel:
-                            embed = discord.Embed(
-                                title="📋 New Book Claim Request",
-                                description=f"A new claim has been submitted for review.",
-                                color=discord.Color.blue()
-                            )
-                            embed.add_field(name="Claim ID", value=f"`#{claim_id}`", inline=True)
-                            embed.add_field(name="Book", value=book_title, inline=True)
-                            embed.add_field(name="Claimant", value=f"{user.mention} ({user.name})", inline=False)
-                            embed.add_field(
-                                name="Action Required",
-                                value="Use `/rr-claim-approve action:View Pending` to review",
-                                inline=False
-                            )
-                            embed.set_footer(text=f"Submitted at {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}")
-                            
-                            await channel.send(embed=embed)
-                            logger.info(f"[BOOK_CLAIM_MODULE] Notified admins in channel {channel_id}")
-                            
         except Exception as e:
             logger.error(f"[BOOK_CLAIM_MODULE] Failed to notify admins: {e}")
     
     async def notify_claimant(self, discord_id: str, claim_id: int, action: str, book_title: str):
         """Send DM to claimant about their claim status"""
         try:
-            user = await self.bot.fetch_user(int(discord_id))
+            user = await self.user_resolver.get_user(int(discord_id))
             if user:
                 status_emoji = "✅" if action == "approve" else "❌"
                 status_text = "approved" if action == "approve" else "declined"
@@ -1970,7 +1963,7 @@ class BookClaimModule:
                         inline=False
                     )
                 
-                await user.send(embed=embed)
+                await self.user_resolver.send(user.id, embed=embed)
                 logger.info(f"[BOOK_CLAIM_MODULE] Notified {user.name} about claim #{claim_id} {status_text}")
                 
         except Exception as e:
@@ -0,0 +1,331 @@
+"""
+Book snapshot series cache for Discord Essence Bot
+Keeps per-book snapshot history in columnar NumPy arrays so chart and
+Rising Stars commands can slice it locally instead of re-downloading it
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Union
+
+import numpy as np
+
+from shared_utils import extract_book_id_from_url
+from metrics import record_cache
+import json_codec
+from http_cache import http_cache
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Series columns returned by the book-chart-data endpoint and their dtypes;
+# they're stored as float64 so snapshots missing a value can hold NaN
+SERIES_COLUMNS = {
+    'followers': np.int64,
+    'total_views': np.int64,
+    'average_views': np.int64,
+    'chapters': np.int64,
+    'overall_score': np.float64,
+    'ratings': np.int64
+}
+
+# Maximum number of books kept in memory
+SERIES_CACHE_SIZE = 256
+# How long a cached series is used before asking for newer snapshots (seconds)
+SERIES_DELTA_INTERVAL = 10 * 60
+
+
+def to_datetime64(values: List[Any]) -> np.ndarray:
+    """Convert API timestamps (Unix seconds or 'YYYY-MM-DD HH:MM:SS') to datetime64[s]"""
+    if values and isinstance(values[0], (int, float)):
+        return np.asarray(values, dtype=np.int64).astype('datetime64[s]')
+    return np.asarray([str(value).replace(' ', 'T') for value in values], dtype='datetime64[s]')
+
+
+def dates_from_labels(labels: List[Any]) -> np.ndarray:
+    """
+    Dates for responses without timestamps, parsed from their labels
+
+    Accepts the same 'Jan 15' and 'YYYY-MM-DD' labels as the chart module's
+    parse_dates_from_labels; a label that can't be parsed is placed one day
+    after the previous one.
+    """
+    dates = []
+    for i, label in enumerate(labels):
+        try:
+            if len(str(label).split()) == 2:
+                dates.append(datetime.strptime(f"{label} {datetime.now().year}", '%b %d %Y'))
+            else:
+                dates.append(datetime.strptime(str(label)[:10], '%Y-%m-%d'))
+        except ValueError:
+            if dates:
+                dates.append(dates[-1] + timedelta(days=1))
+            else:
+                dates.append(datetime.now() - timedelta(days=len(labels) - i))
+    return np.asarray(dates, dtype='datetime64[s]')
+
+
+class BookSeries:
+    """Snapshot history of one book stored column by column"""
+
+    def __init__(self, book_info: Dict[str, Any]):
+        self.book_info = book_info
+        self.timestamps = np.empty(0, dtype='datetime64[s]')
+        self.labels = np.empty(0, dtype=object)
+        self.columns = {name: np.empty(0, dtype=np.float64) for name in SERIES_COLUMNS}
+        # Columns the backend has sent; the others are all NaN
+        self.provided = set()
+        self.fetched_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Unix timestamp of the newest cached snapshot"""
+        if not len(self):
+            return None
+        return int(self.timestamps[-1].astype(np.int64))
+
+    def column_list(self, name: str, index: np.ndarray) -> List[Any]:
+        """Values of a column as API-style Python numbers, None where unknown"""
+        values = self.columns[name][index]
+        known = ~np.isnan(values)
+        filled = np.where(known, values, 0).astype(SERIES_COLUMNS[name]).tolist()
+        return [value if ok else None for value, ok in zip(filled, known.tolist())]
+
+    def append(self, chart_data: Dict[str, List]) -> int:
+        """
+        Append snapshots newer than the last cached one
+
+        Returns:
+            Number of snapshots added
+        """
+        raw_timestamps = chart_data.get('timestamps') or []
+        if raw_timestamps:
+            timestamps = to_datetime64(raw_timestamps)
+        elif chart_data.get('labels'):
+            # Older backends only send labels
+            timestamps = dates_from_labels(chart_data['labels'])
+        else:
+            return 0
+
+        new = timestamps > self.timestamps[-1] if len(self) else np.ones(len(timestamps), dtype=bool)
+        if not new.any():
+            return 0
+
+        labels = chart_data.get('labels') or [str(ts)[:10] for ts in timestamps]
+        self.timestamps = np.concatenate([self.timestamps, timestamps[new]])
+        self.labels = np.concatenate([self.labels, np.asarray(labels, dtype=object)[new]])
+
+        for name in SERIES_COLUMNS:
+            values = chart_data.get(name)
+            if values is None or len(values) != len(timestamps):
+                values = np.full(len(timestamps), np.nan)
+            else:
+                values = np.asarray([np.nan if value is None else value for value in values], dtype=np.float64)
+                self.provided.add(name)
+            self.columns[name] = np.concatenate([self.columns[name], values[new]])
+
+        return int(new.sum())
+
+    def select(self, days_param: Union[str, int, Dict[str, str]]) -> np.ndarray:
+        """Boolean mask of snapshots matching a parse_days_parameter result"""
+        mask = np.ones(len(self), dtype=bool)
+
+        if isinstance(days_param, int):
+            # Timestamps are UTC
+            start = np.datetime64('now', 's') - np.timedelta64(days_param, 'D')
+            mask &= self.timestamps >= start
+        elif isinstance(days_param, dict):
+            mask &= self.timestamps >= np.datetime64(days_param['start_date'], 's')
+            if days_param.get('type') == 'date_range':
+                end = np.datetime64(days_param['end_date'], 's') + np.timedelta64(1, 'D')
+                mask &= self.timestamps < end
+
+        return mask
+
+    def to_chart_response(self, days_param: Union[str, int, Dict[str, str]]) -> Dict[str, Any]:
+        """Build a book-chart-data style response for the requested period"""
+        mask = self.select(days_param)
+
+        chart_data = {
+            'labels': self.labels[mask].tolist(),
+            'timestamps': self.timestamps[mask].astype(np.int64).tolist()
+        }
+        for name in SERIES_COLUMNS:
+            if name in self.provided:
+                chart_data[name] = self.column_list(name, mask)
+
+        return {
+            'success': True,
+            'book_info': self.book_info,
+            'chart_data': chart_data,
+            'data_info': {
+                'total_snapshots': int(mask.sum()),
+                'filter_applied': describe_days_parameter(days_param)
+            }
+        }
+
+    def daily_window(self, start_date: str, end_date: str) -> Dict[str, List]:
+        """
+        Last snapshot of each day between two dates (inclusive) that has
+        both followers and total views
+
+        Returns:
+            Dict with 'dates', 'followers' and 'total_views' lists
+        """
+        days = self.timestamps.astype('datetime64[D]')
+        mask = (days >= np.datetime64(start_date)) & (days <= np.datetime64(end_date))
+        mask &= ~np.isnan(self.columns['followers']) & ~np.isnan(self.columns['total_views'])
+        indices = np.flatnonzero(mask)
+        if not indices.size:
+            return {'dates': [], 'followers': [], 'total_views': []}
+
+        # Keep the last index of every day run
+        selected_days = days[indices]
+        last_of_day = indices[np.append(selected_days[1:] != selected_days[:-1], True)]
+
+        return {
+            'dates': [str(day) for day in days[last_of_day]],
+            'followers': self.column_list('followers', last_of_day),
+            'total_views': self.column_list('total_views', last_of_day)
+        }
+
+
+def describe_days_parameter(days_param: Union[str, int, Dict[str, str]]) -> str:
+    """Human readable description of a parse_days_parameter result"""
+    if isinstance(days_param, int):
+        return f"Last {days_param} days"
+    if isinstance(days_param, dict):
+        if days_param.get('type') == 'date_range':
+            return f"{days_param['start_date']} to {days_param['end_date']}"
+        return f"From {days_param['start_date']}"
+    return "All time"
+
+
+class BookSeriesCache:
+    """
+    LRU cache of BookSeries shared by the chart and Rising Stars commands
+
+    The first request for a book downloads its full history; later requests
+    only ask book-chart-data for snapshots newer than the last cached one
+    (the 'since' parameter), and at most once per SERIES_DELTA_INTERVAL.
+    """
+
+    def __init__(self, session, wp_api_url: str, wp_bot_token: str, max_size: int = SERIES_CACHE_SIZE):
+        self.session = session
+        self.wp_api_url = wp_api_url
+        self.wp_bot_token = wp_bot_token
+        self.max_size = max_size
+        self.series: "OrderedDict[str, BookSeries]" = OrderedDict()
+        # Non-ID inputs (e.g. titles) that resolved to a book ID before
+        self.aliases: Dict[str, str] = {}
+
+    def resolve_book_id(self, book_input: str) -> Optional[str]:
+        """Get the book ID for an input without calling the API"""
+        book_input = str(book_input).strip()
+        book_id = extract_book_id_from_url(book_input)
+        if book_id is not None:
+            return str(book_id)
+        return self.aliases.get(book_input.lower())
+
+    def get_cached(self, book_input: str) -> Optional[BookSeries]:
+        """Get a cached series without refreshing it"""
+        book_id = self.resolve_book_id(book_input)
+        series = self.series.get(book_id) if book_id else None
+        if series is not None:
+            self.series.move_to_end(book_id)
+        return series
+
+    async def get_series(self, book_input: str) -> Optional[BookSeries]:
+        """
+        Get a book's series, fetching only what's missing
+
+        Returns:
+            The up-to-date series, or None if the book could not be loaded
+        """
+        series, _ = await self.update(book_input)
+        return series
+
+    async def update(self, book_input: str):
+        """
+        Refresh a book's series if needed
+
+        Returns:
+            Tuple of (series or None, API response explaining a failure or None)
+        """
+        series = self.get_cached(book_input)
+
+        if series is not None and time.monotonic() - series.fetched_at < SERIES_DELTA_INTERVAL:
+            record_cache('book_series', 'hit')
+            return series, None
+        record_cache('book_series', 'miss' if series is None else 'stale')
+
+        result = await self.fetch(book_input, since=series.last_timestamp if series else None)
+        if not result or not result.get('success'):
+            # Serve what we have if only the delta failed
+            return series, result
+
+        book_info = result.get('book_info', {})
+        book_id = str(book_info.get('id') or self.resolve_book_id(book_input) or '')
+        if not book_id:
+            return None, result
+
+        if series is None:
+            series = BookSeries(book_info)
+            self.series[book_id] = series
+            if len(self.series) > self.max_size:
+                self.series.popitem(last=False)
+        elif book_info:
+            series.book_info = book_info
+
+        added = series.append(result.get('chart_data', {}))
+        series.fetched_at = time.monotonic()
+        self.series.move_to_end(book_id)
+
+        if extract_book_id_from_url(str(book_input).strip()) is None:
+            self.aliases[str(book_input).strip().lower()] = book_id
+
+        logger.info(f"[SERIES_CACHE] Book {book_id}: {added} new snapshot(s), {len(series)} cached")
+        return series, None
+
+    async def fetch(self, book_input: str, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Download all snapshots of a book, or only those after 'since'"""
+        data = {
+            'book_input': str(book_input),
+            'bot_token': self.wp_bot_token,
+            'all_data': True
+        }
+        if since is not None:
+            data['since'] = since
+
+        headers = {
+            'User-Agent': 'RR-Analytics-Discord-Bot/1.0',
+            'Content-Type': 'application/json'
+        }
+
+        try:
+            # A delta request for a book with no new snapshots revalidates to a 304
+            status, body = await http_cache.request(
+                self.session, 'POST',
+                f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-chart-data",
+                json=data,
+                headers=headers
+            )
+            if status != 200:
+                logger.info(f"[SERIES_CACHE] Failed to fetch series: {status} - {body[:500]!r}")
+                return None
+            return json_codec.parse_body(body)
+        except Exception as e:
+            logger.info(f"[SERIES_CACHE] Exception fetching series: {e}")
+            return None
+
+    async def get_chart_data(self, book_input: str, days_param: Union[str, int, Dict[str, str]]) -> Optional[Dict[str, Any]]:
+        """Drop-in replacement for a filtered book-chart-data request"""
+        series, error = await self.update(book_input)
+        if series is None:
+            return error
+        return series.to_chart_response(days_param)
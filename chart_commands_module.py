@@ -7,18 +7,64 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
 import io
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from book_series_cache import BookSeriesCache
+from rising_stars_prediction import RisingStarsPrediction, FORECAST_HISTORY_DAYS
+from metrics import chart_render_duration, chart_render_queue_depth
+from tracing import tracer
+import json_codec
 
 # Set up logging
 logger = logging.getLogger('discord')
 
+# pyplot is not thread-safe, so every chart is rendered on this single worker
+CHART_RENDER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-render')
+# Send stats first and attach the chart when it's ready (set to 0 to send both at once)
+PROGRESSIVE_CHART_RESPONSES = os.getenv('PROGRESSIVE_CHART_RESPONSES', '1') != '0'
+# Field shown on the stats message until the chart is attached
+CHART_PLACEHOLDER_NAME = "⏳ Rendering chart..."
+
+
+def timed_render(create_func, *args):
+    """Call a chart image function and record how long it took (runs on the render worker)"""
+    started = time.perf_counter()
+    try:
+        return create_func(*args)
+    finally:
+        chart_render_duration.observe(time.perf_counter() - started, create_func.__name__)
+
+
+async def run_render(create_func, *args):
+    """Run a chart image function on the render worker without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    chart_render_queue_depth.inc()
+    try:
+        with tracer.span('chart.render', **{'chart.function': create_func.__name__}):
+            return await loop.run_in_executor(CHART_RENDER_POOL, functools.partial(timed_render, create_func, *args))
+    finally:
+        chart_render_queue_depth.dec()
+
+
 class ChartCommandsModule:
-    def __init__(self, bot, session, wp_api_url, wp_bot_token, get_promotional_field_func=None, add_promotional_field_func=None):
+    def __init__(self, bot, session, wp_api_url, wp_bot_token, get_promotional_field_func=None, add_promotional_field_func=None,
+                 series_cache=None):
         self.bot = bot
         self.session = session
         self.wp_api_url = wp_api_url
         self.wp_bot_token = wp_bot_token
         self.command_counter = 0
         
+        # Snapshot series shared with the RS commands; date filters are applied locally
+        self.series_cache = series_cache or BookSeriesCache(session, wp_api_url, wp_bot_token)
+        
+        # Quick RS eligibility per book ID as (last snapshot timestamp, result)
+        self.eligibility_cache = {}
+        
         # Store the promotional field functions
         self.get_promotional_field = get_promotional_field_func or (lambda f=False: None)
         self.add_promotional_field = add_promotional_field_func or (lambda e, f=False: e)
@@ -67,15 +113,19 @@ class ChartCommandsModule:
         """Generate and send a followers over time chart with optional RS prediction"""
         self.command_counter += 1
         
-        logger.info(f"\n[RR-FOLLOWERS] Command called by {interaction.user}")
-        logger.info(f"[RR-FOLLOWERS] Book input: '{book_input}', Days: '{days}', RS Prediction: {rs_prediction}")
+        logger.info("\n[RR-FOLLOWERS] Command called by %s", interaction.user)
+        logger.info("[RR-FOLLOWERS] Book input: '%s', Days: '%s', RS Prediction: %s", book_input, days, rs_prediction)
         
         await interaction.response.defer()
         
+        # Set once the stats message is up and the chart is rendering
+        message = None
+        chart_task = None
+        
         try:
             # Parse days parameter
             days_param = self.parse_days_parameter(days)
-            logger.info(f"[RR-FOLLOWERS] Parsed days parameter: {days_param}")
+            logger.info("[RR-FOLLOWERS] Parsed days parameter: %s", days_param)
             
             # Fetch chart data
             chart_response = await self.get_book_chart_data(book_input.strip(), days_param)
@@ -98,50 +148,18 @@ class ChartCommandsModule:
             book_id = book_info.get('id', 'Unknown')
             book_url = book_info.get('url', f'https://www.royalroad.com/fiction/{book_id}')
             
-            logger.info(f"[RR-FOLLOWERS] API returned {data_info.get('total_snapshots', 'unknown')} snapshots")
-            logger.info(f"[RR-FOLLOWERS] Filter applied: {data_info.get('filter_applied', 'unknown')}")
+            logger.info("[RR-FOLLOWERS] API returned %s snapshots", data_info.get('total_snapshots', 'unknown'))
+            logger.info("[RR-FOLLOWERS] Filter applied: %s", data_info.get('filter_applied', 'unknown'))
             
             # Use data exactly as returned from API
             filtered_data = chart_data
             
-            # Check for Rising Stars potential
-            rs_eligible = False
-            rs_data = None
-            
-            if rs_prediction:
-                # Full RS prediction requested
-                discord_username = f"{interaction.user.name}#{interaction.user.discriminator}"
-                logger.info(f"[RR-FOLLOWERS] Fetching RS prediction for user: {discord_username}")
-                rs_data = await self.get_rs_prediction_data(book_input.strip(), discord_username)
-                if rs_data:
-                    logger.info(f"[RR-FOLLOWERS] RS prediction data received, eligible: {rs_data.get('eligible')}")
-            else:
-                # Quick eligibility check
-                logger.info(f"[RR-FOLLOWERS] Checking RS eligibility for quick hint")
-                rs_check = await self.check_rs_eligibility(book_input.strip())
-                if rs_check and rs_check.get('eligible'):
-                    rs_eligible = True
-                    logger.info(f"[RR-FOLLOWERS] Book is RS eligible, will show hint")
-            
-            # Create chart image
-            chart_buffer = self.create_chart_image(filtered_data, 'followers', book_title, days_param)
-            
-            if not chart_buffer:
-                await interaction.followup.send(
-                    "❌ Failed to generate chart image. Please try again later.",
-                    ephemeral=True
-                )
-                return
-            
-            # Create Discord file and embed
-            file = discord.File(chart_buffer, filename=f"followers_chart_{book_id}.png")
-            
+            # Create embed
             embed = discord.Embed(
                 title="📈 Followers Over Time",
                 description=f"**[{book_title}]({book_url})**\nBook ID: {book_id}",
                 color=0x4BC0C0
             )
-            embed.set_image(url=f"attachment://followers_chart_{book_id}.png")
             
             # Add stats if available
             if filtered_data.get('followers'):
@@ -158,12 +176,39 @@ class ChartCommandsModule:
             period_text = data_info.get('filter_applied', 'Unknown period')
             embed.add_field(name="Period", value=period_text, inline=True)
             
+            # Show the numbers right away; the chart is attached once rendered
+            message = await self.send_chart_stats(interaction, embed)
+            chart_task = asyncio.create_task(self.render_chart(
+                self.create_chart_image, filtered_data, 'followers', book_title, days_param
+            ))
+            
+            # Rising Stars lookups run while the chart renders
+            rs_eligible = False
+            rs_data = None
+            
+            if rs_prediction:
+                # Full RS prediction requested
+                discord_username = f"{interaction.user.name}#{interaction.user.discriminator}"
+                logger.info("[RR-FOLLOWERS] Fetching RS prediction for user: %s", discord_username)
+                rs_data = await self.get_rs_prediction_data(book_input.strip(), discord_username)
+                if rs_data:
+                    logger.info("[RR-FOLLOWERS] RS prediction data received, eligible: %s", rs_data.get('eligible'))
+                    if rs_data.get('eligible') and rs_data.get('is_premium'):
+                        rs_data['forecast'] = self.get_rs_forecast(book_input.strip())
+            else:
+                # Quick eligibility check
+                logger.info("[RR-FOLLOWERS] Checking RS eligibility for quick hint")
+                rs_check = await self.check_rs_eligibility(book_input.strip())
+                if rs_check and rs_check.get('eligible'):
+                    rs_eligible = True
+                    logger.info("[RR-FOLLOWERS] Book is RS eligible, will show hint")
+            
             # Add RS prediction or hint if applicable
             if rs_prediction and rs_data and rs_data.get('eligible'):
-                logger.info(f"[RR-FOLLOWERS] Adding RS prediction to embed")
+                logger.info("[RR-FOLLOWERS] Adding RS prediction to embed")
                 embed = self.add_rs_prediction_to_embed(embed, rs_data, interaction.user)
             elif rs_eligible and not rs_prediction:
-                logger.info(f"[RR-FOLLOWERS] Adding RS hint to embed")
+                logger.info("[RR-FOLLOWERS] Adding RS hint to embed")
                 embed.add_field(
                     name="🌟 Rising Stars Potential Detected!",
                     value=(
@@ -190,19 +235,20 @@ class ChartCommandsModule:
             # Set footer
             embed.set_footer(text="Data from Stepan Chizhov's Royal Road Analytics\n(starting with the 12th of June 2025)\nTo use the bot, start typing /rr-views or /rr-followers")
             
-            await interaction.followup.send(embed=embed, file=file)
-            logger.info(f"[RR-FOLLOWERS] Successfully sent chart for book {book_id}")
+            await self.attach_chart(interaction, message, embed, await chart_task, f"followers_chart_{book_id}.png")
+            logger.info("[RR-FOLLOWERS] Successfully sent chart for book %s", book_id)
             
         except Exception as e:
-            logger.info(f"[RR-FOLLOWERS] Error: {e}")
+            logger.info("[RR-FOLLOWERS] Error: %s", e)
             import traceback
             traceback.print_exc()
             
             try:
-                await interaction.followup.send(
-                    "❌ An error occurred while generating the followers chart.",
-                    ephemeral=True
-                )
+                if not await self.abandon_chart(message, chart_task):
+                    await interaction.followup.send(
+                        "❌ An error occurred while generating the followers chart.",
+                        ephemeral=True
+                    )
             except:
                 pass
     
@@ -210,15 +256,19 @@ class ChartCommandsModule:
         """Generate and send a views over time chart"""
         self.command_counter += 1
         
-        logger.info(f"\n[RR-VIEWS] Command called by {interaction.user}")
-        logger.info(f"[RR-VIEWS] Book input: '{book_input}', Days: '{days}'")
+        logger.info("\n[RR-VIEWS] Command called by %s", interaction.user)
+        logger.info("[RR-VIEWS] Book input: '%s', Days: '%s'", book_input, days)
         
         await interaction.response.defer()
         
+        # Set once the stats message is up and the chart is rendering
+        message = None
+        chart_task = None
+        
         try:
             # Parse days parameter
             days_param = self.parse_days_parameter(days)
-            logger.info(f"[RR-VIEWS] Parsed days parameter: {days_param}")
+            logger.info("[RR-VIEWS] Parsed days parameter: %s", days_param)
             
             # Fetch chart data
             chart_response = await self.get_book_chart_data(book_input.strip(), days_param)
@@ -241,31 +291,18 @@ class ChartCommandsModule:
             book_id = book_info.get('id', 'Unknown')
             book_url = book_info.get('url', f'https://www.royalroad.com/fiction/{book_id}')
             
-            logger.info(f"[RR-VIEWS] API returned {data_info.get('total_snapshots', 'unknown')} snapshots")
-            logger.info(f"[RR-VIEWS] Filter applied: {data_info.get('filter_applied', 'unknown')}")
+            logger.info("[RR-VIEWS] API returned %s snapshots", data_info.get('total_snapshots', 'unknown'))
+            logger.info("[RR-VIEWS] Filter applied: %s", data_info.get('filter_applied', 'unknown'))
             
             # Use data exactly as returned from API
             filtered_data = chart_data
             
-            # Create chart image
-            chart_buffer = self.create_chart_image(filtered_data, 'views', book_title, days_param)
-            
-            if not chart_buffer:
-                await interaction.followup.send(
-                    "❌ Failed to generate chart image. Please try again later.",
-                    ephemeral=True
-                )
-                return
-            
-            # Create Discord file and embed
-            file = discord.File(chart_buffer, filename=f"views_chart_{book_id}.png")
-            
+            # Create embed
             embed = discord.Embed(
                 title="📊 Views Over Time",
                 description=f"**[{book_title}]({book_url})**\nBook ID: {book_id}",
                 color=0xFF6384
             )
-            embed.set_image(url=f"attachment://views_chart_{book_id}.png")
             
             # Add stats if available
             if filtered_data.get('total_views'):
@@ -282,6 +319,12 @@ class ChartCommandsModule:
             period_text = data_info.get('filter_applied', 'Unknown period')
             embed.add_field(name="Period", value=period_text, inline=True)
             
+            # Show the numbers right away; the chart is attached once rendered
+            message = await self.send_chart_stats(interaction, embed)
+            chart_task = asyncio.create_task(self.render_chart(
+                self.create_chart_image, filtered_data, 'views', book_title, days_param
+            ))
+            
             # Add data note about chart features
             embed.add_field(
                 name="📊 Chart Features",
@@ -293,19 +336,20 @@ class ChartCommandsModule:
             
             embed.set_footer(text="Data from Stepan Chizhov's Royal Road Analytics\n(starting with the 12th of June 2025)\nTo use the bot, start typing /rr-views or /rr-followers")
             
-            await interaction.followup.send(embed=embed, file=file)
-            logger.info(f"[RR-VIEWS] Successfully sent chart for book {book_id}")
+            await self.attach_chart(interaction, message, embed, await chart_task, f"views_chart_{book_id}.png")
+            logger.info("[RR-VIEWS] Successfully sent chart for book %s", book_id)
             
         except Exception as e:
-            logger.info(f"[RR-VIEWS] Error: {e}")
+            logger.info("[RR-VIEWS] Error: %s", e)
             import traceback
             traceback.print_exc()
             
             try:
-                await interaction.followup.send(
-                    "❌ An error occurred while generating the views chart.",
-                    ephemeral=True
-                )
+                if not await self.abandon_chart(message, chart_task):
+                    await interaction.followup.send(
+                        "❌ An error occurred while generating the views chart.",
+                        ephemeral=True
+                    )
             except:
                 pass
     
@@ -313,15 +357,19 @@ class ChartCommandsModule:
         """Generate and send an average views over time chart with chapters for reference"""
         self.command_counter += 1
         
-        logger.info(f"\n[RR-AVERAGE-VIEWS] Command called by {interaction.user}")
-        logger.info(f"[RR-AVERAGE-VIEWS] Book input: '{book_input}', Days: '{days}'")
+        logger.info("\n[RR-AVERAGE-VIEWS] Command called by %s", interaction.user)
+        logger.info("[RR-AVERAGE-VIEWS] Book input: '%s', Days: '%s'", book_input, days)
         
         await interaction.response.defer()
         
+        # Set once the stats message is up and the chart is rendering
+        message = None
+        chart_task = None
+        
         try:
             # Parse days parameter
             days_param = self.parse_days_parameter(days)
-            logger.info(f"[RR-AVERAGE-VIEWS] Parsed days parameter: {days_param}")
+            logger.info("[RR-AVERAGE-VIEWS] Parsed days parameter: %s", days_param)
             
             # Fetch chart data
             chart_response = await self.get_book_chart_data(book_input.strip(), days_param)
@@ -344,31 +392,18 @@ class ChartCommandsModule:
             book_id = book_info.get('id', 'Unknown')
             book_url = book_info.get('url', f'https://www.royalroad.com/fiction/{book_id}')
             
-            logger.info(f"[RR-AVERAGE-VIEWS] API returned {data_info.get('total_snapshots', 'unknown')} snapshots")
-            logger.info(f"[RR-AVERAGE-VIEWS] Filter applied: {data_info.get('filter_applied', 'unknown')}")
+            logger.info("[RR-AVERAGE-VIEWS] API returned %s snapshots", data_info.get('total_snapshots', 'unknown'))
+            logger.info("[RR-AVERAGE-VIEWS] Filter applied: %s", data_info.get('filter_applied', 'unknown'))
             
             # Use data exactly as returned from API
             filtered_data = chart_data
             
-            # Create chart image with average views and chapters
-            chart_buffer = self.create_average_views_chart_image(filtered_data, book_title, days_param)
-            
-            if not chart_buffer:
-                await interaction.followup.send(
-                    "❌ Failed to generate chart image. Please try again later.",
-                    ephemeral=True
-                )
-                return
-            
-            # Create Discord file and embed
-            file = discord.File(chart_buffer, filename=f"average_views_chart_{book_id}.png")
-            
+            # Create embed
             embed = discord.Embed(
                 title="📊 Average Views & Chapters Over Time",
                 description=f"**[{book_title}]({book_url})**\nBook ID: {book_id}",
                 color=0x9B59B6  # Purple color for average views
             )
-            embed.set_image(url=f"attachment://average_views_chart_{book_id}.png")
             
             # Add stats if available
             if filtered_data.get('average_views'):
@@ -390,6 +425,12 @@ class ChartCommandsModule:
             period_text = data_info.get('filter_applied', 'Unknown period')
             embed.add_field(name="Period", value=period_text, inline=True)
             
+            # Show the numbers right away; the chart is attached once rendered
+            message = await self.send_chart_stats(interaction, embed)
+            chart_task = asyncio.create_task(self.render_chart(
+                self.create_average_views_chart_image, filtered_data, book_title, days_param
+            ))
+            
             # Add data note about chart features
             embed.add_field(
                 name="📊 Chart Features",
@@ -401,19 +442,20 @@ class ChartCommandsModule:
             
             embed.set_footer(text="Data from Stepan Chizhov's Royal Road Analytics\n(starting with the 12th of June 2025)\nTo use the bot, start typing /rr-average-views")
             
-            await interaction.followup.send(embed=embed, file=file)
-            logger.info(f"[RR-AVERAGE-VIEWS] Successfully sent chart for book {book_id}")
+            await self.attach_chart(interaction, message, embed, await chart_task, f"average_views_chart_{book_id}.png")
+            logger.info("[RR-AVERAGE-VIEWS] Successfully sent chart for book %s", book_id)
             
         except Exception as e:
-            logger.info(f"[RR-AVERAGE-VIEWS] Error: {e}")
+            logger.info("[RR-AVERAGE-VIEWS] Error: %s", e)
             import traceback
             traceback.print_exc()
             
             try:
-                await interaction.followup.send(
-                    "❌ An error occurred while generating the average views chart.",
-                    ephemeral=True
-                )
+                if not await self.abandon_chart(message, chart_task):
+                    await interaction.followup.send(
+                        "❌ An error occurred while generating the average views chart.",
+                        ephemeral=True
+                    )
             except:
                 pass
     
@@ -421,15 +463,19 @@ class ChartCommandsModule:
         """Generate and send a rating metrics over time chart"""
         self.command_counter += 1
         
-        logger.info(f"\n[RR-RATINGS] Command called by {interaction.user}")
-        logger.info(f"[RR-RATINGS] Book input: '{book_input}', Days: '{days}'")
+        logger.info("\n[RR-RATINGS] Command called by %s", interaction.user)
+        logger.info("[RR-RATINGS] Book input: '%s', Days: '%s'", book_input, days)
         
         await interaction.response.defer()
         
+        # Set once the stats message is up and the chart is rendering
+        message = None
+        chart_task = None
+        
         try:
             # Parse days parameter
             days_param = self.parse_days_parameter(days)
-            logger.info(f"[RR-RATINGS] Parsed days parameter: {days_param}")
+            logger.info("[RR-RATINGS] Parsed days parameter: %s", days_param)
             
             # Fetch chart data
             chart_response = await self.get_book_chart_data(book_input.strip(), days_param)
@@ -452,31 +498,18 @@ class ChartCommandsModule:
             book_id = book_info.get('id', 'Unknown')
             book_url = book_info.get('url', f'https://www.royalroad.com/fiction/{book_id}')
             
-            logger.info(f"[RR-RATINGS] API returned {data_info.get('total_snapshots', 'unknown')} snapshots")
-            logger.info(f"[RR-RATINGS] Filter applied: {data_info.get('filter_applied', 'unknown')}")
+            logger.info("[RR-RATINGS] API returned %s snapshots", data_info.get('total_snapshots', 'unknown'))
+            logger.info("[RR-RATINGS] Filter applied: %s", data_info.get('filter_applied', 'unknown'))
             
             # Use data exactly as returned from API
             filtered_data = chart_data
             
-            # Create chart image with rating metrics
-            chart_buffer = self.create_ratings_chart_image(filtered_data, book_title, days_param)
-            
-            if not chart_buffer:
-                await interaction.followup.send(
-                    "❌ Failed to generate chart image. Please try again later.",
-                    ephemeral=True
-                )
-                return
-            
-            # Create Discord file and embed
-            file = discord.File(chart_buffer, filename=f"ratings_chart_{book_id}.png")
-            
+            # Create embed
             embed = discord.Embed(
                 title="⭐ Rating Metrics Over Time",
                 description=f"**[{book_title}]({book_url})**\nBook ID: {book_id}",
                 color=0x3498DB  # Blue color for ratings
             )
-            embed.set_image(url=f"attachment://ratings_chart_{book_id}.png")
             
             # Add stats if available
             if filtered_data.get('overall_score'):
@@ -497,6 +530,12 @@ class ChartCommandsModule:
             period_text = data_info.get('filter_applied', 'Unknown period')
             embed.add_field(name="Period", value=period_text, inline=True)
             
+            # Show the numbers right away; the chart is attached once rendered
+            message = await self.send_chart_stats(interaction, embed)
+            chart_task = asyncio.create_task(self.render_chart(
+                self.create_ratings_chart_image, filtered_data, book_title, days_param
+            ))
+            
             # Add data note about chart features
             embed.add_field(
                 name="📊 Chart Features",
@@ -508,70 +547,107 @@ class ChartCommandsModule:
             
             embed.set_footer(text="Data from Stepan Chizhov's Royal Road Analytics\n(starting with the 12th of June 2025)\nTo use the bot, start typing /rr-ratings")
             
-            await interaction.followup.send(embed=embed, file=file)
-            logger.info(f"[RR-RATINGS] Successfully sent chart for book {book_id}")
+            await self.attach_chart(interaction, message, embed, await chart_task, f"ratings_chart_{book_id}.png")
+            logger.info("[RR-RATINGS] Successfully sent chart for book %s", book_id)
             
         except Exception as e:
-            logger.info(f"[RR-RATINGS] Error: {e}")
+            logger.info("[RR-RATINGS] Error: %s", e)
             import traceback
             traceback.print_exc()
             
             try:
-                await interaction.followup.send(
-                    "❌ An error occurred while generating the ratings chart.",
-                    ephemeral=True
-                )
+                if not await self.abandon_chart(message, chart_task):
+                    await interaction.followup.send(
+                        "❌ An error occurred while generating the ratings chart.",
+                        ephemeral=True
+                    )
             except:
                 pass
     
     # Helper methods
+    async def render_chart(self, create_func, *args):
+        """Run a chart image function on the render worker without blocking the event loop"""
+        return await run_render(create_func, *args)
+
+    async def send_chart_stats(self, interaction, embed):
+        """
+        Send the stats embed with a placeholder while the chart renders
+
+        Returns:
+            The sent message to attach the chart to, or None when progressive
+            responses are disabled and everything is sent by attach_chart
+        """
+        if not PROGRESSIVE_CHART_RESPONSES:
+            return None
+
+        stats_embed = embed.copy()
+        stats_embed.add_field(name=CHART_PLACEHOLDER_NAME, value="The chart will appear here in a moment.", inline=False)
+        return await interaction.followup.send(embed=stats_embed, wait=True)
+
+    async def abandon_chart(self, message, chart_task):
+        """
+        Clean up a chart response after the handler failed
+
+        Cancels the render and replaces the placeholder on the stats message
+        with an error, so the message isn't left saying the chart is on its way.
+
+        Returns:
+            True if the stats message now shows the error
+        """
+        if chart_task is not None:
+            chart_task.cancel()
+            await asyncio.gather(chart_task, return_exceptions=True)
+
+        if message is None or not message.embeds:
+            return False
+
+        embed = message.embeds[0]
+        for index, field in enumerate(embed.fields):
+            if field.name == CHART_PLACEHOLDER_NAME:
+                embed.remove_field(index)
+                break
+        embed.add_field(name="❌ Chart unavailable", value="An error occurred while generating the chart. Please try again later.", inline=False)
+        try:
+            await message.edit(embed=embed)
+        except discord.HTTPException:
+            return False
+        return True
+
+    async def attach_chart(self, interaction, message, embed, chart_buffer, filename):
+        """Attach a rendered chart to the stats message (or send it, if no message was sent)"""
+        if message is None:
+            if not chart_buffer:
+                await interaction.followup.send(
+                    "❌ Failed to generate chart image. Please try again later.",
+                    ephemeral=True
+                )
+                return
+            embed.set_image(url=f"attachment://{filename}")
+            await interaction.followup.send(embed=embed, file=discord.File(chart_buffer, filename=filename))
+            return
+
+        if not chart_buffer:
+            embed.add_field(name="❌ Chart unavailable", value="Failed to generate chart image. Please try again later.", inline=False)
+            await message.edit(embed=embed)
+            return
+
+        embed.set_image(url=f"attachment://{filename}")
+        await message.edit(embed=embed, attachments=[discord.File(chart_buffer, filename=filename)])
+
     async def get_book_chart_data(self, book_input, days_param):
-        """Fetch chart data for a book from WordPress API with date filtering"""
+        """Get chart data for a book from the series cache, filtered by date locally"""
         try:
-            url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/book-chart-data"
-            headers = {
-                'User-Agent': 'RR-Analytics-Discord-Bot/1.0',
-                'Content-Type': 'application/json'
-            }
-            
-            # Base data
-            data = {
-                'book_input': str(book_input),
-                'bot_token': self.wp_bot_token
-            }
-            
-            # Add date filtering parameters based on the parsed days_param
-            if days_param == 'all':
-                data['all_data'] = True
-            elif isinstance(days_param, dict):
-                if days_param['type'] == 'date_range':
-                    data['start_date'] = days_param['start_date']
-                    data['end_date'] = days_param['end_date']
-                elif days_param['type'] == 'from_date':
-                    data['start_date'] = days_param['start_date']
-            elif isinstance(days_param, int):
-                data['days'] = days_param
-            
-            logger.info(f"[CHART] Fetching chart data for book input: {book_input}")
-            logger.info(f"[CHART] Days parameter: {days_param}")
-            logger.info(f"[CHART] Request URL: {url}")
-            
-            async with self.session.post(url, json=data, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    logger.info(f"[CHART] Successfully fetched chart data")
-                    logger.info(f"[CHART] Response keys: {list(result.keys())}")
-                    if 'data_info' in result:
-                        logger.info(f"[CHART] Total snapshots: {result['data_info'].get('total_snapshots', 'unknown')}")
-                        logger.info(f"[CHART] Filter applied: {result['data_info'].get('filter_applied', 'unknown')}")
-                    return result
-                else:
-                    error_text = await response.text()
-                    logger.info(f"[CHART] Failed to fetch chart data: {response.status} - {error_text}")
-                    return None
+            logger.info("[CHART] Getting chart data for book input: %s", book_input)
+            logger.info("[CHART] Days parameter: %s", days_param)
+            
+            result = await self.series_cache.get_chart_data(book_input, days_param)
+            if result and 'data_info' in result:
+                logger.info("[CHART] Total snapshots: %s", result['data_info'].get('total_snapshots', 'unknown'))
+                logger.info("[CHART] Filter applied: %s", result['data_info'].get('filter_applied', 'unknown'))
+            return result
                     
         except Exception as e:
-            logger.info(f"[CHART] Exception fetching chart data: {e}")
+            logger.info("[CHART] Exception fetching chart data: %s", e)
             return None
     
     def parse_days_parameter(self, days_str):
@@ -822,14 +898,14 @@ class ChartCommandsModule:
             return buffer
             
         except Exception as e:
-            logger.info(f"[CHART] Error creating chart image: {e}")
+            logger.info("[CHART] Error creating chart image: %s", e)
             plt.close()  # Ensure we clean up even on error
             return None
     
     def create_average_views_chart_image(self, chart_data, book_title, days_param):
         """Create an average views chart with chapters reference using matplotlib"""
         try:
-            logger.info(f"[CHART DEBUG] Starting chart creation for {book_title}")
+            logger.debug("[CHART DEBUG] Starting chart creation for %s", book_title)
             
             # Set up the plot
             plt.style.use('default')
@@ -841,11 +917,11 @@ class ChartCommandsModule:
             average_views_data = chart_data.get('average_views', [])
             chapters_data = chart_data.get('chapters', [])
             
-            logger.info(f"[CHART DEBUG] Initial data lengths - labels:{len(labels)}, avg_views:{len(average_views_data)}, chapters:{len(chapters_data)}")
+            logger.debug("[CHART DEBUG] Initial data lengths - labels:%s, avg_views:%s, chapters:%s", len(labels), len(average_views_data), len(chapters_data))
             
             # Check if we have average_views data
             if not average_views_data or len(average_views_data) == 0:
-                logger.info(f"[CHART DEBUG] No average_views data, trying to calculate from total_views/chapters")
+                logger.debug("[CHART DEBUG] No average_views data, trying to calculate from total_views/chapters")
                 # Try to calculate average views from total_views and chapters if possible
                 total_views_data = chart_data.get('total_views', [])
                 if total_views_data and chapters_data and len(total_views_data) == len(chapters_data):
@@ -856,7 +932,7 @@ class ChartCommandsModule:
                             average_views_data.append(int(avg_views))
                         else:
                             average_views_data.append(0)
-                    logger.info(f"[CHART DEBUG] Calculated {len(average_views_data)} average_views values")
+                    logger.debug("[CHART DEBUG] Calculated %s average_views values", len(average_views_data))
             
             if not average_views_data or not labels or not chapters_data or not timestamps:
                 # Create a "no data" chart
@@ -895,7 +971,7 @@ class ChartCommandsModule:
                                 filtered_avg_views.append(average_views_data[i])
                                 filtered_chapters.append(chapters_data[i])
                     
-                    logger.info(f"[CHART DEBUG] After filtering - dates:{len(date_objects)}, avg_views:{len(filtered_avg_views)}, chapters:{len(filtered_chapters)}")
+                    logger.debug("[CHART DEBUG] After filtering - dates:%s, avg_views:%s, chapters:%s", len(date_objects), len(filtered_avg_views), len(filtered_chapters))
                     
                     if not date_objects:
                         raise ValueError("No valid data points with timestamps after filtering")
@@ -904,7 +980,7 @@ class ChartCommandsModule:
                     color1 = '#9B59B6'  # Purple for average views
                     color2 = '#F39C12'  # Orange for chapters
                     
-                    logger.info(f"[CHART DEBUG] Plotting average views data with linear time axis")
+                    logger.debug("[CHART DEBUG] Plotting average views data with linear time axis")
                     # Plot average views on primary axis with linear time
                     ax1.set_xlabel('Date', fontsize=12)
                     ax1.set_ylabel('Average Views per Chapter', color=color1, fontsize=12)
@@ -924,7 +1000,7 @@ class ChartCommandsModule:
                     ax1.tick_params(axis='y', labelcolor=color1)
                     ax1.grid(True, alpha=0.3)
                     
-                    logger.info(f"[CHART DEBUG] Plotting chapters data")
+                    logger.debug("[CHART DEBUG] Plotting chapters data")
                     # Create secondary axis for chapters
                     ax2 = ax1.twinx()
                     ax2.set_ylabel('Total Chapters', color=color2, fontsize=12)
@@ -968,7 +1044,7 @@ class ChartCommandsModule:
             plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
             buffer.seek(0)
             
-            logger.info(f"[CHART DEBUG] Chart created successfully, buffer size: {len(buffer.getvalue())} bytes")
+            logger.debug("[CHART DEBUG] Chart created successfully, buffer size: %s bytes", len(buffer.getvalue()))
             
             # Clean up
             plt.close()
@@ -976,7 +1052,7 @@ class ChartCommandsModule:
             return buffer
            
         except Exception as e:
-            logger.info(f"[CHART DEBUG] ERROR in chart creation: {e}")
+            logger.debug("[CHART DEBUG] ERROR in chart creation: %s", e)
             import traceback
             traceback.print_exc()
             plt.close()  # Ensure we clean up even on error
@@ -985,7 +1061,7 @@ class ChartCommandsModule:
     def create_ratings_chart_image(self, chart_data, book_title, days_param):
         """Create a ratings metrics chart with dual axis (matching admin dashboard) using matplotlib"""
         try:
-            logger.info(f"[CHART DEBUG] Starting ratings chart creation for {book_title}")
+            logger.debug("[CHART DEBUG] Starting ratings chart creation for %s", book_title)
             
             # Set up the plot
             plt.style.use('default')
@@ -997,7 +1073,7 @@ class ChartCommandsModule:
             overall_score_data = chart_data.get('overall_score', [])
             ratings_data = chart_data.get('ratings', [])
             
-            logger.info(f"[CHART DEBUG] Initial data lengths - labels:{len(labels)}, scores:{len(overall_score_data)}, ratings:{len(ratings_data)}")
+            logger.debug("[CHART DEBUG] Initial data lengths - labels:%s, scores:%s, ratings:%s", len(labels), len(overall_score_data), len(ratings_data))
             
             if not overall_score_data or not labels or not ratings_data or not timestamps:
                 # Create a "no data" chart
@@ -1023,7 +1099,7 @@ class ChartCommandsModule:
                         # Include ratings (we already filtered for > 0)
                         filtered_ratings.append(ratings_data[i])
                 
-                logger.info(f"[CHART DEBUG] After filtering - dates:{len(date_objects)}, scores valid:{sum(1 for x in filtered_scores if x is not None)}, ratings valid:{sum(1 for x in filtered_ratings if x is not None)}")
+                logger.debug("[CHART DEBUG] After filtering - dates:%s, scores valid:%s, ratings valid:%s", len(date_objects), sum(1 for x in filtered_scores if x is not None), sum(1 for x in filtered_ratings if x is not None))
                 
                 if not date_objects:
                     raise ValueError("No valid data points with timestamps")
@@ -1032,7 +1108,7 @@ class ChartCommandsModule:
                 color1_hex = '#36A2EB'  # Blue for rating score (from admin.js)
                 color2_hex = '#FFCE56'  # Yellow for ratings count (from admin.js)
                 
-                logger.info(f"[CHART DEBUG] Plotting overall score data with linear time axis")
+                logger.debug("[CHART DEBUG] Plotting overall score data with linear time axis")
                 # Plot overall score on primary axis (0-5 scale)
                 ax1.set_xlabel('Date', fontsize=12)
                 ax1.set_ylabel('Overall Rating Score', color=color1_hex, fontsize=12)
@@ -1047,7 +1123,7 @@ class ChartCommandsModule:
                 ax1.tick_params(axis='y', labelcolor=color1_hex)
                 ax1.grid(True, alpha=0.3)
                 
-                logger.info(f"[CHART DEBUG] Plotting ratings count data")
+                logger.debug("[CHART DEBUG] Plotting ratings count data")
                 # Create secondary axis for ratings count
                 ax2 = ax1.twinx()
                 ax2.set_ylabel('Number of Ratings', color=color2_hex, fontsize=12)
@@ -1061,7 +1137,7 @@ class ChartCommandsModule:
                 # Add a thin yellow fill on top for better yellow visibility
                 ax2.fill_between(date_objects, filtered_ratings, alpha=0.3, color='#FFCE56')
                 
-                logger.info(f"[CHART DEBUG] Added white+yellow layered fill to avoid color mixing")
+                logger.debug("[CHART DEBUG] Added white+yellow layered fill to avoid color mixing")
                 
                 ax2.tick_params(axis='y', labelcolor=color2_hex)
                 
@@ -1105,7 +1181,7 @@ class ChartCommandsModule:
             plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
             buffer.seek(0)
             
-            logger.info(f"[CHART DEBUG] Chart created successfully, buffer size: {len(buffer.getvalue())} bytes")
+            logger.debug("[CHART DEBUG] Chart created successfully, buffer size: %s bytes", len(buffer.getvalue()))
             
             # Clean up
             plt.close()
@@ -1113,7 +1189,7 @@ class ChartCommandsModule:
             return buffer
            
         except Exception as e:
-            logger.info(f"[CHART DEBUG] ERROR in chart creation: {e}")
+            logger.debug("[CHART DEBUG] ERROR in chart creation: %s", e)
             import traceback
             traceback.print_exc()
             plt.close()  # Ensure we clean up even on error
@@ -1135,23 +1211,30 @@ class ChartCommandsModule:
                 'User-Agent': 'RR-Discord-Bot/1.0'
             }
             
-            logger.info(f"[RS-PREDICTION] Fetching full RS data for book: {book_input}")
+            logger.info("[RS-PREDICTION] Fetching full RS data for book: %s", book_input)
             
             async with self.session.post(url, json=data, headers=headers, timeout=30) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    logger.info(f"[RS-PREDICTION] Data received, eligible: {result.get('eligible')}, premium: {result.get('is_premium')}")
+                    result = await json_codec.read_json(response)
+                    logger.info("[RS-PREDICTION] Data received, eligible: %s, premium: %s", result.get('eligible'), result.get('is_premium'))
                     return result
                 else:
-                    logger.error(f"[RS-PREDICTION] API error: {response.status}")
+                    logger.error("[RS-PREDICTION] API error: %s", response.status)
                     return None
         except Exception as e:
-            logger.error(f"[RS-PREDICTION] Exception: {e}")
+            logger.error("[RS-PREDICTION] Exception: %s", e)
             return None
     
     async def check_rs_eligibility(self, book_input):
         """Quick RS eligibility check - returns only eligibility status"""
         try:
+            # Eligibility only changes when the book gets a new snapshot
+            series = self.series_cache.get_cached(book_input)
+            cached = self.eligibility_cache.get(series.book_info.get('id')) if series else None
+            if cached and cached[0] == series.last_timestamp:
+                logger.info("[RS-CHECK] Using cached eligibility for book: %s", book_input)
+                return cached[1]
+            
             data = {
                 'book_input': book_input,
                 'bot_token': self.wp_bot_token
@@ -1163,18 +1246,41 @@ class ChartCommandsModule:
                 'User-Agent': 'RR-Discord-Bot/1.0'
             }
             
-            logger.info(f"[RS-CHECK] Checking eligibility for book: {book_input}")
+            logger.info("[RS-CHECK] Checking eligibility for book: %s", book_input)
             
             async with self.session.post(url, json=data, headers=headers, timeout=10) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    logger.info(f"[RS-CHECK] Eligibility result: {result.get('eligible')}")
+                    result = await json_codec.read_json(response)
+                    logger.info("[RS-CHECK] Eligibility result: %s", result.get('eligible'))
+                    if series and result.get('success', True):
+                        self.eligibility_cache[series.book_info.get('id')] = (series.last_timestamp, result)
                     return result
                 else:
-                    logger.error(f"[RS-CHECK] API error: {response.status}")
+                    logger.error("[RS-CHECK] API error: %s", response.status)
                     return None
         except Exception as e:
-            logger.error(f"[RS-CHECK] Exception: {e}")
+            logger.error("[RS-CHECK] Exception: %s", e)
+            return None
+    
+    def get_rs_forecast(self, book_input):
+        """Run the Monte Carlo RS forecast on the cached follower series"""
+        try:
+            series = self.series_cache.get_cached(book_input)
+            if series is None:
+                return None
+            
+            mask = series.select(FORECAST_HISTORY_DAYS + 1)
+            snapshots = [
+                {'timestamp': str(ts).replace('T', ' '), 'followers': followers}
+                for ts, followers in zip(series.timestamps[mask], series.column_list('followers', mask))
+                if followers is not None
+            ]
+            
+            prediction = RisingStarsPrediction(None, series.book_info.get('id'), series.book_info, snapshots)
+            return prediction.forecast_position()
+            
+        except Exception as e:
+            logger.info("[RS_FORECAST] Error: %s", e)
             return None
     
     def add_rs_prediction_to_embed(self, embed, rs_data, user):
@@ -1288,6 +1394,23 @@ class ChartCommandsModule:
                     inline=True
                 )
             
+            # Simulated outlook from the book's own growth variance
+            forecast = rs_data.get('forecast')
+            if forecast:
+                forecast_text = f"**Most likely peak:** #{forecast['best_match']} ({forecast['confidence']}% of simulations)\n"
+                for band, share in forecast['probabilities'].items():
+                    if share > 0:
+                        forecast_text += f"• #{band}: {share}%\n" if band[0].isdigit() else f"• {band}: {share}%\n"
+                forecast_text += (
+                    f"\n**Week growth range:** {forecast['week_growth_p10']:,}-{forecast['week_growth_p90']:,} "
+                    f"(median {forecast['week_growth_median']:,})"
+                )
+                embed.add_field(
+                    name="🎲 Simulated Peak Outlook",
+                    value=forecast_text,
+                    inline=True
+                )
+            
             # Timeline estimate
             timeline = f"{urgency}\n\n⏰ Estimated Timeline\n" + rs_data.get('estimated_timeline', 'Unknown')
             embed.add_field(
@@ -23,12 +23,27 @@ from chart_commands_module import ChartCommandsModule
 from essence_commands_module import EssenceCommandsModule
 from others_also_liked_module import OthersAlsoLikedModule
 from rs_analysis_module import RSAnalysisModule
+from rs_candidates_module import RSCandidatesModule
 from promotional_utils import get_promotional_field, add_promotional_field
-from shared_utils import tag_autocomplete, TAG_MAPPING, UNIQUE_TAGS
+from shared_utils import tag_autocomplete, TAG_MAPPING, UNIQUE_TAGS, ALL_RS_TAGS
 from ptw_module import PopularThisWeekModule
+from ptw_snapshot_store import PTWSnapshotStore
+from rs_appearance_index import RSAppearanceIndex
+from user_resolver import UserResolver
+from dm_dispatcher import DMDispatcher
+from embed_registry import embed_registry
+from book_series_cache import BookSeriesCache
+from metrics import create_trace_config, instrument_command_tree, record_command, MetricsServer
+from loop_watchdog import LoopWatchdog
+from profiling_module import ProfilingModule
+import tracing
+from tracing import tracer, instrument_trace_config, end_interaction_span
+from structured_logging import configure_logging
+import json_codec
+from http_cache import ACCEPT_ENCODING
 
-# Set up logging
-logging.basicConfig(level=logging.WARNING)
+# Set up logging (queued, written by a background thread; LOG_LEVEL / LOG_FORMAT)
+configure_logging()
 logger = logging.getLogger('discord')
 
 # Silence matplotlib warnings
@@ -47,7 +62,12 @@ logger.info(f"[STARTUP] WP Bot Token exists: {'Yes' if WP_BOT_TOKEN else 'No'}")
 
 # Initialize bot with command prefix (even though we'll use slash commands)
 intents = discord.Intents.default()
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot = commands.Bot(
+    command_prefix='!', intents=intents,
+    http_trace=instrument_trace_config(create_trace_config('discord'), 'discord')
+)
+instrument_command_tree(bot)
+tracing.instrument_command_tree(bot)
 
 # Global variables for modules
 session = None
@@ -58,23 +78,61 @@ essence_module = None
 others_also_liked_module = None
 rs_analysis_module = None
 
+# DM queue shared by every ShoutoutModule; created once so reconnects don't start more workers
+dm_dispatcher = None
+# PTW snapshot store, created once so reconnects don't start more refresh loops
+ptw_snapshot_store = None
+# RS appearance index, created once so reconnects don't start more sync loops
+rs_appearance_index = None
+# RS candidates scanner, created once so reconnects don't start more scan loops
+rs_candidates_module = None
+
 # Global command counter
 command_counter = 0
 
+# Background tasks started from on_ready (referenced so they aren't garbage collected)
+background_tasks = set()
+
+# Metrics endpoint and event loop lag / blocking watchdog
+metrics_server = MetricsServer()
+loop_watchdog = LoopWatchdog()
+
 async def get_session():
     """Get or create the aiohttp session"""
     global session
     if session is None or session.closed:
-        session = aiohttp.ClientSession()
+        # Trace ids are sent to WordPress so backend slow logs can be matched to bot traces
+        trace_config = instrument_trace_config(create_trace_config('wordpress'), 'wordpress', propagate=True)
+        session = aiohttp.ClientSession(
+            trace_configs=[trace_config],
+            json_serialize=json_codec.dumps,
+            headers={'Accept-Encoding': ACCEPT_ENCODING}
+        )
     return session
 
+def start_background_task(coro):
+    """Run a coroutine in the background, logging it if it fails"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(on_background_task_done)
+    return task
+
+def on_background_task_done(task):
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"[BACKGROUND] Task failed: {task.exception()}")
+
 @bot.event
 async def on_ready():
     """Initialize all modules when bot is ready"""
     global session, shoutout_module, book_claim_module, chart_module
-    global essence_module, others_also_liked_module, rs_analysis_module
+    global essence_module, others_also_liked_module, rs_analysis_module, dm_dispatcher
+    global ptw_snapshot_store, rs_appearance_index, rs_candidates_module
     
     session = await get_session()
+    await metrics_server.start()
+    loop_watchdog.start()
+    tracer.start()
     logger.info(f'[READY] {bot.user} has connected to Discord!')
     logger.info(f'[READY] Bot is in {len(bot.guilds)} guilds')
     
@@ -86,20 +144,42 @@ async def on_ready():
         # Initialize all modules
         logger.info("[READY] Initializing modules...")
         
+        # Shared user / DM channel cache for notification DMs
+        user_resolver = UserResolver(bot)
+        
+        if dm_dispatcher is None:
+            dm_dispatcher = DMDispatcher(
+                bot,
+                state_path=os.getenv('DM_QUEUE_STATE_PATH', 'pending_dms.json'),
+                user_resolver=user_resolver
+            )
+        
+        # Shared snapshot series for the chart and Rising Stars commands
+        series_cache = BookSeriesCache(session, WP_API_URL, WP_BOT_TOKEN)
+        
         # Core modules from original bot
         shoutout_module = ShoutoutModule(
-            bot, session, WP_API_URL, WP_BOT_TOKEN, tag_autocomplete
+            bot, session, WP_API_URL, WP_BOT_TOKEN, tag_autocomplete,
+            user_resolver=user_resolver, dm_dispatcher=dm_dispatcher
         )
         logger.info("✓ Shoutout module initialized")
         
         book_claim_module = BookClaimModule(
-            bot, session, WP_API_URL, WP_BOT_TOKEN
+            bot, session, WP_API_URL, WP_BOT_TOKEN,
+            user_resolver=user_resolver
         )
         logger.info("✓ Book claim module initialized")
+        
+        # Warm the claim notification channel map in the background
+        start_background_task(book_claim_module.preload_notification_channels())
 
+        if ptw_snapshot_store is None:
+            ptw_snapshot_store = PTWSnapshotStore(session, WP_API_URL, WP_BOT_TOKEN, ALL_RS_TAGS)
+        
         ptw_module = PopularThisWeekModule(
             bot, session, WP_API_URL, WP_BOT_TOKEN,
-            add_promotional_field_func=add_promotional_field
+            add_promotional_field_func=add_promotional_field,
+            snapshot_store=ptw_snapshot_store
         )
         logger.info("✓ Popular This Week module initialized")
         
@@ -107,7 +187,8 @@ async def on_ready():
         chart_module = ChartCommandsModule(
             bot, session, WP_API_URL, WP_BOT_TOKEN,
             get_promotional_field_func=get_promotional_field,
-            add_promotional_field_func=add_promotional_field
+            add_promotional_field_func=add_promotional_field,
+            series_cache=series_cache
         )
         logger.info("✓ Chart commands module initialized")
         
@@ -128,12 +209,29 @@ async def on_ready():
         logger.info("✓ Others Also Liked module initialized")
         
         # Rising Stars analysis module (RS Chart and RS Run)
+        if rs_appearance_index is None:
+            rs_appearance_index = RSAppearanceIndex(session, WP_API_URL, WP_BOT_TOKEN, ALL_RS_TAGS)
+        
         rs_analysis_module = RSAnalysisModule(
             bot, session, WP_API_URL, WP_BOT_TOKEN,
-            add_promotional_field_func=add_promotional_field
+            add_promotional_field_func=add_promotional_field,
+            series_cache=series_cache,
+            appearance_index=rs_appearance_index
         )
         logger.info("✓ RS Analysis module initialized")
         
+        # Rising Stars candidate scanner and leaderboard
+        if rs_candidates_module is None:
+            rs_candidates_module = RSCandidatesModule(
+                bot, session, WP_API_URL, WP_BOT_TOKEN,
+                add_promotional_field_func=add_promotional_field
+            )
+        logger.info("✓ RS Candidates module initialized")
+        
+        # Admin-only per-command profiling
+        profiling_module = ProfilingModule(bot, book_claim_module.is_bot_admin)
+        logger.info("✓ Profiling module initialized")
+        
         # Register standalone commands
         register_standalone_commands()
         logger.info("✓ Standalone commands registered")
@@ -170,6 +268,106 @@ async def test_wordpress_connection():
     except Exception as e:
         logger.info(f'[TEST] ❌ Failed to reach WordPress: {e}')
 
+def build_help_embed() -> discord.Embed:
+    """Build the /help embed (cached by the embed registry)"""
+    embed = discord.Embed(
+        title="🤖 Discord Essence Bot Help",
+        description=(
+            "**Discover rare Royal Road book combinations & track analytics!**\n\n"
+            "🎯 **Quick Start:** `/e Fantasy Magic` or `/rr-followers 105229`\n"
+            "💡 **Tip:** Use autocomplete in `/essence` by pressing Tab after typing the command\n\n"
+            "📊 **All chart commands show 'all time' data by default**"
+        ),
+        color=0x5468ff
+    )
+    
+    # Commands section
+    embed.add_field(
+        name="🎮 Commands Overview",
+        value=(
+            "**Essence Commands**\n"
+            "`/essence` - Combine tags with autocomplete\n"
+            "`/e` or `/combine` - Quick essence combination\n"
+            "`/tags` - List all available tags\n"
+            "`/brag` - Show your essence discoveries\n"
+            "`/rr-stats` - Royal Road database statistics\n\n"
+            
+            "**Chart Commands**\n"
+            "`/rr-followers` - Followers over time\n"
+            "`/rr-views` - Views over time\n"
+            "`/rr-average-views` - Average views & chapters\n"
+            "`/rr-ratings` - Rating metrics over time\n\n"
+            
+            "**Analysis Commands**\n"
+            "`/rr-others-also-liked` - Books referencing this book\n"
+            "`/rr-others-also-liked-list` - Complete reference list\n"
+            "`/rr-rs-chart` - Rising Stars impact analysis\n"
+            "`/rr-rs-run` - Rising Stars appearance history\n\n"
+            
+            "**Utility Commands**\n"
+            "`/ping` - Check if bot is online\n"
+            "`/test` - Test API connection\n"
+            "`/help` - Show this help message"
+        ),
+        inline=False
+    )
+    
+    # Chart time formats
+    embed.add_field(
+        name="📊 Chart Time Formats",
+        value=(
+            "• `30` - Last 30 days\n"
+            "• `all` - All available data (default)\n"
+            "• `2024-01-01` - From specific date\n"
+            "• `2024-01-01:2024-02-01` - Date range"
+        ),
+        inline=True
+    )
+    
+    # Rarity tiers
+    embed.add_field(
+        name="💎 Essence Rarity Tiers",
+        value=(
+            "🌟 **Mythic** (≤0.15%)\n"
+            "⭐ **Legendary** (≤0.3%)\n"
+            "💜 **Epic** (≤0.5%)\n"
+            "💙 **Rare** (≤1.0%)\n"
+            "💚 **Uncommon** (≤5.0%)\n"
+            "⚪ **Common** (>5.0%)"
+        ),
+        inline=True
+    )
+    
+    # Examples
+    embed.add_field(
+        name="💡 Quick Examples",
+        value=(
+            "**Essence:** `/e Fantasy Magic`\n"
+            "**Chart:** `/rr-followers 105229`\n"
+            "**Analysis:** `/rr-rs-chart 105229`\n"
+            "**Discovery:** `/brag`"
+        ),
+        inline=False
+    )
+    
+    # Links and support
+    embed.add_field(
+        name="🔗 Links & Support",
+        value=(
+            "📖 [Read \"The Dark Lady's Guide to Villainy\"](https://www.royalroad.com/fiction/105229)\n"
+            "🔍 [More Tools](https://stepan.chizhov.com)\n"
+            "💬 [Support Discord](https://discord.gg/xvw9vbvrwj)\n"
+            "❤️ [Support on Patreon](https://patreon.com/stepanchizhov)\n"
+            "📚 [Community Discord](https://discord.gg/7Xrrf3Q5zp)"
+        ),
+        inline=False
+    )
+    
+    embed.set_footer(text="Created by Stepan Chizhov • Data updated continuously")
+    
+    return embed
+
+
 def register_standalone_commands():
     """Register standalone commands that don't belong to a specific module"""
     
@@ -261,103 +459,12 @@ def register_standalone_commands():
                 ephemeral=True
             )
     
+    embed_registry.register('help', build_help_embed)
+    
     @bot.tree.command(name="help", description="Show detailed help information for all commands")
     async def help_command(interaction: discord.Interaction):
         """Display comprehensive help information"""
-        embed = discord.Embed(
-            title="🤖 Discord Essence Bot Help",
-            description=(
-                "**Discover rare Royal Road book combinations & track analytics!**\n\n"
-                "🎯 **Quick Start:** `/e Fantasy Magic` or `/rr-followers 105229`\n"
-                "💡 **Tip:** Use autocomplete in `/essence` by pressing Tab after typing the command\n\n"
-                "📊 **All chart commands show 'all time' data by default**"
-            ),
-            color=0x5468ff
-        )
-        
-        # Commands section
-        embed.add_field(
-            name="🎮 Commands Overview",
-            value=(
-                "**Essence Commands**\n"
-                "`/essence` - Combine tags with autocomplete\n"
-                "`/e` or `/combine` - Quick essence combination\n"
-                "`/tags` - List all available tags\n"
-                "`/brag` - Show your essence discoveries\n"
-                "`/rr-stats` - Royal Road database statistics\n\n"
-                
-                "**Chart Commands**\n"
-                "`/rr-followers` - Followers over time\n"
-                "`/rr-views` - Views over time\n"
-                "`/rr-average-views` - Average views & chapters\n"
-                "`/rr-ratings` - Rating metrics over time\n\n"
-                
-                "**Analysis Commands**\n"
-                "`/rr-others-also-liked` - Books referencing this book\n"
-                "`/rr-others-also-liked-list` - Complete reference list\n"
-                "`/rr-rs-chart` - Rising Stars impact analysis\n"
-                "`/rr-rs-run` - Rising Stars appearance history\n\n"
-                
-                "**Utility Commands**\n"
-                "`/ping` - Check if bot is online\n"
-                "`/test` - Test API connection\n"
-                "`/help` - Show this help message"
-            ),
-            inline=False
-        )
-        
-        # Chart time formats
-        embed.add_field(
-            name="📊 Chart Time Formats",
-            value=(
-                "• `30` - Last 30 days\n"
-                "• `all` - All available data (default)\n"
-                "• `2024-01-01` - From specific date\n"
-                "• `2024-01-01:2024-02-01` - Date range"
-            ),
-            inline=True
-        )
-        
-        # Rarity tiers
-        embed.add_field(
-            name="💎 Essence Rarity Tiers",
-            value=(
-                "🌟 **Mythic** (≤0.15%)\n"
-                "⭐ **Legendary** (≤0.3%)\n"
-                "💜 **Epic** (≤0.5%)\n"
-                "💙 **Rare** (≤1.0%)\n"
-                "💚 **Uncommon** (≤5.0%)\n"
-                "⚪ **Common** (>5.0%)"
-            ),
-            inline=True
-        )
-        
-        # Examples
-        embed.add_field(
-            name="💡 Quick Examples",
-            value=(
-                "**Essence:** `/e Fantasy Magic`\n"
-                "**Chart:** `/rr-followers 105229`\n"
-                "**Analysis:** `/rr-rs-chart 105229`\n"
-                "**Discovery:** `/brag`"
-            ),
-            inline=False
-        )
-        
-        # Links and support
-        embed.add_field(
-            name="🔗 Links & Support",
-            value=(
-                "📖 [Read \"The Dark Lady's Guide to Villainy\"](https://www.royalroad.com/fiction/105229)\n"
-                "🔍 [More Tools](https://stepan.chizhov.com)\n"
-                "💬 [Support Discord](https://discord.gg/xvw9vbvrwj)\n"
-                "❤️ [Support on Patreon](https://patreon.com/stepanchizhov)\n"
-                "📚 [Community Discord](https://discord.gg/7Xrrf3Q5zp)"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="Created by Stepan Chizhov • Data updated continuously")
+        embed = embed_registry.get('help')
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -398,6 +505,8 @@ async def on_command_error(ctx, error):
 async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
     """Handle application command errors"""
     logger.info(f"[ERROR] Command error: {type(error).__name__}: {error}")
+    record_command(interaction, 'error')
+    end_interaction_span(interaction, error)
     import traceback
     traceback.print_exc()
     
@@ -409,6 +518,11 @@ async def on_app_command_error(interaction: discord.Interaction, error: discord.
 async def cleanup():
     """Cleanup handler for shutdown"""
     global session
+    if dm_dispatcher:
+        # Persist DMs that haven't been delivered yet
+        await dm_dispatcher.stop()
+    await metrics_server.stop()
+    await tracer.stop()
     if session and not session.closed:
         await session.close()
         logger.info(f"[CLEANUP] Session closed")
@@ -446,7 +560,8 @@ def main():
     for attempt in range(max_retries):
         try:
             logger.info(f"Starting bot (attempt {attempt + 1}/{max_retries})...")
-            bot.run(BOT_TOKEN)
+            # Logging is already configured, so discord.py must not add its own handler
+            bot.run(BOT_TOKEN, log_handler=None)
             break  # If successful, exit the loop
         except discord.errors.HTTPException as e:
             if e.status == 429 or "1015" in str(e):
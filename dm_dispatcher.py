@@ -0,0 +1,313 @@
+"""
+DM dispatcher for Discord Essence Bot
+Queues direct messages and delivers them in the background with rate limiting,
+so commands that trigger notifications can respond immediately
+"""
+
+import discord
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Optional, Dict, Any, List
+
+from user_resolver import UserResolver
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Global pacing for all DMs sent by the bot. Discord allows 50 requests/s
+# globally, but bursts of DMs are what trip its anti-spam limits, so stay low.
+DM_GLOBAL_RATE = 5.0          # Tokens added per second
+DM_GLOBAL_BURST = 5           # Bucket capacity
+DM_PER_USER_INTERVAL = 5.0    # Seconds between DMs to the same user (per-channel route)
+DM_MAX_ATTEMPTS = 3           # Delivery attempts before a DM is reported as failed
+DM_WORKER_COUNT = 2
+
+
+class TokenBucket:
+    """Token bucket used to pace outgoing requests"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for a while (e.g. after a global 429)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self.updated_at = self.paused_until
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def retry_after_seconds(error: discord.HTTPException) -> float:
+    """Seconds to wait after a 429, read from its Retry-After header"""
+    headers = getattr(error.response, 'headers', None) or {}
+    try:
+        return max(float(headers.get('Retry-After')), 0.0) or DM_PER_USER_INTERVAL
+    except (TypeError, ValueError):
+        return DM_PER_USER_INTERVAL
+
+
+class DMJob:
+    """A single queued direct message"""
+
+    def __init__(self, user_id: int, embed: Optional[discord.Embed] = None, content: Optional[str] = None,
+                 report_to: Optional[int] = None, description: Optional[str] = None, attempts: int = 0):
+        self.user_id = user_id
+        self.embed = embed
+        self.content = content
+        self.report_to = report_to
+        self.description = description
+        self.attempts = attempts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job so it can be persisted across restarts"""
+        return {
+            'user_id': self.user_id,
+            'embed': self.embed.to_dict() if self.embed else None,
+            'content': self.content,
+            'report_to': self.report_to,
+            'description': self.description,
+            'attempts': self.attempts
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DMJob':
+        """Rebuild a job saved with to_dict"""
+        embed = discord.Embed.from_dict(data['embed']) if data.get('embed') else None
+        return cls(
+            int(data['user_id']),
+            embed=embed,
+            content=data.get('content'),
+            report_to=data.get('report_to'),
+            description=data.get('description'),
+            attempts=data.get('attempts', 0)
+        )
+
+
+class DMDispatcher:
+    """
+    Background DM delivery queue
+
+    DMs are paced by a global token bucket plus a per-user interval, retried
+    after 429s using the Retry-After header, and failures can be reported back
+    to another user (e.g. the campaign owner). Every pending DM is written to
+    disk when it is queued and removed once it is delivered or given up on,
+    so a crash or restart doesn't lose anything; the file is re-queued on the
+    next start.
+    """
+
+    def __init__(self, bot, state_path: Optional[str] = None, user_resolver: Optional[UserResolver] = None):
+        self.bot = bot
+        self.state_path = state_path
+        self.user_resolver = user_resolver or UserResolver(bot)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.delayed: List[DMJob] = []
+        self.global_bucket = TokenBucket(DM_GLOBAL_RATE, DM_GLOBAL_BURST)
+        self.user_next_allowed: Dict[int, float] = {}
+        self.workers: List[asyncio.Task] = []
+        # Every DM not yet delivered or given up on, mirrored to state_path
+        self.pending: List[DMJob] = []
+        self.stopped = False
+
+        # Delivery statistics
+        self.delivered_count = 0
+        self.failed_count = 0
+
+    def start(self):
+        """Load any persisted DMs and start the delivery workers"""
+        if self.workers:
+            return
+
+        self.stopped = False
+        for job in self.load_pending():
+            self.pending.append(job)
+            self.queue.put_nowait(job)
+
+        self.workers = [asyncio.create_task(self.worker()) for _ in range(DM_WORKER_COUNT)]
+        logger.info(f"[DM_DISPATCHER] Started {DM_WORKER_COUNT} worker(s), {self.queue.qsize()} DM(s) pending")
+
+    async def stop(self):
+        """Stop the workers; undelivered DMs stay on disk for the next start"""
+        self.stopped = True
+        for task in self.workers:
+            task.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+        self.save_pending()
+        logger.info(f"[DM_DISPATCHER] Stopped with {len(self.pending)} DM(s) pending")
+
+    def enqueue(self, user_id: int, embed: Optional[discord.Embed] = None, content: Optional[str] = None,
+                report_to: Optional[int] = None, description: Optional[str] = None) -> bool:
+        """
+        Queue a DM for background delivery
+
+        Args:
+            user_id: Discord ID of the recipient
+            embed: Embed to send
+            content: Plain text to send
+            report_to: Discord ID to notify if the DM cannot be delivered
+            description: Short description of the DM used in failure reports
+
+        Returns:
+            True once the DM is queued, False if the dispatcher has been stopped
+        """
+        if self.stopped:
+            logger.warning(f"[DM_DISPATCHER] Dispatcher stopped, not queueing DM to {user_id}")
+            return False
+
+        self.add(DMJob(int(user_id), embed, content, report_to, description))
+        logger.info(f"[DM_DISPATCHER] Queued DM to {user_id} ({self.queue.qsize()} pending)")
+        return True
+
+    def add(self, job: DMJob):
+        """Record a job on disk and queue it"""
+        self.pending.append(job)
+        self.save_pending()
+        self.queue.put_nowait(job)
+
+    def finish(self, job: DMJob):
+        """Forget a job that was delivered or given up on"""
+        if job in self.pending:
+            self.pending.remove(job)
+            self.save_pending()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get delivery statistics"""
+        return {
+            'pending': len(self.pending),
+            'delivered': self.delivered_count,
+            'failed': self.failed_count
+        }
+
+    async def worker(self):
+        """Deliver queued DMs one at a time"""
+        while True:
+            job = await self.queue.get()
+            try:
+                # Respect the per-user interval without blocking other recipients
+                wait_time = self.user_next_allowed.get(job.user_id, 0.0) - time.monotonic()
+                if wait_time > 0:
+                    self.requeue_later(job, wait_time)
+                    continue
+
+                await self.global_bucket.acquire()
+                await self.deliver(job)
+            except asyncio.CancelledError:
+                # Still on disk; put it back in case the workers are restarted
+                self.queue.put_nowait(job)
+                raise
+            except Exception as e:
+                logger.error(f"[DM_DISPATCHER] Unexpected error delivering DM to {job.user_id}: {e}")
+                self.finish(job)
+            finally:
+                self.queue.task_done()
+
+    async def deliver(self, job: DMJob):
+        """Attempt to send a single DM, scheduling retries where it makes sense"""
+        job.attempts += 1
+
+        try:
+            await self.user_resolver.send(job.user_id, content=job.content, embed=job.embed)
+
+            self.user_next_allowed[job.user_id] = time.monotonic() + DM_PER_USER_INTERVAL
+            self.delivered_count += 1
+            self.finish(job)
+            logger.info(f"[DM_DISPATCHER] DM sent successfully to {job.user_id}")
+
+        except discord.NotFound:
+            self.user_resolver.forget(job.user_id)
+            self.report_failure(job, "user not found")
+        except discord.Forbidden:
+            self.report_failure(job, "their DMs are disabled")
+        except discord.HTTPException as e:
+            if e.status == 429 and job.attempts < DM_MAX_ATTEMPTS:
+                retry_after = retry_after_seconds(e)
+                logger.warning(f"[DM_DISPATCHER] Rate limited sending DM to {job.user_id}. Retry after: {retry_after}s")
+                self.global_bucket.pause(retry_after)
+                self.requeue_later(job, retry_after)
+            elif e.status >= 500 and job.attempts < DM_MAX_ATTEMPTS:
+                self.requeue_later(job, 2 ** job.attempts)
+            else:
+                self.report_failure(job, f"Discord error {e.status}")
+
+    def requeue_later(self, job: DMJob, delay: float):
+        """Put a job back on the queue after a delay"""
+        # Keep the attempt count on disk
+        self.save_pending()
+        self.delayed.append(job)
+
+        def release():
+            if job in self.delayed:
+                self.delayed.remove(job)
+                self.queue.put_nowait(job)
+
+        asyncio.get_running_loop().call_later(delay, release)
+
+    def report_failure(self, job: DMJob, reason: str):
+        """Record a failed DM and tell the interested user about it"""
+        self.failed_count += 1
+        self.finish(job)
+        logger.info(f"[DM_DISPATCHER] Could not DM user {job.user_id} - {reason}")
+
+        if job.report_to and int(job.report_to) != job.user_id:
+            what = job.description or "a notification"
+            self.add(DMJob(
+                int(job.report_to),
+                content=(
+                    f"⚠️ Couldn't deliver {what} to <@{job.user_id}> ({reason}).\n"
+                    f"You may want to contact them directly."
+                )
+            ))
+
+    def load_pending(self) -> List[DMJob]:
+        """Load DMs saved by a previous run"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return []
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return [DMJob.from_dict(item) for item in json.load(f)]
+        except Exception as e:
+            logger.error(f"[DM_DISPATCHER] Failed to load pending DMs: {e}")
+            return []
+
+    def save_pending(self):
+        """Write the pending DMs to disk (replacing the file atomically)"""
+        if not self.state_path:
+            return
+
+        try:
+            if not self.pending:
+                if os.path.exists(self.state_path):
+                    os.remove(self.state_path)
+                return
+
+            temp_path = f"{self.state_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump([job.to_dict() for job in self.pending], f)
+            os.replace(temp_path, self.state_path)
+        except Exception as e:
+            logger.error(f"[DM_DISPATCHER] Failed to save pending DMs: {e}")
@@ -0,0 +1,55 @@
+"""
+Embed registry for Discord Essence Bot
+Builds static embeds (help, tag lists, ...) once and serves copies of them
+"""
+
+import discord
+import copy
+import logging
+from typing import Callable, Dict, Any, Optional
+
+from metrics import record_cache
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+
+class EmbedRegistry:
+    """
+    Cache of prebuilt embeds
+
+    Each embed is registered with a builder function. The builder runs on
+    first use (or after invalidate) and the result is stored as a dict;
+    every get() returns a fresh Embed so callers can add fields to it
+    without touching the cached copy.
+    """
+
+    def __init__(self):
+        self.builders: Dict[str, Callable[[], discord.Embed]] = {}
+        self.cache: Dict[str, Dict[str, Any]] = {}
+
+    def register(self, name: str, builder: Callable[[], discord.Embed]):
+        """Register (or replace) the builder for an embed"""
+        self.builders[name] = builder
+        self.cache.pop(name, None)
+
+    def get(self, name: str) -> discord.Embed:
+        """Get a copy of a registered embed, building it if needed"""
+        data = self.cache.get(name)
+        record_cache('embeds', 'miss' if data is None else 'hit')
+        if data is None:
+            data = self.builders[name]().to_dict()
+            self.cache[name] = data
+            logger.info(f"[EMBED_REGISTRY] Built '{name}' embed")
+        return discord.Embed.from_dict(copy.deepcopy(data))
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one cached embed (or all of them) so it's rebuilt on next use"""
+        if name is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(name, None)
+
+
+# Shared registry used by all modules
+embed_registry = EmbedRegistry()
@@ -5,6 +5,9 @@ import json
 import logging
 from typing import Optional, List, Dict, Any
 
+from embed_registry import embed_registry
+import json_codec
+
 # Set up logging
 logger = logging.getLogger('discord')
 
@@ -36,6 +39,9 @@ class EssenceCommandsModule:
             self.UNIQUE_TAGS = []
             self.normalize_tag = lambda x: x
         
+        # The tag list only changes with shared_utils, so build it once
+        embed_registry.register('tags', self.build_tags_embed)
+        
         # Register commands
         self.register_commands()
     
@@ -86,21 +92,21 @@ class EssenceCommandsModule:
     
     async def essence_handler(self, interaction: discord.Interaction, tag1: str, tag2: str):
         """Handle the main essence command"""
-        logger.info(f"\n[COMMAND] Essence command called")
-        logger.info(f"[COMMAND] User: {interaction.user} (ID: {interaction.user.id})")
-        logger.info(f"[COMMAND] Guild: {interaction.guild.name if interaction.guild else 'DM'}")
-        logger.info(f"[COMMAND] Raw input: '{tag1}' + '{tag2}'")
+        logger.info("\n[COMMAND] Essence command called")
+        logger.info("[COMMAND] User: %s (ID: %s)", interaction.user, interaction.user.id)
+        logger.info("[COMMAND] Guild: %s", interaction.guild.name if interaction.guild else 'DM')
+        logger.info("[COMMAND] Raw input: '%s' + '%s'", tag1, tag2)
         
         # Defer the response FIRST
         await interaction.response.defer()
-        logger.info(f"[COMMAND] Response deferred")
+        logger.info("[COMMAND] Response deferred")
         
         try:
             # Normalize tags
             normalized_tag1 = self.normalize_tag(tag1)
             normalized_tag2 = self.normalize_tag(tag2)
             
-            logger.info(f"[COMMAND] Normalized: '{normalized_tag1}' + '{normalized_tag2}'")
+            logger.info("[COMMAND] Normalized: '%s' + '%s'", normalized_tag1, normalized_tag2)
             
             # Check if tags are valid
             if not normalized_tag1:
@@ -137,7 +143,7 @@ class EssenceCommandsModule:
             }
             
             url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/essence-combination"
-            logger.info(f"[API] URL: {url}")
+            logger.debug("[API] URL: %s", url)
             
             # Make API request
             headers = {
@@ -147,26 +153,26 @@ class EssenceCommandsModule:
             }
             
             async with self.session.post(url, json=data, headers=headers) as response:
-                response_text = await response.text()
-                logger.info(f"[API] Status: {response.status}")
-                logger.info(f"[API] Response: {response_text[:500]}...")
+                body = await response.read()
+                logger.info("[API] Status: %s", response.status)
+                logger.debug("[API] Response: %r...", body[:500])
                 
                 if response.status == 200:
-                    result = json.loads(response_text)
+                    result = json_codec.loads(body)
                     
                     # Create embed using the normalized display names
                     embed = self.create_result_embed(result, normalized_tag1, normalized_tag2, interaction)
                     await interaction.followup.send(embed=embed)
-                    logger.info(f"[COMMAND] Embed sent successfully")
+                    logger.info("[COMMAND] Embed sent successfully")
                 else:
                     await interaction.followup.send(
                         f"Error {response.status} from the essence database!",
                         ephemeral=True
                     )
-                    logger.info(f"[ERROR] API returned status {response.status}")
+                    logger.info("[ERROR] API returned status %s", response.status)
         
         except Exception as e:
-            logger.info(f"[ERROR] Exception in essence command: {type(e).__name__}: {e}")
+            logger.info("[ERROR] Exception in essence command: %s: %s", type(e).__name__, e)
             import traceback
             traceback.print_exc()
             
@@ -176,13 +182,13 @@ class EssenceCommandsModule:
                     ephemeral=True
                 )
             except:
-                logger.info(f"[ERROR] Failed to send error message to user")
+                logger.info("[ERROR] Failed to send error message to user")
     
     async def quick_essence_handler(self, interaction: discord.Interaction, tags: str):
         """Process quick essence command with two tags in one input"""
-        logger.info(f"\n[COMMAND] Quick essence command called")
-        logger.info(f"[COMMAND] User: {interaction.user}")
-        logger.info(f"[COMMAND] Input: '{tags}'")
+        logger.info("\n[COMMAND] Quick essence command called")
+        logger.info("[COMMAND] User: %s", interaction.user)
+        logger.info("[COMMAND] Input: '%s'", tags)
         
         # Split the input
         tag_list = tags.strip().split()
@@ -212,7 +218,7 @@ class EssenceCommandsModule:
             if possible_tags:
                 # Use the first valid combination
                 tag1_norm, tag2_norm, tag1_orig, tag2_orig = possible_tags[0]
-                logger.info(f"[COMMAND] Interpreted as: '{tag1_orig}' + '{tag2_orig}'")
+                logger.info("[COMMAND] Interpreted as: '%s' + '%s'", tag1_orig, tag2_orig)
             else:
                 await interaction.response.send_message(
                     f"Could not interpret '{tags}' as two valid tags.\nTry: `/e Fantasy Magic` or `/e female_lead strong_lead`\nTriads, Tetrads, and Pentads will become available in the future!",
@@ -264,10 +270,10 @@ class EssenceCommandsModule:
             
             async with self.session.post(url, json=data, headers=headers) as response:
                 if response.status == 200:
-                    result = json.loads(await response.text())
+                    result = await json_codec.read_json(response)
                     embed = self.create_result_embed(result, tag1_norm, tag2_norm, interaction)
                     await interaction.followup.send(embed=embed)
-                    logger.info(f"[COMMAND] Quick essence completed successfully")
+                    logger.info("[COMMAND] Quick essence completed successfully")
                 else:
                     await interaction.followup.send(
                         f"Error {response.status} from the essence database!",
@@ -275,7 +281,7 @@ class EssenceCommandsModule:
                     )
                     
         except Exception as e:
-            logger.info(f"[ERROR] Exception in quick essence: {e}")
+            logger.info("[ERROR] Exception in quick essence: %s", e)
             import traceback
             traceback.print_exc()
             
@@ -289,6 +295,12 @@ class EssenceCommandsModule:
     
     async def tags_handler(self, interaction: discord.Interaction):
         """Show all available tags with examples"""
+        embed = embed_registry.get('tags')
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    def build_tags_embed(self) -> discord.Embed:
+        """Build the /tags embed (cached by the embed registry)"""
         embed = discord.Embed(
             title="📚 Available Essence Tags",
             description=(
@@ -337,14 +349,14 @@ class EssenceCommandsModule:
         
         embed.set_footer(text="Tip: Use /e for quick combinations or /essence for autocomplete")
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return embed
     
     async def brag_handler(self, interaction: discord.Interaction):
         """Show essence combinations the user discovered first"""
         self.command_counter += 1
         
-        logger.info(f"\n[BRAG] Command called by {interaction.user}")
-        logger.info(f"[BRAG] User ID: {interaction.user.id}, Username: {interaction.user.name}#{interaction.user.discriminator}")
+        logger.info("\n[BRAG] Command called by %s", interaction.user)
+        logger.info("[BRAG] User ID: %s, Username: %s#%s", interaction.user.id, interaction.user.name, interaction.user.discriminator)
         
         await interaction.response.defer()
         
@@ -366,12 +378,12 @@ class EssenceCommandsModule:
             }
             
             async with self.session.post(url, json=data, headers=headers) as response:
-                response_text = await response.text()
-                logger.info(f"[BRAG] API Status: {response.status}")
-                logger.info(f"[BRAG] API Response: {response_text[:300]}...")
+                body = await response.read()
+                logger.info("[BRAG] API Status: %s", response.status)
+                logger.debug("[BRAG] API Response: %r...", body[:300])
                 
                 if response.status == 200:
-                    result = json.loads(response_text)
+                    result = json_codec.loads(body)
                     
                     if result['success'] and result['discoveries']:
                         embed = self.create_brag_embed(result, interaction.user)
@@ -396,16 +408,16 @@ class EssenceCommandsModule:
                         embed.set_footer(text="Keep exploring to become a legendary essence pioneer!")
                         await interaction.followup.send(embed=embed)
                         
-                    logger.info(f"[BRAG] Response sent successfully")
+                    logger.info("[BRAG] Response sent successfully")
                 else:
                     await interaction.followup.send(
                         f"❌ Error {response.status} from the discovery database!",
                         ephemeral=True
                     )
-                    logger.info(f"[ERROR] Brag API returned status {response.status}")
+                    logger.info("[ERROR] Brag API returned status %s", response.status)
         
         except Exception as e:
-            logger.info(f"[ERROR] Exception in brag command: {type(e).__name__}: {e}")
+            logger.info("[ERROR] Exception in brag command: %s: %s", type(e).__name__, e)
             import traceback
             traceback.print_exc()
             
@@ -415,13 +427,13 @@ class EssenceCommandsModule:
                     ephemeral=True
                 )
             except:
-                logger.info(f"[ERROR] Failed to send error message to user")
+                logger.info("[ERROR] Failed to send error message to user")
     
     async def rr_stats_handler(self, interaction: discord.Interaction):
         """Show comprehensive Royal Road database statistics"""
         self.command_counter += 1
         
-        logger.info(f"\n[RR-STATS] Command called by {interaction.user}")
+        logger.info("\n[RR-STATS] Command called by %s", interaction.user)
         
         await interaction.response.defer()
         
@@ -439,12 +451,12 @@ class EssenceCommandsModule:
             }
             
             async with self.session.post(url, json=data, headers=headers) as response:
-                response_text = await response.text()
-                logger.info(f"[RR-STATS] API Status: {response.status}")
-                logger.info(f"[RR-STATS] API Response: {response_text[:300]}...")
+                body = await response.read()
+                logger.info("[RR-STATS] API Status: %s", response.status)
+                logger.debug("[RR-STATS] API Response: %r...", body[:300])
                 
                 if response.status == 200:
-                    result = json.loads(response_text)
+                    result = json_codec.loads(body)
                     
                     if result['success']:
                         embed = self.create_stats_embed(result['stats'])
@@ -455,16 +467,16 @@ class EssenceCommandsModule:
                             ephemeral=True
                         )
                         
-                    logger.info(f"[RR-STATS] Response sent successfully")
+                    logger.info("[RR-STATS] Response sent successfully")
                 else:
                     await interaction.followup.send(
                         f"❌ Error {response.status} from the statistics database!",
                         ephemeral=True
                     )
-                    logger.info(f"[ERROR] RR-Stats API returned status {response.status}")
+                    logger.info("[ERROR] RR-Stats API returned status %s", response.status)
         
         except Exception as e:
-            logger.info(f"[ERROR] Exception in rr-stats command: {type(e).__name__}: {e}")
+            logger.info("[ERROR] Exception in rr-stats command: %s: %s", type(e).__name__, e)
             import traceback
             traceback.print_exc()
             
@@ -474,7 +486,7 @@ class EssenceCommandsModule:
                     ephemeral=True
                 )
             except:
-                logger.info(f"[ERROR] Failed to send error message to user")
+                logger.info("[ERROR] Failed to send error message to user")
     
     # Helper methods
     def calculate_relative_rarity(self, book_count: int, total_books: int) -> Dict[str, Any]:
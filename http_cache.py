@@ -0,0 +1,106 @@
+"""
+Conditional request cache for Discord Essence Bot
+Remembers ETag / Last-Modified validators and bodies of large WordPress
+responses so repeated queries can be answered with a 304 Not Modified
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from metrics import record_cache
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Encodings advertised to WordPress (aiohttp decodes br only with brotli installed)
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli is not None else 'gzip, deflate'
+# Maximum number of responses kept for revalidation
+HTTP_CACHE_SIZE = 256
+# Maximum total size of the cached bodies (bytes)
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]], body: Any) -> str:
+    """Stable key for a request: method, URL, query parameters and JSON body"""
+    material = json.dumps([method.upper(), url, params or {}, body], sort_keys=True, default=str)
+    return hashlib.sha1(material.encode('utf-8')).hexdigest()
+
+
+class ConditionalRequestCache:
+    """
+    LRU of response validators and bodies keyed by request
+
+    A request with a cached entry is sent with If-None-Match / If-Modified-Since;
+    a 304 answer is turned back into a 200 with the cached body, and any 200
+    carrying an ETag or Last-Modified header replaces the entry.
+    """
+
+    def __init__(self, max_size: int = HTTP_CACHE_SIZE, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        # key -> {'etag', 'last_modified', 'body'}
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.total_bytes = 0
+
+    async def request(self, session, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                      json: Any = None, headers: Optional[Dict[str, str]] = None, **kwargs) -> Tuple[int, bytes]:
+        """
+        Send a request, revalidating a cached response if there is one
+
+        Returns:
+            Tuple of (status, body); a 304 is returned as (200, cached body)
+        """
+        key = request_key(method, url, params, json)
+        entry = self.entries.get(key)
+
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        async with session.request(method, url, params=params, json=json, headers=headers, **kwargs) as response:
+            if response.status == 304 and entry is not None:
+                self.entries.move_to_end(key)
+                record_cache('http_conditional', 'hit')
+                return 200, entry['body']
+
+            body = await response.read()
+            record_cache('http_conditional', 'miss' if entry is None else 'stale')
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if response.status == 200 and (etag or last_modified):
+                self.store(key, etag, last_modified, body)
+            elif entry is not None:
+                self.discard(key)
+            return response.status, body
+
+    def store(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """Add or replace an entry, evicting the least recently used ones if needed"""
+        if len(body) > self.max_bytes:
+            return
+        self.discard(key)
+        self.entries[key] = {'etag': etag, 'last_modified': last_modified, 'body': body}
+        self.total_bytes += len(body)
+        while len(self.entries) > self.max_size or self.total_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= len(evicted['body'])
+
+    def discard(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= len(entry['body'])
+
+
+# Shared cache used by all modules
+http_cache = ConditionalRequestCache()
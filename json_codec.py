@@ -0,0 +1,69 @@
+"""
+JSON codec for Discord Essence Bot
+Uses orjson when it is installed (falling back to the stdlib json module) and
+parses WordPress responses straight from their bytes
+"""
+
+import json
+import logging
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from tracing import tracer
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Name of the codec in use, for logs and benchmarks
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers keep working
+JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+
+if orjson is not None:
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string (used as the session's json_serialize)"""
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def parse_body(body: bytes) -> Any:
+    """
+    Parse a response body inside a json.parse span
+
+    Raises:
+        JSONDecodeError: If the body is not valid JSON
+    """
+    with tracer.span('json.parse', **{'payload.bytes': len(body), 'json.backend': JSON_BACKEND}):
+        return loads(body)
+
+
+async def read_json(response) -> Any:
+    """
+    Read an aiohttp response body and parse it without decoding it to str first
+
+    Raises:
+        JSONDecodeError: If the body is not valid JSON
+    """
+    return parse_body(await response.read())
@@ -0,0 +1,813 @@
+"""
+Local stand-in for the rr-analytics/v1 WordPress API
+Serves synthetic fixtures (see api_fixtures.py) with configurable latency and
+error rates so every module can be exercised and benchmarked offline
+
+Usage:
+    python local_wp_api.py --port 8765 --books 500 --snapshots 2000 --latency-ms 80
+    WP_API_URL=http://127.0.0.1:8765 WP_BOT_TOKEN=local-token python discord_essence_bot.py
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from aiohttp import web
+
+from api_fixtures import FixtureSet, format_timestamp, unix_timestamp, format_date, SNAPSHOT_INTERVAL_HOURS, DEFAULT_BOOKS, DEFAULT_SNAPSHOTS, DEFAULT_CAMPAIGNS
+from shared_utils import extract_book_id_from_url, ALL_RS_TAGS
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+API_PREFIX = '/wp-json/rr-analytics/v1'
+# Bot token accepted by default
+DEFAULT_TOKEN = 'local-token'
+# Median simulated backend latency (ms) and lognormal spread
+DEFAULT_LATENCY_MS = 0.0
+DEFAULT_LATENCY_SIGMA = 0.5
+# Status codes used for injected errors
+DEFAULT_ERROR_STATUSES = (500, 502, 503)
+# Share of books that are already claimed by someone else
+CLAIMED_BOOK_SHARE = 0.1
+# Requests slower than this are written to the slow log with their trace id (ms)
+DEFAULT_SLOW_MS = 500.0
+
+
+def summarize_appearances(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Aggregate appearance rows (oldest first) into book -> tag -> stats"""
+    summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for row in rows:
+        stats = summary.setdefault(row['book_id'], {}).setdefault(row['tag'], {
+            'first_seen': row['scraped_at'],
+            'best_position': row['position'],
+            'best_position_dates': [],
+            'dates': [],
+            'positions': []
+        })
+        stats['last_seen'] = row['scraped_at']
+        if row['position'] < stats['best_position']:
+            stats['best_position'] = row['position']
+            stats['best_position_dates'] = []
+        if row['position'] == stats['best_position']:
+            stats['best_position_dates'].append(row['scraped_at'][:10])
+        if row['scraped_at'][:10] not in stats['dates']:
+            stats['dates'].append(row['scraped_at'][:10])
+        stats['positions'].append(row['position'])
+    return summary
+
+
+def trend_of(positions: List[int]) -> str:
+    """Trend of the last two positions (lower is better)"""
+    if len(positions) < 2:
+        return 'new'
+    if positions[-1] < positions[-2]:
+        return 'rising'
+    if positions[-1] > positions[-2]:
+        return 'falling'
+    return 'stable'
+
+
+class LocalWordPressAPI:
+    """
+    aiohttp application implementing the endpoints the bot calls
+
+    Responses follow the shapes the modules parse; write endpoints (claims,
+    campaign edits, applications) acknowledge without keeping state. Every
+    API request goes through a middleware that checks the bot token, sleeps
+    for a lognormal latency and fails with error_rate probability.
+    """
+
+    def __init__(self, fixtures: FixtureSet, token: Optional[str] = DEFAULT_TOKEN,
+                 latency_ms: float = DEFAULT_LATENCY_MS, latency_sigma: float = DEFAULT_LATENCY_SIGMA,
+                 error_rate: float = 0.0, error_statuses=DEFAULT_ERROR_STATUSES,
+                 premium_users: Optional[List[str]] = None, admin_ids: Optional[List[str]] = None,
+                 verified_servers: Optional[List[str]] = None, seed: int = 1,
+                 slow_ms: float = DEFAULT_SLOW_MS, traces_file: Optional[str] = None,
+                 etags: bool = False, compress: bool = False):
+        self.fixtures = fixtures
+        self.token = token
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.premium_users = set(premium_users or [])
+        self.admin_ids = set(admin_ids or [])
+        self.verified_servers = set(verified_servers or [])
+        self.random = random.Random(seed)
+        self.slow_ms = slow_ms
+        self.traces_file = traces_file
+        self.etags = etags
+        self.compress = compress
+
+        self.appearances = summarize_appearances(fixtures.rs_appearances)
+        self.latest_rs_scrape = {}
+        for row in fixtures.rs_appearances:
+            self.latest_rs_scrape[row['tag']] = row['scraped_at']
+        self.latest_ptw = {}
+        for snapshot in fixtures.ptw_snapshots:
+            self.latest_ptw[snapshot['tag']] = snapshot
+
+        self.request_counts = Counter()
+        self.error_counts = Counter()
+        self.not_modified_count = 0
+        self.next_claim_id = 1
+        self.runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+    # Application setup
+    def build_app(self) -> web.Application:
+        """Create the aiohttp application with every route registered"""
+        app = web.Application(middlewares=[self.simulation_middleware])
+        routes = [
+            web.get(f'{API_PREFIX}/health', self.health),
+            web.post(f'{API_PREFIX}/essence-combination', self.essence_combination),
+            web.post(f'{API_PREFIX}/user-discoveries', self.user_discoveries),
+            web.post(f'{API_PREFIX}/book-chart-data', self.book_chart_data),
+            web.post(f'{API_PREFIX}/rising-stars-prediction', self.rising_stars_prediction),
+            web.post(f'{API_PREFIX}/rising-stars-chart', self.rising_stars_chart),
+            web.post(f'{API_PREFIX}/rising-stars-run', self.rising_stars_run),
+            web.post(f'{API_PREFIX}/rising-stars-appearances', self.rising_stars_appearances),
+            web.post(f'{API_PREFIX}/rising-stars-candidates', self.rising_stars_candidates),
+            web.post(f'{API_PREFIX}/popular-this-week', self.popular_this_week),
+            web.post(f'{API_PREFIX}/others-also-liked', self.others_also_liked),
+
+            web.get(f'{API_PREFIX}/shoutout/campaigns', self.list_campaigns),
+            web.post(f'{API_PREFIX}/shoutout/campaigns', self.create_campaign),
+            web.get(f'{API_PREFIX}/shoutout/campaigns/{{campaign_id}}/details', self.campaign_details),
+            web.post(f'{API_PREFIX}/shoutout/campaigns/{{campaign_id}}/{{action}}', self.acknowledge),
+            web.get(f'{API_PREFIX}/shoutout/book-stats', self.shoutout_book_stats),
+            web.get(f'{API_PREFIX}/shoutout/my-campaigns/{{user_id}}', self.my_campaigns),
+            web.get(f'{API_PREFIX}/shoutout/my-applications/{{user_id}}', self.my_applications),
+            web.post(f'{API_PREFIX}/shoutout/applications', self.create_application),
+            web.post(f'{API_PREFIX}/shoutout/applications/{{application_id}}/status', self.acknowledge),
+
+            web.post(f'{API_PREFIX}/book-claim/submit', self.submit_claim),
+            web.get(f'{API_PREFIX}/book-claim/pending', self.pending_claims),
+            web.get(f'{API_PREFIX}/book-claim/user-books', self.user_books),
+            web.get(f'{API_PREFIX}/book-claim/check-authorization', self.check_authorization),
+            web.get(f'{API_PREFIX}/book-claim/check-supermod', self.check_supermod),
+            web.get(f'{API_PREFIX}/book-claim/check-bot-admin', self.check_bot_admin),
+            web.get(f'{API_PREFIX}/book-claim/check-server', self.check_server),
+            web.get(f'{API_PREFIX}/book-claim/list-moderators', self.list_moderators),
+            web.get(f'{API_PREFIX}/book-claim/notification-channel', self.notification_channel),
+            web.post(f'{API_PREFIX}/book-claim/{{action}}', self.acknowledge),
+
+            web.get('/_standin/stats', self.stats),
+            web.post('/v1/traces', self.receive_traces)
+        ]
+        app.add_routes(routes)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving in the running event loop
+
+        Returns:
+            Base URL to use as WP_API_URL
+        """
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+
+        bound_port = self.runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        logger.info(f"[LOCAL_WP_API] Serving {len(self.fixtures.books)} books at {self.url}")
+        return self.url
+
+    async def stop(self):
+        """Shut the server down"""
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    @web.middleware
+    async def simulation_middleware(self, request: web.Request, handler):
+        """Apply auth, simulated latency and injected errors to API routes"""
+        if not request.path.startswith(API_PREFIX):
+            return await handler(request)
+
+        started = time.perf_counter()
+        try:
+            return await self.simulate(request, handler)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= self.slow_ms:
+                # Stand-in for the backend slow log, keyed by the bot's trace id
+                logger.warning(
+                    f"[LOCAL_WP_API] Slow request {request.method} {request.path} "
+                    f"{elapsed_ms:.0f}ms trace_id={request.headers.get('X-Trace-Id', '-')}"
+                )
+
+    async def simulate(self, request: web.Request, handler):
+        """Latency, error injection and token check for one API request"""
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        self.request_counts[route] += 1
+
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.random.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000)
+
+        if self.error_rate > 0 and self.random.random() < self.error_rate:
+            status = self.random.choice(self.error_statuses)
+            self.error_counts[route] += 1
+            return web.json_response(
+                {'code': 'simulated_error', 'message': f"Simulated error {status}"},
+                status=status
+            )
+
+        if self.token and not request.path.endswith('/health'):
+            params = await self.read_params(request)
+            supplied = params.get('bot_token') or request.headers.get('Authorization', '').replace('Bearer ', '')
+            if supplied != self.token:
+                return web.json_response(
+                    {'code': 'rest_forbidden', 'message': 'Invalid bot token'},
+                    status=403
+                )
+
+        response = await handler(request)
+        return self.finalize(request, response)
+
+    def finalize(self, request: web.Request, response: web.StreamResponse) -> web.StreamResponse:
+        """Optionally add an ETag (answering matching If-None-Match with 304) and compress"""
+        if self.etags and isinstance(response, web.Response) and response.status == 200 and response.body:
+            etag = '"' + hashlib.sha1(response.body).hexdigest() + '"'
+            if request.headers.get('If-None-Match') == etag:
+                self.not_modified_count += 1
+                return web.Response(status=304, headers={'ETag': etag})
+            response.headers['ETag'] = etag
+        if self.compress:
+            response.enable_compression()
+        return response
+
+    async def read_params(self, request: web.Request) -> Dict[str, Any]:
+        """Query parameters merged with the JSON body (parsed once per request)"""
+        if 'params' not in request:
+            params = dict(request.query)
+            if request.can_read_body:
+                try:
+                    body = await request.json()
+                    if isinstance(body, dict):
+                        params.update(body)
+                except json.JSONDecodeError:
+                    pass
+            request['params'] = params
+        return request['params']
+
+    def resolve_book(self, book_input: Any) -> Optional[str]:
+        """Map a book ID, URL or exact title to a fixture book ID"""
+        book_input = str(book_input or '').strip()
+        book_id = extract_book_id_from_url(book_input)
+        if book_id is not None:
+            return str(book_id) if str(book_id) in self.fixtures.books else None
+        for candidate_id, book in self.fixtures.books.items():
+            if book['title'].lower() == book_input.lower():
+                return candidate_id
+        return None
+
+    def daily_last(self, series: Dict[str, List], start_date: str, end_date: str) -> Dict[str, List]:
+        """Last snapshot of each day between two dates (inclusive)"""
+        by_day = {}
+        for index, timestamp in enumerate(series['timestamps']):
+            day = format_date(timestamp)
+            if start_date <= day <= end_date:
+                by_day[day] = index
+        return {
+            'dates': list(by_day),
+            'followers': [series['followers'][i] for i in by_day.values()],
+            'total_views': [series['total_views'][i] for i in by_day.values()]
+        }
+
+    # General endpoints
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'ok', 'books': len(self.fixtures.books)})
+
+    async def stats(self, request: web.Request) -> web.Response:
+        """Request and injected error counts per route"""
+        return web.json_response({
+            'requests': dict(self.request_counts),
+            'errors': dict(self.error_counts),
+            'not_modified': self.not_modified_count
+        })
+
+    async def receive_traces(self, request: web.Request) -> web.Response:
+        """Collector stand-in: append OTLP/JSON trace exports to traces_file"""
+        body = await request.text()
+        if self.traces_file:
+            with open(self.traces_file, 'a') as f:
+                f.write(body.replace('\n', ' ') + '\n')
+        return web.json_response({'partialSuccess': {}})
+
+    async def acknowledge(self, request: web.Request) -> web.Response:
+        """Generic success for write endpoints"""
+        params = await self.read_params(request)
+        return web.json_response({
+            'success': True,
+            'message': 'OK',
+            'new_status': params.get('status') or params.get('new_status') or 'active'
+        })
+
+    # Essence endpoints
+    async def essence_combination(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        tags = sorted(str(tag) for tag in params.get('tags', []))
+        if len(tags) != 2:
+            return web.json_response({'success': False, 'message': 'Two tags are required'}, status=400)
+
+        rng = self.fixtures.rng('essence', *tags)
+        total_books = len(self.fixtures.books) * 100
+        book_count = int(total_books * rng.betavariate(0.5, 8))
+        popular = self.fixtures.books[rng.choice(self.fixtures.book_ids)]
+        sample = self.fixtures.books[rng.choice(self.fixtures.book_ids)]
+
+        def book_card(book):
+            return {
+                'title': book['title'],
+                'url': book['url'],
+                'author': book['author_name'],
+                'followers': book['base_followers'],
+                'rating': book['rating'],
+                'pages': book['pages']
+            }
+
+        return web.json_response({
+            'success': True,
+            'combination_name': f"{tags[0]} {tags[1]} Essence",
+            'book_count': book_count,
+            'total_books': total_books,
+            'percentage': round(book_count / total_books * 100, 2),
+            'popular_book': book_card(popular) if book_count else None,
+            'random_book': book_card(sample) if book_count > 1 else None
+        })
+
+    async def user_discoveries(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'discoveries': [], 'stats': {}})
+
+    # Chart and Rising Stars endpoints
+    async def book_chart_data(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = self.resolve_book(params.get('book_input'))
+        if book_id is None:
+            return web.json_response({'success': False, 'message': 'Book not found in the database.'})
+
+        series = self.fixtures.get_series(book_id)
+        timestamps = series['timestamps']
+        end = self.fixtures.end_time
+
+        if params.get('since'):
+            since = int(params['since'])
+            keep = [ts > since for ts in timestamps]
+            filter_applied = f"Since {params['since']}"
+        elif params.get('days'):
+            start = unix_timestamp(end - timedelta(days=int(params['days'])))
+            keep = [ts >= start for ts in timestamps]
+            filter_applied = f"Last {params['days']} days"
+        elif params.get('start_date'):
+            end_date = params.get('end_date') or '9999-12-31'
+            keep = [params['start_date'] <= format_date(ts) <= end_date for ts in timestamps]
+            filter_applied = f"{params['start_date']} to {params['end_date']}" if params.get('end_date') else f"From {params['start_date']}"
+        else:
+            keep = [True] * len(timestamps)
+            filter_applied = 'All time'
+
+        chart_data = {name: [value for value, kept in zip(values, keep) if kept] for name, values in series.items()}
+        return web.json_response({
+            'success': True,
+            'book_info': self.fixtures.public_book_info(book_id),
+            'chart_data': chart_data,
+            'data_info': {
+                'total_snapshots': len(chart_data['timestamps']),
+                'filter_applied': filter_applied
+            }
+        })
+
+    async def rising_stars_prediction(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = self.resolve_book(params.get('book_input'))
+        if book_id is None:
+            return web.json_response({'success': False, 'eligible': False, 'message': 'Book not found'})
+
+        book = self.fixtures.books[book_id]
+        followers = self.fixtures.get_series(book_id)['followers']
+        per_day = 24 // SNAPSHOT_INTERVAL_HOURS
+        week_growth = followers[-1] - followers[-min(len(followers), 7 * per_day + 1)]
+        recent_growth = followers[-1] - followers[-min(len(followers), 3 * per_day + 1)]
+        eligible = not book['has_rs_run'] and book['status'] == 'ONGOING'
+
+        result = {
+            'success': True,
+            'eligible': eligible,
+            'reason': None if eligible else 'Book already reached Main Rising Stars or is not ongoing',
+            'is_premium': False,
+            'growth_metrics': {
+                'week_growth': week_growth,
+                'recent_avg_growth': recent_growth / 3
+            }
+        }
+        if params.get('discord_username') and params['discord_username'] in self.premium_users:
+            result['is_premium'] = True
+        return web.json_response(result)
+
+    async def rising_stars_chart(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = self.resolve_book(params.get('book_id'))
+        main = self.appearances.get(book_id or '', {}).get('main')
+        if book_id is None or main is None:
+            return web.json_response({'success': False, 'message': 'This book has not appeared on Main Rising Stars.'})
+
+        days_before = int(params.get('days_before', 7))
+        days_after = int(params.get('days_after', 7))
+        first = datetime.strptime(main['first_seen'][:10], '%Y-%m-%d')
+        last = datetime.strptime(main['last_seen'][:10], '%Y-%m-%d')
+        series = self.fixtures.get_series(book_id)
+
+        window = self.daily_last(
+            series,
+            (first - timedelta(days=days_before)).strftime('%Y-%m-%d'),
+            (last + timedelta(days=days_after)).strftime('%Y-%m-%d')
+        )
+        before = [i for i, day in enumerate(window['dates']) if day < main['first_seen'][:10]]
+        during = [i for i, day in enumerate(window['dates']) if main['first_seen'][:10] <= day <= main['last_seen'][:10]]
+
+        def rate(indices, column):
+            if len(indices) < 2:
+                return None
+            return (window[column][indices[-1]] - window[column][indices[0]]) / (len(indices) - 1)
+
+        growth_analysis = {
+            'before_rs': {
+                'has_data': len(before) >= 2,
+                'follower_growth_rate': rate(before, 'followers'),
+                'total_follower_change': window['followers'][before[-1]] - window['followers'][before[0]] if len(before) >= 2 else None,
+                'view_growth_rate': rate(before, 'total_views')
+            },
+            'during_rs': {
+                'follower_growth_rate': rate(during, 'followers'),
+                'view_growth_rate': rate(during, 'total_views')
+            }
+        }
+
+        return web.json_response({
+            'success': True,
+            'book_info': self.fixtures.public_book_info(book_id),
+            'chart_data': window if params.get('include_chart_data', True) else {},
+            'rs_info': {
+                'first_appearance': main['first_seen'][:10],
+                'last_appearance': main['last_seen'][:10],
+                'best_position': main['best_position'],
+                'best_position_dates': main['best_position_dates'],
+                'days_on_list': len(main['dates'])
+            },
+            'growth_analysis': growth_analysis
+        })
+
+    async def rising_stars_run(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = self.resolve_book(params.get('book_id'))
+        if book_id is None:
+            return web.json_response({'success': True, 'book_info': {}, 'rising_stars_data': {}})
+
+        rs_data = {}
+        for tag in params.get('tags') or ALL_RS_TAGS:
+            stats = self.appearances.get(book_id, {}).get(tag)
+            if not stats:
+                continue
+            on_list_now = stats['last_seen'] == self.latest_rs_scrape.get(tag)
+            rs_data[tag] = {
+                'first_seen': stats['first_seen'][:10],
+                'last_seen': stats['last_seen'][:10],
+                'current_position': stats['positions'][-1] if on_list_now else None,
+                'best_position': stats['best_position'],
+                'days_on_list': len(stats['dates']),
+                'appearances': len(stats['positions']),
+                'trend': trend_of(stats['positions']) if on_list_now else None
+            }
+
+        return web.json_response({
+            'success': True,
+            'book_info': self.fixtures.public_book_info(book_id),
+            'rising_stars_data': rs_data
+        })
+
+    async def rising_stars_appearances(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        since = params.get('since') or ''
+        rows = [row for row in self.fixtures.rs_appearances if row['scraped_at'] > since]
+        return web.json_response({
+            'success': True,
+            'appearances': rows,
+            'books': {row['book_id']: self.fixtures.public_book_info(row['book_id']) for row in rows},
+            'timestamp': rows[-1]['scraped_at'] if rows else params.get('since')
+        })
+
+    async def rising_stars_candidates(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        days = int(params.get('days', 15))
+        end = self.fixtures.end_time
+        start_date = (end - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        end_date = end.strftime('%Y-%m-%d')
+
+        books = []
+        for book_id, book in self.fixtures.books.items():
+            window = self.daily_last(self.fixtures.get_series(book_id), start_date, end_date)
+            tags = self.appearances.get(book_id, {})
+            books.append({
+                'book_id': book_id,
+                'title': book['title'],
+                'author_name': book['author_name'],
+                'url': book['url'],
+                'daily_followers': window['followers'],
+                'has_main_rs': 'main' in tags,
+                'has_old_records': False,
+                'old_max_followers': 0,
+                'genre_rs_count': len([tag for tag in tags if tag != 'main'])
+            })
+
+        return web.json_response({'success': True, 'books': books})
+
+    async def popular_this_week(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        action = params.get('action')
+
+        if action == 'get_ptw_snapshots':
+            since = params.get('since') or ''
+            snapshots = [s for s in self.fixtures.ptw_snapshots if s['scraped_at'] > since]
+            return web.json_response({
+                'success': True,
+                'snapshots': snapshots,
+                'timestamp': snapshots[-1]['scraped_at'] if snapshots else params.get('since')
+            })
+
+        if action == 'get_ptw_list':
+            current = self.latest_ptw.get(params.get('tag'))
+            if current is None:
+                return web.json_response({'success': False, 'message': 'No data for this tag'})
+            context_info = {}
+            context_id = str(params.get('context_book_id') or '')
+            if context_id:
+                for book in current['books']:
+                    if str(book['book_id']) == context_id:
+                        context_info = {'title': book['title'], 'position': book['position'], 'weekly_views': book['weekly_views']}
+                if not context_info and context_id in self.fixtures.books:
+                    context_info = {'title': self.fixtures.books[context_id]['title'], 'position': None, 'weekly_views': 0}
+            return web.json_response({
+                'success': True,
+                'books': current['books'][:int(params.get('count', 10))],
+                'context_info': context_info,
+                'timestamp': current['scraped_at']
+            })
+
+        if action == 'check_book_ptw':
+            book_id = self.resolve_book(params.get('book_id'))
+            if book_id is None:
+                return web.json_response({'success': False, 'message': 'Book not found'})
+            rows = [
+                {'book_id': book_id, 'tag': snapshot['tag'], 'position': book['position'],
+                 'scraped_at': snapshot['scraped_at'], 'weekly_views': book['weekly_views']}
+                for snapshot in self.fixtures.ptw_snapshots
+                if snapshot['tag'] in (params.get('tags') or ALL_RS_TAGS)
+                for book in snapshot['books'] if str(book['book_id']) == book_id
+            ]
+            appearances = {}
+            for tag, stats in summarize_appearances(rows).get(book_id, {}).items():
+                latest = self.latest_ptw.get(tag)
+                on_list_now = latest is not None and stats['last_seen'] == latest['scraped_at']
+                last_row = [row for row in rows if row['tag'] == tag][-1]
+                appearances[tag] = {
+                    'current_position': stats['positions'][-1] if on_list_now else None,
+                    'current_views': last_row['weekly_views'] if on_list_now else None,
+                    'best_position': stats['best_position'],
+                    'best_position_date': stats['best_position_dates'][0],
+                    'first_seen': stats['first_seen'][:10],
+                    'last_seen': stats['last_seen'][:10],
+                    'appearances': len(stats['positions']),
+                    'days_on_list': len(stats['dates']),
+                    'trend': trend_of(stats['positions']) if on_list_now else None
+                }
+            book = self.fixtures.books[book_id]
+            return web.json_response({
+                'success': True,
+                'book_info': {'title': book['title'], 'author': book['author_name']},
+                'ptw_appearances': appearances
+            })
+
+        return web.json_response({'success': False, 'message': f"Unknown action: {action}"}, status=400)
+
+    async def others_also_liked(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = self.resolve_book(params.get('book_input'))
+        if book_id is None:
+            return web.json_response({'success': False, 'message': 'Book not found in the database.'})
+
+        rng = self.fixtures.rng('also-liked', book_id)
+        referencing = rng.sample(self.fixtures.book_ids, min(len(self.fixtures.books), rng.randint(0, 25)))
+        books = [
+            {
+                'title': self.fixtures.books[other]['title'],
+                'url': self.fixtures.books[other]['url'],
+                'author': self.fixtures.books[other]['author_name'],
+                'followers': self.fixtures.books[other]['base_followers'],
+                'rating': self.fixtures.books[other]['rating'],
+                'status': self.fixtures.books[other]['status'],
+                'timestamp': format_timestamp(self.fixtures.end_time)
+            }
+            for other in referencing if other != book_id
+        ]
+        books.sort(key=lambda book: book['followers'], reverse=True)
+
+        return web.json_response({
+            'success': True,
+            'book_info': self.fixtures.public_book_info(book_id),
+            'books': books,
+            'total_books': len(books),
+            'user_tier': 'free'
+        })
+
+    # Shoutout endpoints
+    async def list_campaigns(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        show_mine = params.get('show_mine') == 'true'
+        campaigns = []
+        for campaign in self.fixtures.campaigns:
+            if show_mine:
+                if campaign['discord_user_id'] != params.get('discord_user_id'):
+                    continue
+            elif campaign['campaign_status'] != 'active':
+                continue
+            if params.get('genre') and campaign['genre'] != params['genre']:
+                continue
+            if params.get('server_only') == 'true' and campaign['server_id'] != params.get('server_id'):
+                continue
+            if params.get('min_followers') and (campaign['max_followers'] or 10 ** 9) < int(params['min_followers']):
+                continue
+            if params.get('max_followers') and campaign['min_followers'] > int(params['max_followers']):
+                continue
+            campaigns.append(campaign)
+
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', len(campaigns) or 1))
+        page = campaigns[offset:offset + limit]
+        return web.json_response({
+            'success': True,
+            'campaigns': page,
+            'total': len(campaigns),
+            'has_more': offset + len(page) < len(campaigns)
+        })
+
+    async def create_campaign(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'campaign_id': len(self.fixtures.campaigns) + 1})
+
+    async def campaign_details(self, request: web.Request) -> web.Response:
+        campaign_id = int(request.match_info['campaign_id'])
+        for campaign in self.fixtures.campaigns:
+            if campaign['id'] == campaign_id:
+                return web.json_response(campaign)
+        return web.json_response({'code': 'not_found', 'message': 'Campaign not found'}, status=404)
+
+    async def shoutout_book_stats(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = self.resolve_book(params.get('rr_book_id') or params.get('book_url'))
+        if book_id is None:
+            return web.json_response({'success': False, 'message': 'Book not found'})
+        series = self.fixtures.get_series(book_id)
+        return web.json_response({
+            'success': True,
+            'followers': series['followers'][-1],
+            'total_views': series['total_views'][-1],
+            'chapters': series['chapters'][-1],
+            'rating': self.fixtures.books[book_id]['rating']
+        })
+
+    async def my_campaigns(self, request: web.Request) -> web.Response:
+        user_id = request.match_info['user_id']
+        return web.json_response({
+            'success': True,
+            'campaigns': [c for c in self.fixtures.campaigns if c['discord_user_id'] == user_id]
+        })
+
+    async def my_applications(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'applications': []})
+
+    async def create_application(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'application_id': self.random.randint(1, 10 ** 6)})
+
+    # Book claim endpoints
+    async def submit_claim(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        book_id = str(params.get('royal_road_book_id') or '')
+        book = self.fixtures.books.get(book_id)
+        if book is None:
+            return web.json_response({'success': False, 'error': 'not_found', 'message': 'Book not found in the database'})
+
+        if self.fixtures.rng('claimed', book_id).random() < CLAIMED_BOOK_SHARE:
+            return web.json_response({'success': False, 'error': 'already_claimed', 'owner_name': book['author_name']})
+
+        claim_id = self.next_claim_id
+        self.next_claim_id += 1
+        return web.json_response({
+            'success': True,
+            'claim_id': claim_id,
+            'book_title': book['title'],
+            'server_verified': str(params.get('server_id')) in self.verified_servers
+        })
+
+    async def pending_claims(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'claims': []})
+
+    async def user_books(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        books = self.fixtures.get_claims(params.get('discord_user_id', ''))
+        return web.json_response({'success': True, 'books': books, 'total_count': len(books)})
+
+    async def check_authorization(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        return web.json_response({'authorized': params.get('discord_user_id') in self.admin_ids})
+
+    async def check_supermod(self, request: web.Request) -> web.Response:
+        return web.json_response({'is_supermod': False})
+
+    async def check_bot_admin(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        return web.json_response({'is_admin': params.get('discord_user_id') in self.admin_ids})
+
+    async def check_server(self, request: web.Request) -> web.Response:
+        params = await self.read_params(request)
+        return web.json_response({'verified': params.get('server_id') in self.verified_servers})
+
+    async def list_moderators(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'moderators': []})
+
+    async def notification_channel(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'channel_id': None})
+
+
+async def serve(api: LocalWordPressAPI, host: str, port: int):
+    """Run the stand-in until interrupted"""
+    url = await api.start(host, port)
+    print(f"Local WordPress API running at {url} (bot token: {api.token})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await api.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the rr-analytics WordPress API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', help="Directory written by api_fixtures.py (generated in memory if omitted)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--books', type=int, default=DEFAULT_BOOKS)
+    parser.add_argument('--snapshots', type=int, default=DEFAULT_SNAPSHOTS, help="Snapshots per book")
+    parser.add_argument('--campaigns', type=int, default=DEFAULT_CAMPAIGNS)
+    parser.add_argument('--token', default=DEFAULT_TOKEN, help="Accepted bot token ('' to accept any)")
+    parser.add_argument('--latency-ms', type=float, default=DEFAULT_LATENCY_MS, help="Median simulated latency")
+    parser.add_argument('--latency-sigma', type=float, default=DEFAULT_LATENCY_SIGMA, help="Lognormal latency spread")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests failing with 5xx")
+    parser.add_argument('--premium-user', action='append', default=[], help="Discord username treated as premium")
+    parser.add_argument('--admin-id', action='append', default=[], help="Discord user ID treated as bot admin")
+    parser.add_argument('--verified-server', action='append', default=[], help="Verified Discord server ID")
+    parser.add_argument('--slow-ms', type=float, default=DEFAULT_SLOW_MS, help="Log requests slower than this with their trace id")
+    parser.add_argument('--traces-file', help="Accept OTLP/JSON trace exports on /v1/traces and append them here")
+    parser.add_argument('--etags', action='store_true', help="Send ETags and answer matching If-None-Match with 304")
+    parser.add_argument('--compress', action='store_true', help="Compress responses per Accept-Encoding")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.fixtures:
+        fixtures = FixtureSet.load(args.fixtures)
+    else:
+        fixtures = FixtureSet(args.seed, args.books, args.snapshots, args.campaigns)
+
+    api = LocalWordPressAPI(
+        fixtures,
+        token=args.token or None,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        premium_users=args.premium_user,
+        admin_ids=args.admin_id,
+        verified_servers=args.verified_server,
+        seed=args.seed,
+        slow_ms=args.slow_ms,
+        traces_file=args.traces_file,
+        etags=args.etags,
+        compress=args.compress
+    )
+
+    try:
+        asyncio.run(serve(api, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Event loop watchdog for Discord Essence Bot
+Measures event loop lag continuously and, when the loop is blocked for longer
+than a threshold, samples the loop thread's stack from a background thread so
+the blocking code (and the command that ran it) ends up in the logs
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from metrics import metrics, event_loop_lag, event_loop_lag_last, LATENCY_BUCKETS
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# How often the loop heartbeat runs and the watchdog thread checks it (seconds)
+WATCHDOG_INTERVAL = 0.05
+# The loop counts as blocked once the heartbeat is this late (seconds)
+LOOP_BLOCK_THRESHOLD = float(os.getenv('LOOP_BLOCK_THRESHOLD_MS', '250')) / 1000
+# Innermost frames kept in a sampled stack
+STACK_DEPTH = 20
+# The same blocking stack is logged at most once per this many seconds
+REPORT_COOLDOWN = 60
+
+loop_blocks = metrics.histogram(
+    'bot_event_loop_block_seconds',
+    'Duration of event loop stalls longer than the watchdog threshold, by command',
+    ['command'],
+    buckets=LATENCY_BUCKETS
+)
+
+
+def command_from_stack(frame) -> str:
+    """Find the app command running in a stack by looking for its interaction"""
+    while frame is not None:
+        try:
+            interaction = frame.f_locals.get('interaction')
+        except Exception:
+            interaction = None
+        command = getattr(interaction, 'command', None)
+        name = getattr(command, 'qualified_name', None)
+        if name:
+            return name
+        frame = frame.f_back
+    return 'none'
+
+
+class LoopWatchdog:
+    """
+    Detects callbacks that block the event loop
+
+    A heartbeat task on the loop records when it last ran (and how late it
+    was, which feeds the loop lag metrics). A daemon thread checks the
+    heartbeat; while it is overdue the thread samples the loop thread's
+    stack, and once the loop recovers the most frequent stack is logged
+    with the stall duration and the command it belongs to.
+    """
+
+    def __init__(self, threshold: float = LOOP_BLOCK_THRESHOLD, interval: float = WATCHDOG_INTERVAL):
+        self.threshold = threshold
+        self.interval = interval
+        self.last_beat = time.monotonic()
+        self.loop_thread_id: Optional[int] = None
+        self.task: Optional[asyncio.Task] = None
+        self.thread: Optional[threading.Thread] = None
+        self.last_reported: Dict[Tuple, float] = {}
+
+    def start(self):
+        """Start the heartbeat and the watchdog thread (only once)"""
+        if self.task is not None:
+            return
+        self.loop_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.task = asyncio.create_task(self.heartbeat())
+        self.thread = threading.Thread(target=self.watch, name='loop-watchdog', daemon=True)
+        self.thread.start()
+
+    async def heartbeat(self):
+        """Tick on the loop and record how late each tick was"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            event_loop_lag.observe(lag)
+            event_loop_lag_last.set(lag)
+            self.last_beat = time.monotonic()
+
+    def sample(self):
+        """Capture the loop thread's current stack and command"""
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return None, 'none'
+        stack = tuple(
+            (entry.filename, entry.lineno, entry.name, entry.line)
+            for entry in traceback.extract_stack(frame, limit=STACK_DEPTH)
+        )
+        return stack, command_from_stack(frame)
+
+    def watch(self):
+        """Watchdog thread: sample the loop thread while the heartbeat is overdue"""
+        while True:
+            time.sleep(self.interval)
+            beat = self.last_beat
+            if time.monotonic() - beat < self.threshold + self.interval:
+                continue
+
+            stacks = Counter()
+            commands = Counter()
+            while self.last_beat == beat:
+                stack, command = self.sample()
+                if stack:
+                    stacks[stack] += 1
+                    commands[command] += 1
+                time.sleep(self.interval)
+
+            # The loop is running again; the last beat is when it recovered
+            blocked_for = self.last_beat - beat
+            if stacks:
+                try:
+                    self.report(blocked_for, stacks, commands)
+                except Exception as e:
+                    logger.error(f"[LOOP_WATCHDOG] Failed to report blocked loop: {e}")
+
+    def report(self, blocked_for: float, stacks: Counter, commands: Counter):
+        """Record a stall and log its most frequently sampled stack"""
+        command = commands.most_common(1)[0][0]
+        loop_blocks.observe(blocked_for, command)
+
+        stack, hits = stacks.most_common(1)[0]
+        now = time.monotonic()
+        if now - self.last_reported.get(stack, 0) < REPORT_COOLDOWN:
+            return
+        self.last_reported[stack] = now
+
+        formatted = ''.join(traceback.format_list(list(stack)))
+        logger.warning(
+            f"[LOOP_WATCHDOG] Event loop blocked for {blocked_for * 1000:.0f}ms "
+            f"in command '{command}' ({hits}/{sum(stacks.values())} samples in this stack):\n{formatted}"
+        )
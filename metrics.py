@@ -0,0 +1,384 @@
+"""
+Metrics for Discord Essence Bot
+Latency histograms, counters and gauges for commands, outbound HTTP calls,
+caches, chart rendering and the event loop, served in Prometheus text format
+"""
+
+import logging
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+import discord
+from aiohttp import web
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Address of the /metrics endpoint (METRICS_PORT=0 disables it)
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.getenv('METRICS_PORT', '9108'))
+# Histogram buckets for command and HTTP latencies (seconds)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Histogram buckets for event loop lag (seconds)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+# Prefix of the WordPress plugin routes, stripped from endpoint labels
+WP_ROUTE_PREFIX = '/wp-json/rr-analytics/v1'
+# Path segments longer than this are treated as tokens (e.g. interaction tokens)
+TOKEN_SEGMENT_LENGTH = 32
+
+
+def format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """Format a label set as {name="value",...}"""
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class holding the name, help text and label names of a metric"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        # Render workers observe from their own thread
+        self.lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing count per label set"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values, amount: float = 1):
+        key = tuple(str(value) for value in label_values)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self.lock:
+            items = sorted(self.values.items())
+        return self.header() + [
+            f"{self.name}{format_labels(self.labels, key)} {format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down
+
+    A gauge created with a function reads its value from it at scrape time
+    """
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 func: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+        self.func = func
+
+    def set(self, value: float, *label_values):
+        with self.lock:
+            self.values[tuple(str(v) for v in label_values)] = value
+
+    def inc(self, *label_values, amount: float = 1):
+        key = tuple(str(value) for value in label_values)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, *label_values, amount: float = 1):
+        self.inc(*label_values, amount=-amount)
+
+    def render(self) -> List[str]:
+        if self.func is not None:
+            return self.header() + [f"{self.name} {format_value(self.func())}"]
+        with self.lock:
+            items = sorted(self.values.items())
+        return self.header() + [
+            f"{self.name}{format_labels(self.labels, key)} {format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(Metric):
+    """Cumulative bucket counts, sum and count per label set"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # label values -> [bucket counts..., sum, count]
+        self.values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *label_values):
+        key = tuple(str(v) for v in label_values)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        with self.lock:
+            items = sorted((key, list(state)) for key, state in self.values.items())
+
+        lines = self.header()
+        for key, state in items:
+            cumulative = 0
+            for index, bound in enumerate(self.buckets):
+                cumulative += state[index]
+                labels = format_labels(self.labels, key, f'le="{format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for /metrics"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric (or return the one already registered under its name)"""
+        return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = (),
+              func: Optional[Callable[[], float]] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labels, func))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics.values():
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                logger.error(f"[METRICS] Failed to render {metric.name}: {e}")
+        return '\n'.join(lines) + '\n'
+
+
+# Shared registry used by all modules
+metrics = MetricsRegistry()
+
+command_duration = metrics.histogram(
+    'bot_command_duration_seconds',
+    'Time spent in slash command callbacks',
+    ['command', 'outcome']
+)
+http_request_duration = metrics.histogram(
+    'bot_http_request_duration_seconds',
+    'Outbound HTTP request latency until response headers',
+    ['service', 'method', 'endpoint']
+)
+http_request_errors = metrics.counter(
+    'bot_http_request_errors_total',
+    'Outbound HTTP requests that failed, by status code or exception type',
+    ['service', 'endpoint', 'status']
+)
+cache_requests = metrics.counter(
+    'bot_cache_requests_total',
+    'Cache lookups by cache and result (hit, miss, stale)',
+    ['cache', 'result']
+)
+chart_render_duration = metrics.histogram(
+    'bot_chart_render_duration_seconds',
+    'Time spent rendering a chart on the render worker',
+    ['chart']
+)
+chart_render_queue_depth = metrics.gauge(
+    'bot_chart_render_queue_depth',
+    'Chart renders submitted to the render worker and not finished yet'
+)
+event_loop_lag = metrics.histogram(
+    'bot_event_loop_lag_seconds',
+    'Delay between when a loop timer was due and when it ran',
+    buckets=LOOP_LAG_BUCKETS
+)
+event_loop_lag_last = metrics.gauge(
+    'bot_event_loop_lag_last_seconds',
+    'Most recent event loop lag sample'
+)
+
+
+def record_cache(cache: str, result: str):
+    """Count a cache lookup ('hit', 'miss' or 'stale')"""
+    cache_requests.inc(cache, result)
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Reduce a request path to a low-cardinality endpoint label
+
+    Args:
+        path: URL path, e.g. /wp-json/rr-analytics/v1/shoutout/campaigns/42
+
+    Returns:
+        Path relative to the plugin routes with IDs and tokens replaced,
+        e.g. /shoutout/campaigns/:id
+    """
+    if path.startswith(WP_ROUTE_PREFIX):
+        path = path[len(WP_ROUTE_PREFIX):] or '/'
+    segments = []
+    for segment in path.split('/'):
+        if segment.isdigit():
+            segments.append(':id')
+        elif len(segment) > TOKEN_SEGMENT_LENGTH:
+            segments.append(':token')
+        else:
+            segments.append(segment)
+    return '/'.join(segments)
+
+
+def create_trace_config(service: str) -> aiohttp.TraceConfig:
+    """
+    Build an aiohttp trace config recording latency and errors of every request
+
+    Args:
+        service: Value of the 'service' label ('wordpress', 'discord', ...)
+    """
+    async def on_request_start(session, context, params):
+        context.started = time.perf_counter()
+        context.endpoint = endpoint_label(params.url.path)
+
+    async def on_request_end(session, context, params):
+        http_request_duration.observe(
+            time.perf_counter() - context.started, service, params.method, context.endpoint
+        )
+        if params.response.status >= 400:
+            http_request_errors.inc(service, context.endpoint, params.response.status)
+
+    async def on_request_exception(session, context, params):
+        http_request_duration.observe(
+            time.perf_counter() - context.started, service, params.method, context.endpoint
+        )
+        http_request_errors.inc(service, context.endpoint, type(params.exception).__name__)
+
+    trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def command_name(interaction) -> str:
+    """Qualified name of the app command an interaction invoked"""
+    command = getattr(interaction, 'command', None)
+    return getattr(command, 'qualified_name', None) or 'unknown'
+
+
+def record_command(interaction, outcome: str):
+    """Observe a command's duration from the start stamped by the command tree"""
+    started = interaction.extras.pop('metrics_started', None)
+    if started is not None:
+        command_duration.observe(time.perf_counter() - started, command_name(interaction), outcome)
+
+
+def instrument_command_tree(bot):
+    """
+    Time every app command callback
+
+    The tree's interaction check stamps the start time on the interaction;
+    completed commands are recorded by the app_command_completion event and
+    failed ones by the tree's error handler calling record_command.
+    Autocomplete requests also pass the check but never complete, so they
+    aren't stamped.
+    """
+    tree = bot.tree
+    interaction_check = tree.interaction_check
+
+    async def timed_interaction_check(interaction) -> bool:
+        if interaction.type is not discord.InteractionType.autocomplete:
+            interaction.extras['metrics_started'] = time.perf_counter()
+        return await interaction_check(interaction)
+
+    async def on_app_command_completion(interaction, command):
+        record_command(interaction, 'ok')
+
+    tree.interaction_check = timed_interaction_check
+    bot.add_listener(on_app_command_completion, 'on_app_command_completion')
+
+
+class MetricsServer:
+    """Local HTTP server exposing the registry on /metrics"""
+
+    def __init__(self, registry: MetricsRegistry = metrics, host: str = METRICS_HOST, port: int = METRICS_PORT):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.runner: Optional[web.AppRunner] = None
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render().encode('utf-8'),
+            headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+        )
+
+    async def start(self):
+        """Start serving (does nothing if already started or disabled)"""
+        if self.runner is not None or not self.port:
+            return
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        try:
+            await web.TCPSite(self.runner, self.host, self.port).start()
+        except OSError as e:
+            logger.error(f"[METRICS] Could not listen on {self.host}:{self.port}: {e}")
+            await self.runner.cleanup()
+            self.runner = None
+            return
+        logger.info(f"[METRICS] Serving http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
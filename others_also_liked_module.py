@@ -1,12 +1,14 @@
 import discord
 from discord.ext import commands
 import aiohttp
-import json
 import logging
 import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import json_codec
+from http_cache import http_cache
+
 # Set up logging
 logger = logging.getLogger('discord')
 
@@ -76,26 +78,28 @@ class OthersAlsoLikedModule:
             # Set a longer timeout for this API call
             timeout = aiohttp.ClientTimeout(total=10)
             
-            async with self.session.post(url, json=data, headers=headers, timeout=timeout) as response:
-                response_text = await response.text()
-                logger.info(f"[RR-OTHERS-ALSO-LIKED] API Status: {response.status}")
+            # Revalidated with ETag / Last-Modified so unchanged lists come back as 304
+            status, body = await http_cache.request(
+                self.session, 'POST', url, json=data, headers=headers, timeout=timeout
+            )
+            logger.info(f"[RR-OTHERS-ALSO-LIKED] API Status: {status}")
+            
+            if status == 200:
+                result = json_codec.parse_body(body)
                 
-                if response.status == 200:
-                    result = json.loads(response_text)
-                    
-                    if result.get('success'):
-                        embed = self.create_others_also_liked_embed(result, interaction.user)
-                        await interaction.followup.send(embed=embed)
-                        logger.info(f"[RR-OTHERS-ALSO-LIKED] Successfully sent embed")
-                    else:
-                        error_msg = result.get('message', 'Could not fetch data for the specified book.')
-                        await interaction.followup.send(f"❌ {error_msg}", ephemeral=True)
+                if result.get('success'):
+                    embed = self.create_others_also_liked_embed(result, interaction.user)
+                    await interaction.followup.send(embed=embed)
+                    logger.info(f"[RR-OTHERS-ALSO-LIKED] Successfully sent embed")
                 else:
-                    await interaction.followup.send(
-                        f"❌ Error {response.status} from the database!",
-                        ephemeral=True
-                    )
-                    logger.info(f"[ERROR] Others Also Liked API returned status {response.status}")
+                    error_msg = result.get('message', 'Could not fetch data for the specified book.')
+                    await interaction.followup.send(f"❌ {error_msg}", ephemeral=True)
+            else:
+                await interaction.followup.send(
+                    f"❌ Error {status} from the database!",
+                    ephemeral=True
+                )
+                logger.info(f"[ERROR] Others Also Liked API returned status {status}")
                     
         except asyncio.TimeoutError:
             logger.info(f"[ERROR] API timeout in rr-others-also-liked command")
@@ -148,26 +152,28 @@ class OthersAlsoLikedModule:
             # Set a longer timeout for this API call
             timeout = aiohttp.ClientTimeout(total=10)
             
-            async with self.session.post(url, json=data, headers=headers, timeout=timeout) as response:
-                response_text = await response.text()
-                logger.info(f"[RR-OTHERS-ALSO-LIKED-LIST] API Status: {response.status}")
+            # Revalidated with ETag / Last-Modified so unchanged lists come back as 304
+            status, body = await http_cache.request(
+                self.session, 'POST', url, json=data, headers=headers, timeout=timeout
+            )
+            logger.info(f"[RR-OTHERS-ALSO-LIKED-LIST] API Status: {status}")
+            
+            if status == 200:
+                result = json_codec.parse_body(body)
                 
-                if response.status == 200:
-                    result = json.loads(response_text)
-                    
-                    if result.get('success'):
-                        embed = self.create_others_also_liked_list_embed(result, interaction.user)
-                        await interaction.followup.send(embed=embed)
-                        logger.info(f"[RR-OTHERS-ALSO-LIKED-LIST] Successfully sent embed")
-                    else:
-                        error_msg = result.get('message', 'Could not fetch data for the specified book.')
-                        await interaction.followup.send(f"❌ {error_msg}", ephemeral=True)
+                if result.get('success'):
+                    embed = self.create_others_also_liked_list_embed(result, interaction.user)
+                    await interaction.followup.send(embed=embed)
+                    logger.info(f"[RR-OTHERS-ALSO-LIKED-LIST] Successfully sent embed")
                 else:
-                    await interaction.followup.send(
-                        f"❌ Error {response.status} from the database!",
-                        ephemeral=True
-                    )
-                    logger.info(f"[ERROR] Others Also Liked List API returned status {response.status}")
+                    error_msg = result.get('message', 'Could not fetch data for the specified book.')
+                    await interaction.followup.send(f"❌ {error_msg}", ephemeral=True)
+            else:
+                await interaction.followup.send(
+                    f"❌ Error {status} from the database!",
+                    ephemeral=True
+                )
+                logger.info(f"[ERROR] Others Also Liked List API returned status {status}")
                     
         except asyncio.TimeoutError:
             logger.info(f"[ERROR] API timeout in rr-others-also-liked-list command")
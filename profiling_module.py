@@ -0,0 +1,288 @@
+"""
+Profiling module for Discord Essence Bot
+Admin-only /rr-profile command that profiles the next N invocations of any
+slash command and writes a report per invocation
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:
+    PyinstrumentProfiler = None
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Where profile reports are written
+PROFILE_REPORT_DIR = os.getenv('PROFILE_REPORT_DIR', 'profiles')
+# Upper bound for the number of invocations profiled per request
+MAX_PROFILED_INVOCATIONS = 20
+# Functions listed in the text summary of a cProfile report
+PROFILE_SUMMARY_LINES = 40
+
+
+class CProfileRecorder:
+    """
+    Deterministic profile of one invocation using the stdlib cProfile
+
+    Writes a .pstats file (open with snakeviz, flameprof or python -m pstats)
+    and a text summary sorted by cumulative time. Everything running on the
+    event loop thread while the command is awaited is included.
+    """
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def start(self):
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+
+    def save(self, path_base: str) -> List[str]:
+        stats_path = f"{path_base}.pstats"
+        self.profiler.dump_stats(stats_path)
+
+        summary = io.StringIO()
+        pstats.Stats(self.profiler, stream=summary).sort_stats('cumulative').print_stats(PROFILE_SUMMARY_LINES)
+        summary_path = f"{path_base}.txt"
+        with open(summary_path, 'w') as f:
+            f.write(summary.getvalue())
+        return [stats_path, summary_path]
+
+
+class PyinstrumentRecorder:
+    """
+    Sampling profile of one invocation using pyinstrument (when installed)
+
+    In async mode only the command's own task is attributed, with time spent
+    awaiting shown as such. Writes a speedscope flame graph (.speedscope.json)
+    and an HTML call tree.
+    """
+
+    def __init__(self):
+        self.profiler = PyinstrumentProfiler(async_mode='enabled')
+
+    def start(self):
+        self.profiler.start()
+
+    def stop(self):
+        self.profiler.stop()
+
+    def save(self, path_base: str) -> List[str]:
+        speedscope_path = f"{path_base}.speedscope.json"
+        with open(speedscope_path, 'w') as f:
+            f.write(self.profiler.output(renderer=SpeedscopeRenderer()))
+
+        html_path = f"{path_base}.html"
+        with open(html_path, 'w') as f:
+            f.write(self.profiler.output_html())
+        return [speedscope_path, html_path]
+
+
+# Available profilers, 'pyinstrument' only if the package is installed
+PROFILERS = {'cprofile': CProfileRecorder}
+if PyinstrumentProfiler is not None:
+    PROFILERS['pyinstrument'] = PyinstrumentRecorder
+
+
+class ProfilingModule:
+    """
+    Opt-in per-command profiling
+
+    Starting a profile swaps the target command's callback for a wrapper
+    that profiles each invocation; once the requested number of invocations
+    has been recorded the original callback is put back, so commands that
+    aren't being profiled run with no extra overhead.
+    """
+
+    def __init__(self, bot: commands.Bot, is_bot_admin_func, report_dir: str = PROFILE_REPORT_DIR):
+        self.bot = bot
+        self.is_bot_admin = is_bot_admin_func
+        self.report_dir = report_dir
+
+        # Command name -> profiling session
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        # Only one invocation is profiled at a time so profiles don't overlap
+        self.profiling = False
+        # Files written for the most recently profiled invocation
+        self.latest_report: List[str] = []
+
+        self.register_commands()
+        logger.info(f"[PROFILING] Module initialized (profilers: {', '.join(PROFILERS)})")
+
+    def register_commands(self):
+        """Register the admin profiling command"""
+
+        @self.bot.tree.command(
+            name="rr-profile",
+            description="Profile the next invocations of a command (Bot admin only)"
+        )
+        @app_commands.default_permissions()
+        @app_commands.describe(
+            action="Start or stop profiling, or show status and the latest report",
+            command="Command to profile, e.g. rr-followers",
+            count="Number of invocations to profile",
+            profiler="Profiler to use"
+        )
+        @app_commands.choices(action=[
+            app_commands.Choice(name="Start", value="start"),
+            app_commands.Choice(name="Stop", value="stop"),
+            app_commands.Choice(name="Status", value="status")
+        ])
+        @app_commands.choices(profiler=[
+            app_commands.Choice(name=name, value=name) for name in PROFILERS
+        ])
+        async def rr_profile(
+            interaction: discord.Interaction,
+            action: str,
+            command: Optional[str] = None,
+            count: app_commands.Range[int, 1, MAX_PROFILED_INVOCATIONS] = 1,
+            profiler: str = 'cprofile'
+        ):
+            await self.profile_handler(interaction, action, command, count, profiler)
+
+        rr_profile.autocomplete('command')(self.command_autocomplete)
+
+    def find_command(self, name: str) -> Optional[app_commands.Command]:
+        """Find a registered slash command by its qualified name"""
+        for command in self.bot.tree.walk_commands():
+            if isinstance(command, app_commands.Command) and command.qualified_name == name:
+                return command
+        return None
+
+    async def command_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """Suggest registered command names"""
+        current = current.lower()
+        names = sorted(
+            command.qualified_name for command in self.bot.tree.walk_commands()
+            if isinstance(command, app_commands.Command) and current in command.qualified_name
+        )
+        return [app_commands.Choice(name=name, value=name) for name in names[:25]]
+
+    async def profile_handler(self, interaction: discord.Interaction, action: str,
+                              command_name: Optional[str], count: int, profiler: str):
+        """Handle /rr-profile"""
+        await interaction.response.defer(ephemeral=True)
+
+        if not await self.is_bot_admin(interaction.user):
+            await interaction.followup.send("❌ Only bot administrators can profile commands.", ephemeral=True)
+            return
+
+        if action == 'status':
+            await self.send_status(interaction)
+            return
+
+        command = self.find_command(command_name) if command_name else None
+        if command is None:
+            await interaction.followup.send(f"❌ Unknown command: `{command_name}`", ephemeral=True)
+            return
+
+        if action == 'stop':
+            stopped = self.stop_profiling(command.qualified_name)
+            message = "⏹️ Profiling stopped" if stopped else "ℹ️ That command is not being profiled"
+            await interaction.followup.send(f"{message}: `/{command.qualified_name}`", ephemeral=True)
+            return
+
+        if command.qualified_name == 'rr-profile':
+            await interaction.followup.send("❌ /rr-profile can't profile itself.", ephemeral=True)
+            return
+
+        self.start_profiling(command, count, PROFILERS.get(profiler, CProfileRecorder))
+        logger.info(f"[PROFILING] {interaction.user} started profiling /{command.qualified_name} ({count}x, {profiler})")
+        await interaction.followup.send(
+            f"🔬 Profiling the next {count} invocation(s) of `/{command.qualified_name}` with {profiler}.\n"
+            f"Use `/rr-profile action:Status` to get the report.",
+            ephemeral=True
+        )
+
+    async def send_status(self, interaction: discord.Interaction):
+        """Show running profiles and attach the latest report"""
+        lines = [
+            f"• `/{name}`: {session['remaining']} invocation(s) left"
+            for name, session in self.sessions.items()
+        ] or ["No commands are being profiled."]
+
+        files = []
+        if self.latest_report:
+            lines.append(f"\nLatest report: `{self.latest_report[0]}`")
+            files = [discord.File(path) for path in self.latest_report if os.path.exists(path)]
+
+        await interaction.followup.send('\n'.join(lines), files=files, ephemeral=True)
+
+    def start_profiling(self, command: app_commands.Command, count: int, recorder_class):
+        """Profile the next `count` invocations of a command"""
+        name = command.qualified_name
+        session = self.sessions.get(name)
+        if session is not None:
+            session['remaining'] = count
+            session['recorder_class'] = recorder_class
+            return
+
+        original = command._callback
+        self.sessions[name] = {
+            'command': command,
+            'original': original,
+            'remaining': count,
+            'recorder_class': recorder_class
+        }
+
+        @functools.wraps(original)
+        async def profiled_callback(*args, **kwargs):
+            session = self.sessions.get(name)
+            if session is None or self.profiling:
+                return await original(*args, **kwargs)
+
+            self.profiling = True
+            recorder = session['recorder_class']()
+            started = time.perf_counter()
+            recorder.start()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                recorder.stop()
+                self.profiling = False
+                self.save_report(name, recorder, time.perf_counter() - started)
+                session['remaining'] -= 1
+                if session['remaining'] <= 0:
+                    self.stop_profiling(name)
+
+        command._callback = profiled_callback
+
+    def stop_profiling(self, name: str) -> bool:
+        """
+        Put a command's original callback back
+
+        Returns:
+            True if the command was being profiled
+        """
+        session = self.sessions.pop(name, None)
+        if session is None:
+            return False
+        session['command']._callback = session['original']
+        logger.info(f"[PROFILING] Finished profiling /{name}")
+        return True
+
+    def save_report(self, name: str, recorder, duration: float):
+        """Write the report files for one profiled invocation"""
+        try:
+            os.makedirs(self.report_dir, exist_ok=True)
+            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+            paths = recorder.save(os.path.join(self.report_dir, f"{name}-{timestamp}"))
+            self.latest_report = paths
+            logger.info(f"[PROFILING] /{name} took {duration * 1000:.0f}ms, report: {paths[0]}")
+        except Exception as e:
+            logger.error(f"[PROFILING] Failed to save report for /{name}: {e}")
@@ -7,11 +7,16 @@ import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+from ptw_snapshot_store import PTWSnapshotStore
+from metrics import record_cache
+import json_codec
+
 # Set up logging
 logger = logging.getLogger('discord')
 
 class PopularThisWeekModule:
-    def __init__(self, bot, session, wp_api_url, wp_bot_token, add_promotional_field_func=None):
+    def __init__(self, bot, session, wp_api_url, wp_bot_token, add_promotional_field_func=None,
+                 snapshot_store: Optional[PTWSnapshotStore] = None):
         self.bot = bot
         self.session = session
         self.wp_api_url = wp_api_url
@@ -32,6 +37,11 @@ class PopularThisWeekModule:
                 'horror', 'mystery', 'psychological', 'romance', 'sci_fi', 'tragedy'
             ]
         
+        # Local PTW snapshot store; handlers fall back to the API when it can't answer.
+        # The bot passes one shared store so reconnects don't start more refresh loops
+        self.snapshot_store = snapshot_store or PTWSnapshotStore(session, wp_api_url, wp_bot_token, self.ALL_PTW_TAGS)
+        self.snapshot_store.start()
+        
         # Register commands
         self.register_commands()
     
@@ -114,37 +124,42 @@ class PopularThisWeekModule:
                     )
                     return
             
-            # Prepare API request
-            request_data = {
-                'action': 'get_ptw_list',
-                'tag': tag,
-                'count': count,
-                'context_book_id': context_book_id,
-                'bot_token': self.wp_bot_token
-            }
-            
-            headers = {
-                'User-Agent': 'RR-Discord-Bot/1.0',
-                'Content-Type': 'application/json'
-            }
-            
-            # Make API request
-            async with self.session.post(
-                f"{self.wp_api_url}/wp-json/rr-analytics/v1/popular-this-week",
-                json=request_data,
-                headers=headers,
-                timeout=30
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"[RR-PTW] API error: {response.status} - {error_text}")
-                    await interaction.followup.send(
-                        f"❌ API error: {response.status}",
-                        ephemeral=True
-                    )
-                    return
+            # Serve from the local snapshot store when possible
+            data = self.snapshot_store.get_list(tag, count, context_book_id)
+            record_cache('ptw_store', 'miss' if data is None else 'hit')
+            
+            if data is None:
+                # Prepare API request
+                request_data = {
+                    'action': 'get_ptw_list',
+                    'tag': tag,
+                    'count': count,
+                    'context_book_id': context_book_id,
+                    'bot_token': self.wp_bot_token
+                }
+            
+                headers = {
+                    'User-Agent': 'RR-Discord-Bot/1.0',
+                    'Content-Type': 'application/json'
+                }
+            
+                # Make API request
+                async with self.session.post(
+                    f"{self.wp_api_url}/wp-json/rr-analytics/v1/popular-this-week",
+                    json=request_data,
+                    headers=headers,
+                    timeout=30
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error(f"[RR-PTW] API error: {response.status} - {error_text}")
+                        await interaction.followup.send(
+                            f"❌ API error: {response.status}",
+                            ephemeral=True
+                        )
+                        return
                 
-                data = await response.json()
+                    data = await json_codec.read_json(response)
             
             if not data.get('success'):
                 error_msg = data.get('message', 'Failed to fetch PTW data')
@@ -200,36 +215,41 @@ class PopularThisWeekModule:
             # Parse tags
             requested_tags = self.parse_ptw_tags(tags)
             
-            # Prepare API request
-            request_data = {
-                'action': 'check_book_ptw',
-                'book_id': book_id,
-                'tags': requested_tags,
-                'bot_token': self.wp_bot_token
-            }
-            
-            headers = {
-                'User-Agent': 'RR-Discord-Bot/1.0',
-                'Content-Type': 'application/json'
-            }
-            
-            # Make API request
-            async with self.session.post(
-                f"{self.wp_api_url}/wp-json/rr-analytics/v1/popular-this-week",
-                json=request_data,
-                headers=headers,
-                timeout=30
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"[RR-PTW-CHECK] API error: {response.status} - {error_text}")
-                    await interaction.followup.send(
-                        f"❌ API error: {response.status}",
-                        ephemeral=True
-                    )
-                    return
+            # Serve from the local snapshot store when possible
+            data = self.snapshot_store.get_book_appearances(book_id, requested_tags)
+            record_cache('ptw_store', 'miss' if data is None else 'hit')
+            
+            if data is None:
+                # Prepare API request
+                request_data = {
+                    'action': 'check_book_ptw',
+                    'book_id': book_id,
+                    'tags': requested_tags,
+                    'bot_token': self.wp_bot_token
+                }
+            
+                headers = {
+                    'User-Agent': 'RR-Discord-Bot/1.0',
+                    'Content-Type': 'application/json'
+                }
+            
+                # Make API request
+                async with self.session.post(
+                    f"{self.wp_api_url}/wp-json/rr-analytics/v1/popular-this-week",
+                    json=request_data,
+                    headers=headers,
+                    timeout=30
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.error(f"[RR-PTW-CHECK] API error: {response.status} - {error_text}")
+                        await interaction.followup.send(
+                            f"❌ API error: {response.status}",
+                            ephemeral=True
+                        )
+                        return
                 
-                data = await response.json()
+                    data = await json_codec.read_json(response)
             
             if not data.get('success'):
                 error_msg = data.get('message', 'Failed to check PTW appearances')
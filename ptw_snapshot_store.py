@@ -0,0 +1,252 @@
+"""
+Popular This Week snapshot store for Discord Essence Bot
+Keeps a local, periodically refreshed copy of the PTW lists so /rr-ptw and
+/rr-ptw-check can be answered from memory
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, List, Optional
+
+import json_codec
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# How often the store pulls new snapshots (seconds)
+PTW_REFRESH_INTERVAL = 15 * 60
+# Data older than this is considered stale and handlers fall back to the API
+PTW_MAX_STALENESS = 3 * PTW_REFRESH_INTERVAL
+
+
+class PTWSnapshotStore:
+    """
+    Local copy of Popular This Week lists
+
+    Snapshots are pulled incrementally from the popular-this-week endpoint
+    (action 'get_ptw_snapshots' with the timestamp of the last snapshot seen),
+    and every snapshot updates two structures:
+        - lists: the latest list per tag
+        - appearances: book id -> tag -> position history summary
+    """
+
+    def __init__(self, session, wp_api_url: str, wp_bot_token: str, tags: List[str]):
+        self.session = session
+        self.wp_api_url = wp_api_url
+        self.wp_bot_token = wp_bot_token
+        self.tags = list(tags)
+
+        self.lists: Dict[str, Dict[str, Any]] = {}
+        self.appearances: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.book_info: Dict[str, Dict[str, str]] = {}
+        self.last_timestamp: Optional[str] = None
+        self.last_refresh = 0.0
+        self.refresh_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start refreshing in the background"""
+        if self.refresh_task is None:
+            self.refresh_task = asyncio.create_task(self.refresh_loop())
+
+    async def refresh_loop(self):
+        """Refresh the store every PTW_REFRESH_INTERVAL seconds"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[PTW_STORE] Refresh failed: {e}")
+            await asyncio.sleep(PTW_REFRESH_INTERVAL)
+
+    def is_fresh(self) -> bool:
+        """Whether the store has recent enough data to answer queries"""
+        return self.last_refresh > 0 and time.monotonic() - self.last_refresh < PTW_MAX_STALENESS
+
+    async def refresh(self) -> bool:
+        """
+        Pull snapshots taken since the last one seen
+
+        Returns:
+            True if the store was updated successfully
+        """
+        request_data = {
+            'action': 'get_ptw_snapshots',
+            'since': self.last_timestamp,
+            'tags': self.tags,
+            'bot_token': self.wp_bot_token
+        }
+
+        headers = {
+            'User-Agent': 'RR-Discord-Bot/1.0',
+            'Content-Type': 'application/json'
+        }
+
+        async with self.session.post(
+            f"{self.wp_api_url}/wp-json/rr-analytics/v1/popular-this-week",
+            json=request_data,
+            headers=headers,
+            timeout=60
+        ) as response:
+            if response.status != 200:
+                logger.error(f"[PTW_STORE] API error: {response.status}")
+                return False
+            data = await json_codec.read_json(response)
+
+        if not data.get('success'):
+            logger.error(f"[PTW_STORE] Snapshot sync not available: {data.get('message', 'unknown error')}")
+            return False
+
+        snapshots = sorted(data.get('snapshots', []), key=lambda s: s.get('scraped_at', ''))
+        for snapshot in snapshots:
+            self.apply_snapshot(snapshot.get('tag'), snapshot.get('scraped_at'), snapshot.get('books', []))
+
+        if snapshots:
+            self.last_timestamp = max(self.last_timestamp or '', snapshots[-1].get('scraped_at', ''))
+        if data.get('timestamp'):
+            self.last_timestamp = max(self.last_timestamp or '', data['timestamp'])
+
+        self.last_refresh = time.monotonic()
+        logger.info(f"[PTW_STORE] Applied {len(snapshots)} snapshot(s), {len(self.appearances)} books indexed")
+        return True
+
+    def apply_snapshot(self, tag: Optional[str], scraped_at: Optional[str], books: List[Dict]):
+        """Merge one scraped PTW list into the store"""
+        if not tag or not scraped_at:
+            return
+
+        scrape_date = scraped_at[:10]
+        current = self.lists.get(tag)
+        is_latest = current is None or scraped_at >= current['timestamp']
+
+        if is_latest:
+            self.lists[tag] = {
+                'timestamp': scraped_at,
+                'books': books,
+                'positions': {
+                    str(book.get('book_id')): book.get('position', index)
+                    for index, book in enumerate(books, 1)
+                },
+                'books_by_id': {str(book.get('book_id')): book for book in books}
+            }
+
+        for index, book in enumerate(books, 1):
+            book_id = str(book.get('book_id'))
+            position = book.get('position', index)
+
+            if book.get('title'):
+                self.book_info[book_id] = {
+                    'title': book['title'],
+                    'author': book.get('author') or self.book_info.get(book_id, {}).get('author', 'Unknown Author')
+                }
+
+            stats = self.appearances.setdefault(book_id, {}).setdefault(tag, {
+                'appearances': 0,
+                'first_seen': scraped_at,
+                'last_seen': scraped_at,
+                'best_position': position,
+                'best_position_date': scrape_date,
+                'dates': set(),
+                'last_position': None,
+                'previous_position': None
+            })
+
+            stats['appearances'] += 1
+            stats['dates'].add(scrape_date)
+            stats['first_seen'] = min(stats['first_seen'], scraped_at)
+
+            if position < stats['best_position']:
+                stats['best_position'] = position
+                stats['best_position_date'] = scrape_date
+
+            if scraped_at >= stats['last_seen'] or stats['last_position'] is None:
+                stats['previous_position'] = stats['last_position']
+                stats['last_position'] = position
+                stats['last_seen'] = scraped_at
+
+    def get_list(self, tag: str, count: int, context_book_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Build a get_ptw_list style response from memory
+
+        Returns None when the API should be used instead (stale store,
+        unknown tag, or a context book that isn't on the list).
+        """
+        if not self.is_fresh() or tag not in self.lists:
+            return None
+
+        current = self.lists[tag]
+        context_info = {}
+
+        if context_book_id:
+            position = current['positions'].get(str(context_book_id))
+            if not position:
+                # Weekly views of off-list books are only known to the backend
+                return None
+            book = current['books_by_id'][str(context_book_id)]
+            context_info = {
+                'title': book.get('title'),
+                'position': position,
+                'weekly_views': book.get('weekly_views')
+            }
+
+        return {
+            'success': True,
+            'books': current['books'][:count],
+            'context_info': context_info,
+            'timestamp': current['timestamp']
+        }
+
+    def get_book_appearances(self, book_id: str, tags: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Build a check_book_ptw style response from memory
+
+        Returns None when the API should be used instead (stale store or a
+        book the store has never seen, so its title is unknown).
+        """
+        book_id = str(book_id)
+        if not self.is_fresh() or book_id not in self.appearances:
+            return None
+
+        book_stats = self.appearances[book_id]
+        ptw_appearances = {}
+
+        for tag in tags:
+            stats = book_stats.get(tag)
+            if not stats:
+                continue
+
+            current = self.lists.get(tag, {})
+            current_position = current.get('positions', {}).get(book_id)
+            current_views = None
+            if current_position:
+                current_views = current['books_by_id'][book_id].get('weekly_views')
+
+            if not current_position:
+                trend = None
+            elif stats['previous_position'] is None:
+                trend = 'new'
+            elif stats['last_position'] < stats['previous_position']:
+                trend = 'rising'
+            elif stats['last_position'] > stats['previous_position']:
+                trend = 'falling'
+            else:
+                trend = 'stable'
+
+            ptw_appearances[tag] = {
+                'current_position': current_position,
+                'current_views': current_views,
+                'best_position': stats['best_position'],
+                'best_position_date': stats['best_position_date'],
+                'first_seen': stats['first_seen'][:10],
+                'last_seen': stats['last_seen'][:10],
+                'appearances': stats['appearances'],
+                'days_on_list': len(stats['dates']),
+                'trend': trend
+            }
+
+        return {
+            'success': True,
+            'book_info': self.book_info.get(book_id, {}),
+            'ptw_appearances': ptw_appearances
+        }
@@ -1,12 +1,194 @@
 # rising_stars_prediction.py
 import discord
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import cached_property
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger('discord')
 
+# Benchmark bands in position order, with their display labels
+BENCHMARK_BANDS = ['position_1', 'position_2_3', 'position_4_5', 'position_6_7', 'position_8_10']
+BENCHMARK_LABELS = ['1', '2-3', '4-5', '6-7', '8-10', 'Below 10']
+# Days scored against the benchmarks (Day -7 to Day 0) plus the cumulative week
+BENCHMARK_DAYS = ['day_7_6', 'day_6_5', 'day_5_4', 'day_4_3', 'day_3_2', 'day_2_1', 'day_1_0', 'cumulative']
+# Days closer to Day 0 say more about the peak position
+BENCHMARK_WEIGHTS = np.array([1.0, 1.0, 1.0, 1.0, 1.5, 1.5, 2.0, 2.0])
+
+# Monte Carlo forecast settings
+FORECAST_PATHS = 4000           # Simulated 7-day growth paths per forecast
+FORECAST_HISTORY_DAYS = 14      # Days of daily growth the paths are resampled from
+FORECAST_DAY0_BOOST = 2.5       # Growth multiplier on the day a book enters Main RS
+FORECAST_CACHE_SIZE = 512
+
+
+def build_benchmark_ranges(benchmarks: Dict) -> np.ndarray:
+    """Turn the benchmark table into a (bands, days, min/max) array"""
+    return np.array(
+        [[benchmarks[band][day] for day in BENCHMARK_DAYS] for band in BENCHMARK_BANDS],
+        dtype=np.float64
+    )
+
+
+class GrowthAccumulator:
+    """
+    Incrementally maintained follower growth for one book
+    
+    Keeps snapshot timestamps/followers, per-snapshot growth and per-day
+    growth totals as typed arrays. extend() only parses and diffs snapshots
+    newer than the last one seen; appending them still copies the arrays
+    once, which is cheap next to rebuilding the history from scratch.
+    """
+    
+    # Accumulators per (book ID, first snapshot timestamp), shared by all
+    # RisingStarsPrediction instances built from the same snapshot window
+    instances: "OrderedDict[Tuple[int, str], GrowthAccumulator]" = OrderedDict()
+    MAX_INSTANCES = 1024
+    
+    def __init__(self):
+        self.timestamps = np.empty(0, dtype='datetime64[s]')
+        self.followers = np.empty(0, dtype=np.int64)
+        self.growth = np.empty(0, dtype=np.int64)
+        self.days = np.empty(0, dtype='datetime64[D]')
+        self.day_totals = np.empty(0, dtype=np.int64)
+    
+    @classmethod
+    def for_book(cls, book_id: int, snapshots: List[Dict]) -> 'GrowthAccumulator':
+        """
+        Get an accumulator holding exactly `snapshots`
+        
+        Reuses the shared accumulator for the same book and window start when
+        it holds the head of `snapshots`. Accumulators that have been handed
+        out are never changed: extending one builds new arrays on a shallow
+        copy, which replaces it in the shared cache.
+        """
+        if book_id is None or not snapshots:
+            accumulator = cls()
+            accumulator.extend(snapshots)
+            return accumulator
+        
+        key = (book_id, str(snapshots[0]['timestamp']))
+        cached = cls.instances.get(key)
+        if cached is not None and cached.holds_head_of(snapshots):
+            if cached.timestamps.size == len(snapshots):
+                cls.instances.move_to_end(key)
+                return cached
+            accumulator = cached.copy()
+        else:
+            accumulator = cls()
+        
+        accumulator.extend(snapshots)
+        cls.instances[key] = accumulator
+        cls.instances.move_to_end(key)
+        if len(cls.instances) > cls.MAX_INSTANCES:
+            cls.instances.popitem(last=False)
+        return accumulator
+    
+    def holds_head_of(self, snapshots: List[Dict]) -> bool:
+        """Whether the snapshots held so far are the first ones of `snapshots`"""
+        size = self.timestamps.size
+        return (
+            0 < size <= len(snapshots)
+            and self.parse(snapshots[0]['timestamp']) == self.timestamps[0]
+            and self.parse(snapshots[size - 1]['timestamp']) == self.timestamps[-1]
+        )
+    
+    def copy(self) -> 'GrowthAccumulator':
+        """
+        Copy sharing this accumulator's arrays
+        
+        extend() replaces arrays rather than writing into them, so the copy
+        can be extended without changing this one.
+        """
+        accumulator = GrowthAccumulator()
+        accumulator.__dict__.update(self.__dict__)
+        return accumulator
+    
+    def extend(self, snapshots: List[Dict]) -> int:
+        """
+        Add snapshots newer than the last one processed
+        
+        Input that doesn't continue the snapshots held so far (a gap, or a
+        shorter or shifted window) is rebuilt from scratch instead.
+        
+        Returns:
+            Number of snapshots added
+        """
+        if self.timestamps.size and not self.holds_head_of(snapshots):
+            self.__init__()
+        
+        start = self.timestamps.size
+        new = snapshots[start:]
+        if not new:
+            return 0
+        
+        timestamps = np.array([str(s['timestamp']).replace(' ', 'T') for s in new], dtype='datetime64[s]')
+        followers = np.array([int(s['followers']) for s in new], dtype=np.int64)
+        
+        previous = self.followers[-1:]
+        growth = np.diff(np.concatenate([previous, followers]))
+        growth_days = timestamps[-len(growth):].astype('datetime64[D]') if growth.size else np.empty(0, dtype='datetime64[D]')
+        
+        self.timestamps = np.concatenate([self.timestamps, timestamps])
+        self.followers = np.concatenate([self.followers, followers])
+        self.growth = np.concatenate([self.growth, growth])
+        self.add_day_totals(growth_days, growth)
+        
+        return len(new)
+    
+    @staticmethod
+    def parse(timestamp: str) -> np.datetime64:
+        """Parse a 'YYYY-MM-DD HH:MM:SS' snapshot timestamp"""
+        return np.datetime64(str(timestamp).replace(' ', 'T'), 's')
+    
+    def add_day_totals(self, days: np.ndarray, growth: np.ndarray):
+        """Fold new growth entries into the per-day totals"""
+        if not growth.size:
+            return
+        
+        # Snapshots are in time order, so each day's entries are contiguous
+        unique_days, starts = np.unique(days, return_index=True)
+        totals = np.add.reduceat(growth, starts)
+        
+        # The first new day may continue the last stored one; fold the stored
+        # total in rather than updating it in place, which copies may share
+        if self.days.size and unique_days[0] == self.days[-1]:
+            totals[0] += self.day_totals[-1]
+            self.days, self.day_totals = self.days[:-1], self.day_totals[:-1]
+        
+        self.days = np.concatenate([self.days, unique_days])
+        self.day_totals = np.concatenate([self.day_totals, totals])
+    
+    def calendar_day_growth(self, days: int = 7) -> np.ndarray:
+        """
+        Growth per calendar day over the last N days up to the newest snapshot
+        
+        Built from each day's last follower count, NaN where a day (or the
+        one before it) has no snapshot: the same series the candidates scan
+        gets from daily_followers.
+        """
+        growth = np.full(days, np.nan)
+        if not self.timestamps.size:
+            return growth
+        
+        snapshot_days = self.timestamps.astype('datetime64[D]')
+        last_of_day = np.append(snapshot_days[1:] != snapshot_days[:-1], True)
+        offsets = (snapshot_days[last_of_day] - (snapshot_days[-1] - days)).astype(np.int64)
+        keep = offsets >= 0
+        
+        followers = np.full(days + 1, np.nan)
+        followers[offsets[keep]] = self.followers[last_of_day][keep]
+        return np.diff(followers)
+    
+    def recent_day_totals(self, days: int = 7) -> np.ndarray:
+        """Growth per tracked day for the last N days, zero-padded at the front"""
+        values = self.day_totals[-days:].astype(np.float64)
+        return np.pad(values, (days - len(values), 0))
+    
+
+
 class RisingStarsPrediction:
     """Module for predicting Rising Stars potential and peak positions"""
     
@@ -64,6 +246,27 @@ class RisingStarsPrediction:
         }
     }
     
+    # GROWTH_BENCHMARKS as an array, used by the vectorized scoring
+    BENCHMARK_RANGES = build_benchmark_ranges(GROWTH_BENCHMARKS)
+    
+    # Eligibility rules, in the order check_eligibility applies them
+    TRACKING_START_DATE = '2025-07-01'
+    MAX_FOLLOWERS_AFTER_MONTH = 200
+    MIN_DAILY_GROWTH = 3
+    ELIGIBILITY_REASONS = [
+        "Book has already appeared on Main Rising Stars",
+        "Book has tracking data before July 2025",
+        "Book has too many followers for its age",
+        "Insufficient daily growth (need 3+ followers/day)",
+        "Book has not appeared on any genre Rising Stars lists",
+        "Eligible for Rising Stars prediction"
+    ]
+    
+    # Forecast results keyed by snapshot fingerprint, shared by all instances
+    forecast_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+    # Eligibility per book ID as (last snapshot timestamp, result)
+    eligibility_cache: Dict[int, Tuple[Optional[str], Tuple[bool, str]]] = {}
+    
     # Niche tags for better shoutout matching (less popular tags)
     NICHE_TAGS = [
         'strategy', 'war_and_military', 'mythos', 'urban_fantasy', 'non_human_lead',
@@ -82,72 +285,379 @@ class RisingStarsPrediction:
         self.book_id = book_id  # Internal database ID
         self.book_data = book_data
         self.snapshots = snapshots
-        self.daily_growth = self.calculate_daily_growth()
+        self.growth = GrowthAccumulator.for_book(book_id, snapshots)
         
+    @cached_property
+    def daily_growth(self) -> List[Tuple[datetime, int]]:
+        """Follower growth between consecutive snapshots, built on first use"""
+        return self.calculate_daily_growth()
+    
     def calculate_daily_growth(self) -> List[Tuple[datetime, int]]:
         """Calculate daily follower growth from snapshots"""
-        if len(self.snapshots) < 2:
-            return []
-        
-        daily_growth = []
-        for i in range(1, len(self.snapshots)):
-            date = datetime.strptime(self.snapshots[i]['timestamp'], '%Y-%m-%d %H:%M:%S')
-            prev_followers = int(self.snapshots[i-1]['followers'])
-            curr_followers = int(self.snapshots[i]['followers'])
-            growth = curr_followers - prev_followers
-            daily_growth.append((date, growth))
-            
-        return daily_growth
+        growth_times = self.growth.timestamps[-len(self.growth.growth):] if self.growth.growth.size else []
+        return [(ts.astype(datetime), int(growth)) for ts, growth in zip(growth_times, self.growth.growth)]
     
     def check_eligibility(self) -> Tuple[bool, str]:
         """Check if book is eligible for Rising Stars prediction"""
         
-        # Check 1: Book should NOT have appeared on main RS before
-        has_main_rs = self.wpdb.get_var(self.wpdb.prepare("""
-            SELECT COUNT(*) FROM {self.wpdb.prefix}rr_genre_rising_stars
-            WHERE book_id = %d AND rs_tag = 'main'
-        """, self.book_id))
+        # Reuse the last result until a new snapshot arrives
+        last_snapshot = self.snapshots[-1].get('timestamp') if self.snapshots else None
+        cached = self.eligibility_cache.get(self.book_id)
+        if cached is not None and cached[0] == last_snapshot:
+            return cached[1]
         
-        if has_main_rs > 0:
-            return False, "Book has already appeared on Main Rising Stars"
+        aggregates = self.fetch_eligibility_aggregates(self.wpdb, [self.book_id]).get(self.book_id, {})
         
-        # Check 2: Book should NOT have records before 2025-07-01
-        old_records = self.wpdb.get_var(self.wpdb.prepare("""
-            SELECT COUNT(*) FROM {self.wpdb.prefix}rr_book_snapshot
-            WHERE book_id = %d AND DATE(timestamp) < '2025-07-01'
-        """, self.book_id))
+        _, reasons = self.check_eligibility_batch(
+            [int(aggregates.get('has_main_rs') or 0) > 0],
+            [int(aggregates.get('old_records') or 0) > 0],
+            [int(aggregates.get('old_max_followers') or 0)],
+            [int(aggregates.get('genre_rs_count') or 0)],
+            self.growth.calendar_day_growth().reshape(1, -1)
+        )
+        
+        reason = int(reasons[0])
+        result = (reason == len(self.ELIGIBILITY_REASONS) - 1, self.ELIGIBILITY_REASONS[reason])
+        self.eligibility_cache[self.book_id] = (last_snapshot, result)
+        return result
+    
+    @classmethod
+    def fetch_eligibility_aggregates(cls, wpdb, book_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Fetch everything check_eligibility needs for many books in one query
+        
+        Returns:
+            Dict of book ID -> has_main_rs, genre_rs_count, old_records and
+            old_max_followers
+        """
+        if not book_ids:
+            return {}
+        
+        one_month_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        placeholders = ', '.join(['%d'] * len(book_ids))
+        
+        rows = wpdb.get_results(wpdb.prepare(f"""
+            SELECT s.book_id,
+                (SELECT COUNT(*) FROM {wpdb.prefix}rr_genre_rising_stars rs
+                    WHERE rs.book_id = s.book_id AND rs.rs_tag = 'main') AS has_main_rs,
+                (SELECT COUNT(DISTINCT rs.rs_tag) FROM {wpdb.prefix}rr_genre_rising_stars rs
+                    WHERE rs.book_id = s.book_id AND rs.rs_tag != 'main') AS genre_rs_count,
+                SUM(DATE(s.timestamp) < %s) AS old_records,
+                MAX(CASE WHEN DATE(s.timestamp) < %s THEN s.followers END) AS old_max_followers
+            FROM {wpdb.prefix}rr_book_snapshot s
+            WHERE s.book_id IN ({placeholders})
+            GROUP BY s.book_id
+        """, cls.TRACKING_START_DATE, one_month_ago, *book_ids), 'ARRAY_A') or []
+        
+        return {int(row['book_id']): row for row in rows}
+    
+    @classmethod
+    def check_eligibility_batch(
+        cls,
+        has_main_rs: np.ndarray,
+        has_old_records: np.ndarray,
+        old_max_followers: np.ndarray,
+        genre_rs_count: np.ndarray,
+        daily_growth: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply the check_eligibility rules to many books at once
+        
+        Args:
+            has_main_rs: (books,) whether the book was ever on Main RS
+            has_old_records: (books,) whether it has snapshots before TRACKING_START_DATE
+            old_max_followers: (books,) max followers more than a month ago (0 if none)
+            genre_rs_count: (books,) number of genre RS lists it appeared on
+            daily_growth: (books, days) daily follower growth, NaN where unknown
+        
+        Returns:
+            Tuple of (eligible mask, index into ELIGIBILITY_REASONS per book)
+        """
+        daily_growth = np.atleast_2d(np.asarray(daily_growth, dtype=np.float64))
+        recent = daily_growth[:, -7:]
+        known = ~np.isnan(recent)
+        known_days = known.sum(axis=1)
+        low_growth_days = ((recent < cls.MIN_DAILY_GROWTH) & known).sum(axis=1)
+        
+        failures = np.vstack([
+            np.asarray(has_main_rs, dtype=bool),
+            np.asarray(has_old_records, dtype=bool),
+            np.asarray(old_max_followers, dtype=np.float64) > cls.MAX_FOLLOWERS_AFTER_MONTH,
+            (known_days >= 2) & (low_growth_days >= known_days - 1),
+            np.asarray(genre_rs_count) == 0
+        ])
+        
+        eligible = ~failures.any(axis=0)
+        reasons = np.where(eligible, len(cls.ELIGIBILITY_REASONS) - 1, failures.argmax(axis=0))
+        return eligible, reasons
+    
+    @classmethod
+    def score_growth_matrix(cls, growth: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score 7-day growth vectors against every benchmark band at once
+        
+        Args:
+            growth: Array of shape (7,) or (books, 7) with daily follower
+                growth from Day -7 to Day 0
+        
+        Returns:
+            Tuple of (fit, probabilities), both shaped (books, len(BENCHMARK_LABELS)).
+            Fit is 0-1 per band; probabilities sum to 1 per book.
+        """
+        growth = np.atleast_2d(np.asarray(growth, dtype=np.float64))
+        values = np.concatenate([growth, growth.sum(axis=1, keepdims=True)], axis=1)[:, None, :]
         
-        if old_records > 0:
-            return False, "Book has tracking data before July 2025"
+        low = cls.BENCHMARK_RANGES[..., 0]
+        high = cls.BENCHMARK_RANGES[..., 1].copy()
+        width = np.maximum(high - low, 1.0)
+        # Growing faster than the #1 band still means #1
+        high[0] = np.inf
         
-        # Check 3: If book has records older than 1 month, followers shouldn't be > 200
-        one_month_ago = datetime.now() - timedelta(days=30)
-        old_high_followers = self.wpdb.get_var(self.wpdb.prepare("""
-            SELECT MAX(followers) FROM {self.wpdb.prefix}rr_book_snapshot
-            WHERE book_id = %d AND DATE(timestamp) < %s
-        """, self.book_id, one_month_ago.strftime('%Y-%m-%d')))
+        # Distance outside each band's range, scaled by the range width
+        distance = np.maximum(low - values, 0) + np.maximum(values - high, 0)
+        day_fit = np.exp(-distance / width)
+        band_fit = day_fit @ BENCHMARK_WEIGHTS / BENCHMARK_WEIGHTS.sum()
         
-        if old_high_followers and int(old_high_followers) > 200:
-            return False, "Book has too many followers for its age"
+        # Share of (weighted) days below even the lowest band
+        below_fit = (values[:, 0, :] < low[-1]) @ BENCHMARK_WEIGHTS / BENCHMARK_WEIGHTS.sum()
         
-        # Check 4: Daily growth shouldn't be < 3 for at least 2 days
-        recent_growth = self.daily_growth[-7:] if len(self.daily_growth) >= 7 else self.daily_growth
-        low_growth_days = sum(1 for _, growth in recent_growth if growth < 3)
+        fit = np.concatenate([band_fit, below_fit[:, None]], axis=1)
+        totals = fit.sum(axis=1, keepdims=True)
+        probabilities = np.divide(fit, totals, out=np.zeros_like(fit), where=totals > 0)
+        probabilities[totals[:, 0] == 0, -1] = 1.0
         
-        if len(recent_growth) >= 2 and low_growth_days >= len(recent_growth) - 1:
-            return False, "Insufficient daily growth (need 3+ followers/day)"
+        return fit, probabilities
+    
+    @classmethod
+    def growth_vectors(cls, daily_growth: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Benchmark vectors for recent per-day growth
         
-        # Check 5: Book must appear on at least one genre RS list
-        has_genre_rs = self.wpdb.get_var(self.wpdb.prepare("""
-            SELECT COUNT(DISTINCT rs_tag) FROM {self.wpdb.prefix}rr_genre_rising_stars
-            WHERE book_id = %d AND rs_tag != 'main'
-        """, self.book_id))
+        The last 6 days stand in for Day -7 to Day -1, and Day 0 is the
+        average of the last 3 days with the RS entry boost. predict_position
+        and the candidates scan both score these, so they agree on a book.
         
-        if has_genre_rs == 0:
-            return False, "Book has not appeared on any genre Rising Stars lists"
+        Args:
+            daily_growth: (books, days) or (days,) growth per calendar day, NaN where unknown
         
-        return True, "Eligible for Rising Stars prediction"
+        Returns:
+            Tuple of ((books, 7) vectors, (books,) recent average growth)
+        """
+        recent = np.nan_to_num(np.atleast_2d(np.asarray(daily_growth, dtype=np.float64))[:, -7:])
+        recent = np.pad(recent, ((0, 0), (7 - recent.shape[1], 0)))
+        recent_avg = recent[:, -3:].mean(axis=1)
+        vectors = np.concatenate([recent[:, 1:], (recent_avg * FORECAST_DAY0_BOOST)[:, None]], axis=1)
+        return vectors, recent_avg
+    
+    def get_recent_daily_totals(self, days: int = 7) -> np.ndarray:
+        """Follower growth per calendar day for the last N days, oldest first"""
+        return self.growth.recent_day_totals(days)
     
+    def score_benchmarks(self, growth: Optional[np.ndarray] = None) -> Dict:
+        """
+        Score this book's last 7 days of growth against the benchmark table
+        
+        Returns:
+            Dict with per-band 'fit' (0-1), 'probabilities' (percent) and 'best_match'
+        """
+        if growth is None:
+            growth = np.nan_to_num(self.growth.calendar_day_growth())
+        
+        fit, probabilities = self.score_growth_matrix(growth)
+        
+        return {
+            'fit': {label: round(float(value), 3) for label, value in zip(BENCHMARK_LABELS, fit[0])},
+            'probabilities': {label: int(round(value * 100)) for label, value in zip(BENCHMARK_LABELS, probabilities[0])},
+            'best_match': BENCHMARK_LABELS[int(np.argmax(fit[0]))]
+        }
+    
+    def snapshot_fingerprint(self) -> Tuple:
+        """Identify the snapshot history a forecast was computed from"""
+        if not self.snapshots:
+            return (self.book_id, 0)
+        last = self.snapshots[-1]
+        return (self.book_id, len(self.snapshots), last.get('timestamp'), int(last.get('followers') or 0))
+    
+    def forecast_position(self, paths: int = FORECAST_PATHS, seed: Optional[int] = None) -> Optional[Dict]:
+        """
+        Monte Carlo forecast of the peak RS position
+        
+        Simulates the next 7 days of follower growth by resampling the book's
+        recent daily growth, applies the Day 0 boost, and scores every path
+        against the benchmark bands in one vectorized pass.
+        
+        Returns:
+            Dict with band 'probabilities' (percent), 'best_match', 'confidence'
+            and growth percentiles, or None without enough growth history
+        """
+        key = self.snapshot_fingerprint() + (paths, seed)
+        cached = self.forecast_cache.get(key)
+        if cached is not None:
+            self.forecast_cache.move_to_end(key)
+            return cached
+        
+        history = self.get_recent_daily_totals(FORECAST_HISTORY_DAYS)
+        # Ignore days before tracking started
+        history = history[np.argmax(history != 0):] if history.any() else history[:0]
+        if history.size < 3:
+            return None
+        
+        rng = np.random.default_rng(seed)
+        growth = rng.choice(history, size=(paths, 7))
+        growth[:, -1] *= FORECAST_DAY0_BOOST
+        
+        fit, _ = self.score_growth_matrix(growth)
+        outcomes = np.bincount(fit.argmax(axis=1), minlength=len(BENCHMARK_LABELS)) / paths
+        week_totals = growth.sum(axis=1)
+        p10, p50, p90 = np.percentile(week_totals, [10, 50, 90])
+        best = int(outcomes.argmax())
+        
+        forecast = {
+            'probabilities': {label: int(round(share * 100)) for label, share in zip(BENCHMARK_LABELS, outcomes)},
+            'best_match': BENCHMARK_LABELS[best],
+            'confidence': int(round(outcomes[best] * 100)),
+            'week_growth_p10': int(p10),
+            'week_growth_median': int(p50),
+            'week_growth_p90': int(p90),
+            'paths': paths
+        }
+        
+        self.forecast_cache[key] = forecast
+        if len(self.forecast_cache) > FORECAST_CACHE_SIZE:
+            self.forecast_cache.popitem(last=False)
+        
+        return forecast
+    
+    def predict_position(self, week_growth: int, day0_growth: int = None) -> Dict:
+        """Predict potential RS position based on growth patterns"""
+        
+        # Same per-day growth and vectors as the candidates scan
+        growth = self.growth.calendar_day_growth()
+        if not np.nan_to_num(growth[1:]).any():
+            growth = np.full(7, week_growth / 7.0)
+        
+        vectors, _ = self.growth_vectors(growth)
+        # Day 0 growth is estimated from the recent trend unless it's known
+        if day0_growth is not None:
+            vectors[0, -1] = day0_growth
+        
+        scores = self.score_benchmarks(vectors[0])
+        probabilities = scores['probabilities']
+        best_fit = scores['fit'][scores['best_match']]
+        
+        if best_fit >= 0.75:
+            confidence = 'medium-high'
+        elif best_fit >= 0.5:
+            confidence = 'medium'
+        elif best_fit >= 0.3:
+            confidence = 'low-medium'
+        else:
+            confidence = 'low'
+        
+        return {
+            'position_ranges': [scores['best_match']],
+            'probabilities': {
+                '1': probabilities['1'],
+                '2-3': probabilities['2-3'],
+                '4-5': probabilities['4-5'],
+                '6-7': probabilities['6-7'],
+                'Below 7': probabilities['8-10'] + probabilities['Below 10']
+            },
+            'fit': scores['fit'],
+            'confidence': confidence
+        }
+    
+    def calculate_required_views_for_positions(self) -> Dict:
+        """Calculate required views on Day 0 for different position targets"""
+        
+        # Based on documentation thresholds
+        return {
+            'top_1': {
+                'followers': 1686,
+                'views': 74984,
+                'chapters': 18,
+                'views_per_chapter': 4166
+            },
+            'top_3': {
+                'followers': 1529,
+                'views': 67928,
+                'chapters': 21,
+                'views_per_chapter': 3314
+            },
+            'top_7': {
+                'followers': 1110,
+                'views': 50000,
+                'chapters': 25,
+                'views_per_chapter': 2000
+            },
+            'top_25': {
+                'followers': 500,
+                'views': 25000,
+                'chapters': 15,
+                'views_per_chapter': 1667
+            }
+        }
+    
+    def get_marketing_recommendations(self, current_growth: float, target_position: str) -> List[str]:
+        """Get marketing recommendations based on current growth and target"""
+        
+        recommendations = []
+        
+        # Calculate needed daily growth for target
+        target_ranges = {
+            'top_3': (50, 100),
+            'top_7': (30, 60),
+            'top_10': (20, 40),
+            'top_25': (10, 25)
+        }
+        
+        if target_position in target_ranges:
+            min_needed, max_needed = target_ranges[target_position]
+            gap = min_needed - current_growth
+            
+            if gap > 0:
+                # Need more growth
+                ads_needed = int(gap / 2)  # Assume 2 followers per ad
+                shoutouts_needed = int(gap / 5)  # Assume 5 followers per shoutout
+                
+                recommendations.append(f"📈 To reach {target_position}, increase daily growth by {gap:.0f} followers/day")
+                recommendations.append(f"💰 Consider {ads_needed}-{ads_needed+1} targeted ads (1-3 followers/ad/day)")
+                recommendations.append(f"🤝 Schedule {shoutouts_needed}-{shoutouts_needed+2} shoutouts with similar books")
+                recommendations.append("⚡ Post chapters at peak reader times (evenings/weekends)")
+            else:
+                recommendations.append(f"✅ Current growth sufficient for {target_position} potential")
+                recommendations.append("🎯 Maintain consistency and quality")
+        
+        return recommendations
+    
+    def generate_book_search_url(self, book_genres: List[str]) -> str:
+        """Generate search URL for finding shoutout partners"""
+        
+        # Find niche tags in book's genres
+        niche_matches = [tag for tag in book_genres if tag.lower() in self.NICHE_TAGS]
+        
+        if not niche_matches:
+            # Use first 2-3 genres
+            niche_matches = book_genres[:3]
+        
+        # Format tags for URL
+        tags_param = "%2C".join(niche_matches)
+        
+        base_url = "https://stepan.chizhov.com/author-tools/book-search/"
+        params = [
+            "sort_by=average_views",
+            "sort_order=asc",
+            f"tags_or={tags_param}",
+            "status=ONGOING%2CSTUB",
+            "range_average_views_min=1478",
+            "range_average_views_max=500000",
+            "search=true",
+            "search_page=1"
+        ]
+        
+        return f"{base_url}?{'&'.join(params)}"
+
+
 def add_detailed_rs_prediction(embed: discord.Embed, rs_data: Dict) -> discord.Embed:
     """
     Add detailed Rising Stars prediction information to an embed
@@ -245,383 +755,245 @@ def add_free_tier_rs_info(embed: discord.Embed, rs_data: Dict) -> discord.Embed:
     
     return embed
 
-    def add_premium_tier_rs_info(embed: discord.Embed, rs_data: Dict) -> discord.Embed:
-        """
-        Add premium tier detailed RS analysis to embed
-        """
-        growth_metrics = rs_data.get('growth_metrics', {})
-        predictions = rs_data.get('predictions', {})
-        enhanced = rs_data.get('enhanced_predictions', {})
-        trajectory = rs_data.get('growth_trajectory', {})
-        
-        # Current metrics with trajectory
-        metrics_text = (
-            f"**Daily Average:** {growth_metrics.get('recent_avg_growth', 0):.1f} followers/day\n"
-            f"**Weekly Total:** {growth_metrics.get('week_growth', 0)} followers\n"
-            f"**Current Base:** {growth_metrics.get('current_followers', 0):,} followers"
+def add_premium_tier_rs_info(embed: discord.Embed, rs_data: Dict) -> discord.Embed:
+    """
+    Add premium tier detailed RS analysis to embed
+    """
+    growth_metrics = rs_data.get('growth_metrics', {})
+    predictions = rs_data.get('predictions', {})
+    enhanced = rs_data.get('enhanced_predictions', {})
+    trajectory = rs_data.get('growth_trajectory', {})
+    
+    # Current metrics with trajectory
+    metrics_text = (
+        f"**Daily Average:** {growth_metrics.get('recent_avg_growth', 0):.1f} followers/day\n"
+        f"**Weekly Total:** {growth_metrics.get('week_growth', 0)} followers\n"
+        f"**Current Base:** {growth_metrics.get('current_followers', 0):,} followers"
+    )
+    
+    if trajectory:
+        metrics_text += f"\n\n**Trajectory:** {trajectory.get('pattern', 'Unknown')}"
+        metrics_text += f"\n**Trend:** {trajectory.get('trend', 'Unknown')}"
+        metrics_text += f"\n**Volatility:** {trajectory.get('volatility', 'Unknown')}"
+    
+    embed.add_field(
+        name="📊 Current Growth Metrics",
+        value=metrics_text,
+        inline=True
+    )
+    
+    # Position predictions with confidence
+    if predictions:
+        pred_text = (
+            f"**Estimated Peak:** #{predictions.get('estimated_position_range', 'Unknown')}\n"
+            f"**Confidence:** {predictions.get('confidence', 'Low').title()}\n"
         )
         
-        if trajectory:
-            metrics_text += f"\n\n**Trajectory:** {trajectory.get('pattern', 'Unknown')}"
-            metrics_text += f"\n**Trend:** {trajectory.get('trend', 'Unknown')}"
-            metrics_text += f"\n**Volatility:** {trajectory.get('volatility', 'Unknown')}"
+        if enhanced:
+            pred_text += f"\n**Growth Phase:** {enhanced.get('growth_phase', 'Unknown')}"
+            pred_text += f"\n**Day 0 Estimate:** +{enhanced.get('estimated_day0_growth', 0)} followers"
+            
+            if 'acceleration_bonus' in enhanced:
+                pred_text += f"\n🚀 {enhanced['acceleration_bonus']}"
+            elif 'acceleration_penalty' in enhanced:
+                pred_text += f"\n⚠️ {enhanced['acceleration_penalty']}"
         
         embed.add_field(
-            name="📊 Current Growth Metrics",
-            value=metrics_text,
+            name="🎯 Peak Position Analysis",
+            value=pred_text,
             inline=True
         )
+    
+    # Timeline estimate
+    timeline = rs_data.get('estimated_timeline', predictions.get('timeline', 'Unknown'))
+    embed.add_field(
+        name="⏰ RS Timeline",
+        value=f"**{timeline}**",
+        inline=True
+    )
+    
+    # Probability breakdown
+    if predictions.get('position_probabilities'):
+        prob_text = ""
+        probs = predictions['position_probabilities']
+        
+        # Sort by position order
+        position_order = ['#1', '#2-3', '#4-5', '#6-7', 'Below #7']
+        for pos in position_order:
+            if pos in probs and probs[pos] > 0:
+                # Add visual bar
+                bar_length = int(probs[pos] / 10)
+                bar = "█" * bar_length + "░" * (10 - bar_length)
+                prob_text += f"**{pos}:** {bar} {probs[pos]}%\n"
         
-        # Position predictions with confidence
-        if predictions:
-            pred_text = (
-                f"**Estimated Peak:** #{predictions.get('estimated_position_range', 'Unknown')}\n"
-                f"**Confidence:** {predictions.get('confidence', 'Low').title()}\n"
-            )
-            
-            if enhanced:
-                pred_text += f"\n**Growth Phase:** {enhanced.get('growth_phase', 'Unknown')}"
-                pred_text += f"\n**Day 0 Estimate:** +{enhanced.get('estimated_day0_growth', 0)} followers"
-                
-                if 'acceleration_bonus' in enhanced:
-                    pred_text += f"\n🚀 {enhanced['acceleration_bonus']}"
-                elif 'acceleration_penalty' in enhanced:
-                    pred_text += f"\n⚠️ {enhanced['acceleration_penalty']}"
-            
-            embed.add_field(
-                name="🎯 Peak Position Analysis",
-                value=pred_text,
-                inline=True
-            )
-        
-        # Timeline estimate
-        timeline = rs_data.get('estimated_timeline', predictions.get('timeline', 'Unknown'))
         embed.add_field(
-            name="⏰ RS Timeline",
-            value=f"**{timeline}**",
-            inline=True
+            name="📊 Position Probabilities",
+            value=prob_text or "No probability data available",
+            inline=False
         )
-        
-        # Probability breakdown
-        if predictions.get('position_probabilities'):
-            prob_text = ""
-            probs = predictions['position_probabilities']
-            
-            # Sort by position order
-            position_order = ['#1', '#2-3', '#4-5', '#6-7', 'Below #7']
-            for pos in position_order:
-                if pos in probs and probs[pos] > 0:
-                    # Add visual bar
-                    bar_length = int(probs[pos] / 10)
-                    bar = "█" * bar_length + "░" * (10 - bar_length)
-                    prob_text += f"**{pos}:** {bar} {probs[pos]}%\n"
-            
-            embed.add_field(
-                name="📊 Position Probabilities",
-                value=prob_text or "No probability data available",
-                inline=False
-            )
-        
-        # Required metrics for targets
-        required_views = rs_data.get('required_views', {})
-        if required_views:
-            # Focus on achievable targets based on current growth
-            current_avg = growth_metrics.get('recent_avg_growth', 0)
-            
-            targets_text = ""
-            if current_avg < 20:
-                # Show Top 25 and Top 7
-                for target in ['top_25', 'top_7']:
-                    if target in required_views:
-                        data = required_views[target]
-                        name = "Top 25" if target == 'top_25' else "Top 7"
-                        targets_text += f"**{name} Requirements:**\n"
-                        targets_text += f"• Views: {data['views_needed']:,}\n"
-                        targets_text += f"• Followers: {data['followers_needed']:,}\n\n"
-            else:
-                # Show Top 7 and Top 3
-                for target in ['top_7', 'top_3']:
-                    if target in required_views:
-                        data = required_views[target]
-                        name = "Top 7" if target == 'top_7' else "Top 3"
-                        targets_text += f"**{name} Requirements:**\n"
-                        targets_text += f"• Views: {data['views_needed']:,}\n"
-                        targets_text += f"• Followers: {data['followers_needed']:,}\n\n"
-            
-            if targets_text:
-                embed.add_field(
-                    name="📈 Day 0 Target Requirements",
-                    value=targets_text.strip(),
-                    inline=False
-                )
-        
-        # Specific recommendations
-        recommendations = rs_data.get('specific_recommendations', [])
-        marketing = rs_data.get('marketing_recommendations', {})
-        
-        if recommendations:
-            # Group by priority
-            urgent = [r for r in recommendations if r.get('priority') == 'urgent']
-            high = [r for r in recommendations if r.get('priority') == 'high']
-            medium = [r for r in recommendations if r.get('priority') == 'medium']
-            
-            rec_text = ""
-            if urgent:
-                rec_text += "**🚨 URGENT:**\n"
-                for r in urgent[:2]:
-                    rec_text += f"{r['text']}\n"
-                rec_text += "\n"
-            
-            if high:
-                rec_text += "**⚡ High Priority:**\n"
-                for r in high[:2]:
-                    rec_text += f"{r['text']}\n"
-                rec_text += "\n"
-            
-            if medium and len(rec_text) < 800:  # Discord limit
-                rec_text += "**📝 Also Consider:**\n"
-                for r in medium[:2]:
-                    rec_text += f"{r['text']}\n"
-            
-            if rec_text:
-                embed.add_field(
-                    name="🎯 Personalized Action Plan",
-                    value=rec_text.strip(),
-                    inline=False
-                )
-        elif marketing:
-            # Use basic marketing recommendations
-            current_avg = growth_metrics.get('recent_avg_growth', 0)
-            
-            # Find the most relevant target
-            if current_avg < 15:
-                target_data = marketing.get('top_25', {})
-                target_name = "Top 25"
-            elif current_avg < 30:
-                target_data = marketing.get('top_10', {})
-                target_name = "Top 10"
-            else:
-                target_data = marketing.get('top_7', {})
-                target_name = "Top 7"
-            
-            if target_data.get('gap', 0) > 0:
-                rec_text = (
-                    f"**Target: {target_name}**\n"
-                    f"• Need +{target_data['gap']:.0f} followers/day\n"
-                    f"• {target_data.get('ads_recommended', 0)} ads recommended\n"
-                    f"• {target_data.get('shoutouts_recommended', 0)} shoutouts needed\n"
-                    f"• Est. ad budget: {target_data.get('estimated_cost', {}).get('ads', '$10-30')}"
-                )
-            else:
-                rec_text = f"✅ Current growth sufficient for {target_name}!\nMaintain consistency."
-            
+    
+    # Required metrics for targets
+    required_views = rs_data.get('required_views', {})
+    if required_views:
+        # Focus on achievable targets based on current growth
+        current_avg = growth_metrics.get('recent_avg_growth', 0)
+        
+        targets_text = ""
+        if current_avg < 20:
+            # Show Top 25 and Top 7
+            for target in ['top_25', 'top_7']:
+                if target in required_views:
+                    data = required_views[target]
+                    name = "Top 25" if target == 'top_25' else "Top 7"
+                    targets_text += f"**{name} Requirements:**\n"
+                    targets_text += f"• Views: {data['views_needed']:,}\n"
+                    targets_text += f"• Followers: {data['followers_needed']:,}\n\n"
+        else:
+            # Show Top 7 and Top 3
+            for target in ['top_7', 'top_3']:
+                if target in required_views:
+                    data = required_views[target]
+                    name = "Top 7" if target == 'top_7' else "Top 3"
+                    targets_text += f"**{name} Requirements:**\n"
+                    targets_text += f"• Views: {data['views_needed']:,}\n"
+                    targets_text += f"• Followers: {data['followers_needed']:,}\n\n"
+        
+        if targets_text:
             embed.add_field(
-                name="📋 Marketing Requirements",
-                value=rec_text,
+                name="📈 Day 0 Target Requirements",
+                value=targets_text.strip(),
                 inline=False
             )
-        
-        # Shoutout partner finder
-        search_url = rs_data.get('shoutout_search_url')
-        if search_url:
+    
+    # Specific recommendations
+    recommendations = rs_data.get('specific_recommendations', [])
+    marketing = rs_data.get('marketing_recommendations', {})
+    
+    if recommendations:
+        # Group by priority
+        urgent = [r for r in recommendations if r.get('priority') == 'urgent']
+        high = [r for r in recommendations if r.get('priority') == 'high']
+        medium = [r for r in recommendations if r.get('priority') == 'medium']
+        
+        rec_text = ""
+        if urgent:
+            rec_text += "**🚨 URGENT:**\n"
+            for r in urgent[:2]:
+                rec_text += f"{r['text']}\n"
+            rec_text += "\n"
+        
+        if high:
+            rec_text += "**⚡ High Priority:**\n"
+            for r in high[:2]:
+                rec_text += f"{r['text']}\n"
+            rec_text += "\n"
+        
+        if medium and len(rec_text) < 800:  # Discord limit
+            rec_text += "**📝 Also Consider:**\n"
+            for r in medium[:2]:
+                rec_text += f"{r['text']}\n"
+        
+        if rec_text:
             embed.add_field(
-                name="🤝 Find Shoutout Partners",
-                value=(
-                    f"[**🔍 Search Matching Books**]({search_url})\n"
-                    "*Books with similar genres and reader base*\n"
-                    "*Sorted by engagement for best matches*"
-                ),
+                name="🎯 Personalized Action Plan",
+                value=rec_text.strip(),
                 inline=False
             )
-        
-        # Genre RS performance
-        genre_rs = rs_data.get('genre_rs_appearances', [])
-        if genre_rs:
-            genre_text = "**Current Rankings:**\n"
-            for i, appearance in enumerate(genre_rs[:5]):  # Top 5
-                tag = appearance['rs_tag'].replace('_', ' ').title()
-                genre_text += f"• **{tag}:** #{appearance['best_position']} "
-                genre_text += f"({appearance['appearances']}x)\n"
-            
-            embed.add_field(
-                name="🏆 Genre Rising Stars",
-                value=genre_text,
-                inline=True
+    elif marketing:
+        # Use basic marketing recommendations
+        current_avg = growth_metrics.get('recent_avg_growth', 0)
+        
+        # Find the most relevant target
+        if current_avg < 15:
+            target_data = marketing.get('top_25', {})
+            target_name = "Top 25"
+        elif current_avg < 30:
+            target_data = marketing.get('top_10', {})
+            target_name = "Top 10"
+        else:
+            target_data = marketing.get('top_7', {})
+            target_name = "Top 7"
+        
+        if target_data.get('gap', 0) > 0:
+            rec_text = (
+                f"**Target: {target_name}**\n"
+                f"• Need +{target_data['gap']:.0f} followers/day\n"
+                f"• {target_data.get('ads_recommended', 0)} ads recommended\n"
+                f"• {target_data.get('shoutouts_recommended', 0)} shoutouts needed\n"
+                f"• Est. ad budget: {target_data.get('estimated_cost', {}).get('ads', '$10-30')}"
             )
+        else:
+            rec_text = f"✅ Current growth sufficient for {target_name}!\nMaintain consistency."
         
-        # Risk disclaimer (always include)
         embed.add_field(
-            name="⚠️ Disclaimer",
+            name="📋 Marketing Requirements",
+            value=rec_text,
+            inline=False
+        )
+    
+    # Shoutout partner finder
+    search_url = rs_data.get('shoutout_search_url')
+    if search_url:
+        embed.add_field(
+            name="🤝 Find Shoutout Partners",
             value=(
-                "*Marketing involves financial risk. Results not guaranteed. "
-                "This is analytical data, not financial advice.*"
+                f"[**🔍 Search Matching Books**]({search_url})\n"
+                "*Books with similar genres and reader base*\n"
+                "*Sorted by engagement for best matches*"
             ),
             inline=False
         )
-        
-        return embed
     
-    
-    def create_rs_summary_field(rs_data: Dict) -> Optional[Dict]:
-        """
-        Create a summary field for RS prediction (used in quick checks)
-        """
-        if not rs_data or not rs_data.get('eligible'):
-            return None
-        
-        growth_metrics = rs_data.get('growth_metrics', {})
-        recent_avg = growth_metrics.get('recent_avg_growth', 0)
-        
-        if recent_avg >= 10:
-            icon = "🔥"
-            status = "High RS Potential"
-        elif recent_avg >= 5:
-            icon = "📈"
-            status = "Moderate RS Potential"
-        else:
-            icon = "🌱"
-            status = "Building RS Potential"
+    # Genre RS performance
+    genre_rs = rs_data.get('genre_rs_appearances', [])
+    if genre_rs:
+        genre_text = "**Current Rankings:**\n"
+        for i, appearance in enumerate(genre_rs[:5]):  # Top 5
+            tag = appearance['rs_tag'].replace('_', ' ').title()
+            genre_text += f"• **{tag}:** #{appearance['best_position']} "
+            genre_text += f"({appearance['appearances']}x)\n"
         
-        return {
-            'name': f"{icon} Rising Stars Alert",
-            'value': f"**{status}** - Use `rs_prediction:True` for full analysis",
-            'inline': False
-        }
+        embed.add_field(
+            name="🏆 Genre Rising Stars",
+            value=genre_text,
+            inline=True
+        )
     
-    def predict_position(self, week_growth: int, day0_growth: int = None) -> Dict:
-        """Predict potential RS position based on growth patterns"""
-        
-        # If we don't have day0 growth yet, estimate from recent trend
-        if day0_growth is None:
-            recent_avg = np.mean([g for _, g in self.daily_growth[-3:]]) if len(self.daily_growth) >= 3 else 10
-            day0_growth = int(recent_avg * 2.5)  # Assume boost on RS entry
-        
-        predictions = {
-            'position_ranges': [],
-            'probabilities': {},
-            'confidence': 'low'
-        }
-        
-        # Compare against benchmarks
-        if week_growth >= 550 and day0_growth >= 200:
-            predictions['position_ranges'].append('1-3')
-            predictions['probabilities'] = {
-                '1': 15, '2-3': 35, '4-5': 30, '6-7': 15, 'Below 7': 5
-            }
-            predictions['confidence'] = 'medium-high'
-        elif week_growth >= 300 and day0_growth >= 90:
-            predictions['position_ranges'].append('2-5')
-            predictions['probabilities'] = {
-                '1': 5, '2-3': 25, '4-5': 35, '6-7': 25, 'Below 7': 10
-            }
-            predictions['confidence'] = 'medium'
-        elif week_growth >= 230 and day0_growth >= 70:
-            predictions['position_ranges'].append('4-7')
-            predictions['probabilities'] = {
-                '1': 2, '2-3': 10, '4-5': 25, '6-7': 35, 'Below 7': 28
-            }
-            predictions['confidence'] = 'medium'
-        elif week_growth >= 160 and day0_growth >= 55:
-            predictions['position_ranges'].append('6-10')
-            predictions['probabilities'] = {
-                '1': 0, '2-3': 5, '4-5': 15, '6-7': 30, 'Below 7': 50
-            }
-            predictions['confidence'] = 'low-medium'
-        else:
-            predictions['position_ranges'].append('8-15')
-            predictions['probabilities'] = {
-                '1': 0, '2-3': 2, '4-5': 8, '6-7': 20, 'Below 7': 70
-            }
-            predictions['confidence'] = 'low'
-        
-        return predictions
+    # Risk disclaimer (always include)
+    embed.add_field(
+        name="⚠️ Disclaimer",
+        value=(
+            "*Marketing involves financial risk. Results not guaranteed. "
+            "This is analytical data, not financial advice.*"
+        ),
+        inline=False
+    )
     
-    def calculate_required_views_for_positions(self) -> Dict:
-        """Calculate required views on Day 0 for different position targets"""
-        
-        # Based on documentation thresholds
-        return {
-            'top_1': {
-                'followers': 1686,
-                'views': 74984,
-                'chapters': 18,
-                'views_per_chapter': 4166
-            },
-            'top_3': {
-                'followers': 1529,
-                'views': 67928,
-                'chapters': 21,
-                'views_per_chapter': 3314
-            },
-            'top_7': {
-                'followers': 1110,
-                'views': 50000,
-                'chapters': 25,
-                'views_per_chapter': 2000
-            },
-            'top_25': {
-                'followers': 500,
-                'views': 25000,
-                'chapters': 15,
-                'views_per_chapter': 1667
-            }
-        }
+    return embed
+
+
+def create_rs_summary_field(rs_data: Dict) -> Optional[Dict]:
+    """
+    Create a summary field for RS prediction (used in quick checks)
+    """
+    if not rs_data or not rs_data.get('eligible'):
+        return None
     
-    def get_marketing_recommendations(self, current_growth: float, target_position: str) -> List[str]:
-        """Get marketing recommendations based on current growth and target"""
-        
-        recommendations = []
-        
-        # Calculate needed daily growth for target
-        target_ranges = {
-            'top_3': (50, 100),
-            'top_7': (30, 60),
-            'top_10': (20, 40),
-            'top_25': (10, 25)
-        }
-        
-        if target_position in target_ranges:
-            min_needed, max_needed = target_ranges[target_position]
-            gap = min_needed - current_growth
-            
-            if gap > 0:
-                # Need more growth
-                ads_needed = int(gap / 2)  # Assume 2 followers per ad
-                shoutouts_needed = int(gap / 5)  # Assume 5 followers per shoutout
-                
-                recommendations.append(f"📈 To reach {target_position}, increase daily growth by {gap:.0f} followers/day")
-                recommendations.append(f"💰 Consider {ads_needed}-{ads_needed+1} targeted ads (1-3 followers/ad/day)")
-                recommendations.append(f"🤝 Schedule {shoutouts_needed}-{shoutouts_needed+2} shoutouts with similar books")
-                recommendations.append("⚡ Post chapters at peak reader times (evenings/weekends)")
-            else:
-                recommendations.append(f"✅ Current growth sufficient for {target_position} potential")
-                recommendations.append("🎯 Maintain consistency and quality")
-        
-        return recommendations
+    growth_metrics = rs_data.get('growth_metrics', {})
+    recent_avg = growth_metrics.get('recent_avg_growth', 0)
     
-    def generate_book_search_url(self, book_genres: List[str]) -> str:
-        """Generate search URL for finding shoutout partners"""
-        
-        # Find niche tags in book's genres
-        niche_matches = [tag for tag in book_genres if tag.lower() in self.NICHE_TAGS]
-        
-        if not niche_matches:
-            # Use first 2-3 genres
-            niche_matches = book_genres[:3]
-        
-        # Format tags for URL
-        tags_param = "%2C".join(niche_matches)
-        
-        base_url = "https://stepan.chizhov.com/author-tools/book-search/"
-        params = [
-            "sort_by=average_views",
-            "sort_order=asc",
-            f"tags_or={tags_param}",
-            "status=ONGOING%2CSTUB",
-            "range_average_views_min=1478",
-            "range_average_views_max=500000",
-            "search=true",
-            "search_page=1"
-        ]
-        
-        return f"{base_url}?{'&'.join(params)}"
+    if recent_avg >= 10:
+        icon = "🔥"
+        status = "High RS Potential"
+    elif recent_avg >= 5:
+        icon = "📈"
+        status = "Moderate RS Potential"
+    else:
+        icon = "🌱"
+        status = "Building RS Potential"
+    
+    return {
+        'name': f"{icon} Rising Stars Alert",
+        'value': f"**{status}** - Use `rs_prediction:True` for full analysis",
+        'inline': False
+    }
@@ -1,28 +1,38 @@
 import discord
 from discord.ext import commands
 import aiohttp
-import json
 import logging
 import os
 import re
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from datetime import datetime
+from datetime import datetime, timedelta
 import numpy as np
 import io
 from typing import Dict, Any, List, Optional
 
+from book_series_cache import BookSeriesCache
+from rs_appearance_index import RSAppearanceIndex
+from chart_commands_module import run_render
+from metrics import record_cache
+from tracing import tracer
+import json_codec
+
 # Set up logging
 logger = logging.getLogger('discord')
 
 class RSAnalysisModule:
-    def __init__(self, bot, session, wp_api_url, wp_bot_token, add_promotional_field_func=None):
+    def __init__(self, bot, session, wp_api_url, wp_bot_token, add_promotional_field_func=None, series_cache=None,
+                 appearance_index: Optional[RSAppearanceIndex] = None):
         self.bot = bot
         self.session = session
         self.wp_api_url = wp_api_url
         self.wp_bot_token = wp_bot_token
         self.command_counter = 0
         
+        # Snapshot series shared with the chart commands
+        self.series_cache = series_cache or BookSeriesCache(session, wp_api_url, wp_bot_token)
+        
         # Store the promotional field function
         self.add_promotional_field = add_promotional_field_func or (lambda e, f=False: e)
         
@@ -52,6 +62,11 @@ class RSAnalysisModule:
             'mystery', 'psychological'
         ]
         
+        # Local RS appearance index; /rr-rs-run falls back to the API when it can't answer.
+        # The bot passes one shared index so reconnects don't start more sync loops
+        self.appearance_index = appearance_index or RSAppearanceIndex(session, wp_api_url, wp_bot_token, self.ALL_RS_TAGS)
+        self.appearance_index.start()
+        
         # Register commands
         self.register_commands()
     
@@ -103,8 +118,8 @@ class RSAnalysisModule:
         # DEFER IMMEDIATELY - Critical for avoiding timeout
         await interaction.response.defer()
         
-        logger.info(f"\n[RR-RS-CHART] Command called by {interaction.user}")
-        logger.info(f"[RR-RS-CHART] Book input: '{book_input}', Days before: {days_before}, Days after: {days_after}")
+        logger.info("\n[RR-RS-CHART] Command called by %s", interaction.user)
+        logger.info("[RR-RS-CHART] Book input: '%s', Days before: %s, Days after: %s", book_input, days_before, days_after)
         
         try:
             # Parse book input to get book ID
@@ -124,6 +139,13 @@ class RSAnalysisModule:
                 'bot_token': self.wp_bot_token
             }
             
+            # Followers/views around the run can be cut from an already cached series
+            cached_series = None
+            if self.series_cache.get_cached(book_id) is not None:
+                cached_series = await self.series_cache.get_series(book_id)
+            if cached_series is not None and len(cached_series):
+                request_data['include_chart_data'] = False
+            
             headers = {
                 'User-Agent': 'RR-Discord-Bot/1.0',
                 'Content-Type': 'application/json',
@@ -139,18 +161,18 @@ class RSAnalysisModule:
                 headers=headers,
                 timeout=30
             ) as response:
-                response_text = await response.text()
-                logger.info(f"[RR-RS-CHART] API Response Status: {response.status}")
+                body = await response.read()
+                logger.info("[RR-RS-CHART] API Response Status: %s", response.status)
                 
                 if response.status == 403:
-                    logger.info(f"[RR-RS-CHART] 403 Forbidden - Authentication failed")
+                    logger.info("[RR-RS-CHART] 403 Forbidden - Authentication failed")
                     await interaction.followup.send(
                         "❌ Authentication error. The bot token may be misconfigured.",
                         ephemeral=True
                     )
                     return
                 elif response.status != 200:
-                    logger.info(f"[RR-RS-CHART] API error response: {response_text[:500]}")
+                    logger.info("[RR-RS-CHART] API error response: %r", body[:500])
                     await interaction.followup.send(
                         f"❌ API error: {response.status}\nPlease contact support if this persists.",
                         ephemeral=True
@@ -158,9 +180,10 @@ class RSAnalysisModule:
                     return
                 
                 try:
-                    data = json.loads(response_text)
-                except json.JSONDecodeError as e:
-                    logger.info(f"[RR-RS-CHART] Failed to parse JSON: {e}")
+                    with tracer.span('json.parse', **{'payload.bytes': len(body), 'json.backend': json_codec.JSON_BACKEND}):
+                        data = json_codec.loads(body)
+                except json_codec.JSONDecodeError as e:
+                    logger.info("[RR-RS-CHART] Failed to parse JSON: %s", e)
                     await interaction.followup.send(
                         "❌ Invalid response from server. Please try again later.",
                         ephemeral=True
@@ -178,12 +201,23 @@ class RSAnalysisModule:
             rs_info = data.get('rs_info', {})
             growth_analysis = data.get('growth_analysis', {})
             
+            if not chart_data.get('dates') and cached_series is not None and rs_info.get('first_appearance'):
+                window_start = datetime.strptime(rs_info['first_appearance'], '%Y-%m-%d') - timedelta(days=days_before)
+                window_end = datetime.strptime(
+                    rs_info.get('last_appearance') or rs_info['first_appearance'], '%Y-%m-%d'
+                ) + timedelta(days=days_after)
+                chart_data = cached_series.daily_window(
+                    window_start.strftime('%Y-%m-%d'),
+                    window_end.strftime('%Y-%m-%d')
+                )
+            
             book_title = book_info.get('title', f'Book {book_id}')
             book_url = book_info.get('url', f'https://www.royalroad.com/fiction/{book_id}')
             author = book_info.get('author_name', 'Unknown Author')
             
             # Create the chart
-            chart_buffer = self.create_rs_impact_chart(chart_data, rs_info, book_title)
+            # Render on the shared chart worker so pyplot stays on one thread
+            chart_buffer = await run_render(self.create_rs_impact_chart, chart_data, rs_info, book_title)
             
             if not chart_buffer:
                 await interaction.followup.send(
@@ -254,10 +288,10 @@ class RSAnalysisModule:
             embed.set_footer(text="Data from Stepan Chizhov's Royal Road Analytics\nTo use the bot, start typing /rr-rs-chart")
             
             await interaction.followup.send(embed=embed, file=file)
-            logger.info(f"[RR-RS-CHART] Successfully sent RS impact chart for book {book_id}")
+            logger.info("[RR-RS-CHART] Successfully sent RS impact chart for book %s", book_id)
             
         except Exception as e:
-            logger.info(f"[RR-RS-CHART] Error: {e}")
+            logger.info("[RR-RS-CHART] Error: %s", e)
             import traceback
             traceback.print_exc()
             
@@ -278,8 +312,8 @@ class RSAnalysisModule:
         """Show Rising Stars run information for a book"""
         self.command_counter += 1
         
-        logger.info(f"\n[RR-RS-RUN] Command called by {interaction.user}")
-        logger.info(f"[RR-RS-RUN] Book input: '{book_input}', Tags: '{tags}'")
+        logger.info("\n[RR-RS-RUN] Command called by %s", interaction.user)
+        logger.info("[RR-RS-RUN] Book input: '%s', Tags: '%s'", book_input, tags)
         
         await interaction.response.defer()
         
@@ -298,47 +332,54 @@ class RSAnalysisModule:
                 )
                 return
             
-            # Prepare request data
-            request_data = {
-                'book_id': book_id,
-                'tags': requested_tags,
-                'bot_token': self.wp_bot_token
-            }
-            
-            headers = {
-                'User-Agent': 'RR-Discord-Bot/1.0',
-                'Content-Type': 'application/json',
-                'X-WP-Nonce': 'discord-bot-request',
-                'X-Forwarded-For': '127.0.0.1',
-                'X-Real-IP': '127.0.0.1'
-            }
+            # Answer from the local appearance index when possible
+            indexed = self.appearance_index.get_run_data(book_id, requested_tags)
+            record_cache('rs_appearance_index', 'miss' if indexed is None else 'hit')
             
-            # Make API request
-            async with self.session.post(
-                f"{self.wp_api_url}/wp-json/rr-analytics/v1/rising-stars-run",
-                json=request_data,
-                headers=headers,
-                timeout=30
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.info(f"[RR-RS-RUN] API error: {response.status} - {error_text}")
-                    await interaction.followup.send(
-                        f"❌ API error: {response.status}",
-                        ephemeral=True
-                    )
-                    return
+            if indexed is not None:
+                book_info, rs_data = indexed
+            else:
+                # Prepare request data
+                request_data = {
+                    'book_id': book_id,
+                    'tags': requested_tags,
+                    'bot_token': self.wp_bot_token
+                }
+            
+                headers = {
+                    'User-Agent': 'RR-Discord-Bot/1.0',
+                    'Content-Type': 'application/json',
+                    'X-WP-Nonce': 'discord-bot-request',
+                    'X-Forwarded-For': '127.0.0.1',
+                    'X-Real-IP': '127.0.0.1'
+                }
+            
+                # Make API request
+                async with self.session.post(
+                    f"{self.wp_api_url}/wp-json/rr-analytics/v1/rising-stars-run",
+                    json=request_data,
+                    headers=headers,
+                    timeout=30
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logger.info("[RR-RS-RUN] API error: %s - %s", response.status, error_text)
+                        await interaction.followup.send(
+                            f"❌ API error: {response.status}",
+                            ephemeral=True
+                        )
+                        return
                 
-                data = await response.json()
+                    data = await json_codec.read_json(response)
             
-            if not data.get('success'):
-                error_msg = data.get('message', 'Unknown error occurred')
-                await interaction.followup.send(f"❌ {error_msg}", ephemeral=True)
-                return
+                if not data.get('success'):
+                    error_msg = data.get('message', 'Unknown error occurred')
+                    await interaction.followup.send(f"❌ {error_msg}", ephemeral=True)
+                    return
             
-            # Extract book info and RS data
-            book_info = data.get('book_info', {})
-            rs_data = data.get('rising_stars_data', {})
+                # Extract book info and RS data
+                book_info = data.get('book_info', {})
+                rs_data = data.get('rising_stars_data', {})
             
             if not book_info:
                 await interaction.followup.send(
@@ -354,10 +395,10 @@ class RSAnalysisModule:
             embed = self.add_promotional_field(embed)
             
             await interaction.followup.send(embed=embed)
-            logger.info(f"[RR-RS-RUN] Successfully sent RS run data for book {book_id}")
+            logger.info("[RR-RS-RUN] Successfully sent RS run data for book %s", book_id)
             
         except Exception as e:
-            logger.info(f"[RR-RS-RUN] Error: {e}")
+            logger.info("[RR-RS-RUN] Error: %s", e)
             import traceback
             traceback.print_exc()
             
@@ -495,7 +536,7 @@ class RSAnalysisModule:
             return buffer
             
         except Exception as e:
-            logger.info(f"[RS-CHART] Error creating chart image: {e}")
+            logger.info("[RS-CHART] Error creating chart image: %s", e)
             import traceback
             traceback.print_exc()
             plt.close()
@@ -0,0 +1,244 @@
+"""
+Rising Stars appearance index for Discord Essence Bot
+Keeps a compact in-memory summary of every book's Rising Stars appearances
+so /rr-rs-run can be answered without a backend query per tag
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+import json_codec
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# How often the index pulls new appearances (seconds)
+RS_INDEX_REFRESH_INTERVAL = 30 * 60
+# Data older than this is considered stale and handlers fall back to the API
+RS_INDEX_MAX_STALENESS = 3 * RS_INDEX_REFRESH_INTERVAL
+
+# Column layout of the per-(book, tag) stats rows
+FIRST_SEEN = 0          # Unix timestamp of first appearance
+LAST_SEEN = 1           # Unix timestamp of latest appearance
+BEST_POSITION = 2       # Best (lowest) position, 0 if never seen
+APPEARANCES = 3         # Number of scrapes the book appeared in
+DAYS_ON_LIST = 4        # Distinct days the book appeared
+LAST_POSITION = 5       # Position in the latest appearance
+PREVIOUS_POSITION = 6   # Position in the appearance before that
+NUM_COLUMNS = 7
+
+SECONDS_PER_DAY = 86400
+# Initial number of (book, tag) rows allocated; doubled when full
+RS_INDEX_INITIAL_ROWS = 4096
+
+
+def parse_timestamp(value: str) -> int:
+    """Convert a 'YYYY-MM-DD HH:MM:SS' UTC timestamp to Unix seconds"""
+    return int(datetime.strptime(value, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc).timestamp())
+
+
+def format_date(timestamp: int) -> str:
+    """Convert Unix seconds to 'YYYY-MM-DD'"""
+    return datetime.fromtimestamp(int(timestamp), tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+class RSAppearanceIndex:
+    """
+    In-bot index of Rising Stars appearances
+
+    Stats live in one int64 array of NUM_COLUMNS columns with a row per
+    (book, RS list) pair the book has actually appeared on; rows maps a
+    book to its {tag row: stats row}. Most books appear on one or two lists,
+    so this stays small where a dense (tags x columns) array per book would
+    not. The index is synced incrementally from the rising-stars-appearances
+    endpoint using the timestamp of the newest appearance already applied.
+    """
+
+    def __init__(self, session, wp_api_url: str, wp_bot_token: str, tags: List[str]):
+        self.session = session
+        self.wp_api_url = wp_api_url
+        self.wp_bot_token = wp_bot_token
+        self.tags = list(tags)
+        self.tag_index = {tag: i for i, tag in enumerate(self.tags)}
+
+        self.stats = np.zeros((RS_INDEX_INITIAL_ROWS, NUM_COLUMNS), dtype=np.int64)
+        self.row_count = 0
+        # Book id -> tag row -> row in self.stats
+        self.rows: Dict[str, Dict[int, int]] = {}
+        self.book_info: Dict[str, Dict[str, Any]] = {}
+        # Newest scrape seen per tag, used to decide whether a book is on the list now
+        self.latest_scrape = np.zeros(len(self.tags), dtype=np.int64)
+        self.last_timestamp: Optional[str] = None
+        self.last_refresh = 0.0
+        self.refresh_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start syncing in the background"""
+        if self.refresh_task is None:
+            self.refresh_task = asyncio.create_task(self.refresh_loop())
+
+    async def refresh_loop(self):
+        """Sync the index every RS_INDEX_REFRESH_INTERVAL seconds"""
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[RS_INDEX] Refresh failed: {e}")
+            await asyncio.sleep(RS_INDEX_REFRESH_INTERVAL)
+
+    def is_fresh(self) -> bool:
+        """Whether the index has recent enough data to answer queries"""
+        return self.last_refresh > 0 and time.monotonic() - self.last_refresh < RS_INDEX_MAX_STALENESS
+
+    async def refresh(self) -> bool:
+        """
+        Pull appearances recorded since the last sync
+
+        Returns:
+            True if the index was updated successfully
+        """
+        request_data = {
+            'since': self.last_timestamp,
+            'bot_token': self.wp_bot_token
+        }
+
+        headers = {
+            'User-Agent': 'RR-Discord-Bot/1.0',
+            'Content-Type': 'application/json'
+        }
+
+        async with self.session.post(
+            f"{self.wp_api_url}/wp-json/rr-analytics/v1/rising-stars-appearances",
+            json=request_data,
+            headers=headers,
+            timeout=120
+        ) as response:
+            if response.status != 200:
+                logger.error(f"[RS_INDEX] API error: {response.status}")
+                return False
+            data = await json_codec.read_json(response)
+
+        if not data.get('success'):
+            logger.error(f"[RS_INDEX] Delta sync not available: {data.get('message', 'unknown error')}")
+            return False
+
+        for book_id, info in data.get('books', {}).items():
+            self.book_info[str(book_id)] = info
+
+        appearances = data.get('appearances', [])
+        self.apply_appearances(appearances)
+
+        if data.get('timestamp'):
+            self.last_timestamp = max(self.last_timestamp or '', data['timestamp'])
+
+        self.last_refresh = time.monotonic()
+        logger.info(f"[RS_INDEX] Applied {len(appearances)} appearance(s), {len(self.rows)} books indexed")
+        return True
+
+    def apply_appearances(self, appearances: List[Dict[str, Any]]):
+        """
+        Merge appearance rows into the index
+
+        Each row has 'book_id', 'tag', 'position' and 'scraped_at'.
+        Rows are applied oldest first so the running columns stay correct.
+        """
+        rows = []
+        for row in appearances:
+            tag_row = self.tag_index.get(row.get('tag'))
+            if tag_row is None or not row.get('scraped_at'):
+                continue
+            rows.append((parse_timestamp(row['scraped_at']), str(row['book_id']), tag_row, int(row['position'])))
+
+        rows.sort()
+
+        for scraped_at, book_id, tag_row, position in rows:
+            book_rows = self.rows.setdefault(book_id, {})
+            row = book_rows.get(tag_row)
+            if row is None:
+                row = book_rows[tag_row] = self.allocate_row()
+
+            stats = self.stats[row]
+            if stats[APPEARANCES] == 0:
+                stats[FIRST_SEEN] = scraped_at
+                stats[BEST_POSITION] = position
+                stats[DAYS_ON_LIST] = 1
+            else:
+                if scraped_at // SECONDS_PER_DAY > stats[LAST_SEEN] // SECONDS_PER_DAY:
+                    stats[DAYS_ON_LIST] += 1
+                stats[BEST_POSITION] = min(stats[BEST_POSITION], position)
+
+            stats[APPEARANCES] += 1
+            stats[LAST_SEEN] = scraped_at
+            stats[PREVIOUS_POSITION] = stats[LAST_POSITION]
+            stats[LAST_POSITION] = position
+
+            if scraped_at > self.latest_scrape[tag_row]:
+                self.latest_scrape[tag_row] = scraped_at
+
+    def allocate_row(self) -> int:
+        """Take the next free stats row, doubling the array when it is full"""
+        if self.row_count == len(self.stats):
+            self.stats = np.concatenate([self.stats, np.zeros_like(self.stats)])
+        self.row_count += 1
+        return self.row_count - 1
+
+    def get_run_data(self, book_id: str, requested_tags: List[str]) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Build the (book_info, rising_stars_data) pair used by create_rs_run_embed
+
+        Returns None when the API should be used instead (stale index or a
+        book the index knows nothing about).
+        """
+        book_id = str(book_id)
+        if not self.is_fresh() or book_id not in self.book_info:
+            return None
+
+        book_info = self.book_info[book_id]
+        book_rows = self.rows.get(book_id, {})
+
+        # Only the requested lists the book has appeared on have rows
+        tags = [tag for tag in requested_tags if self.tag_index.get(tag) in book_rows]
+        if not tags:
+            return book_info, {}
+
+        tag_rows = np.array([self.tag_index[tag] for tag in tags], dtype=np.intp)
+        selected = self.stats[[book_rows[self.tag_index[tag]] for tag in tags]]
+        latest = self.latest_scrape[tag_rows]
+
+        # Vectorized per-tag flags for all requested lists at once
+        seen = selected[:, APPEARANCES] > 0
+        on_list_now = seen & (selected[:, LAST_SEEN] == latest)
+        has_previous = selected[:, PREVIOUS_POSITION] > 0
+        rising = has_previous & (selected[:, LAST_POSITION] < selected[:, PREVIOUS_POSITION])
+        falling = has_previous & (selected[:, LAST_POSITION] > selected[:, PREVIOUS_POSITION])
+
+        rs_data = {}
+        for i in np.flatnonzero(seen):
+            stats = selected[i]
+            if not on_list_now[i]:
+                trend = None
+            elif rising[i]:
+                trend = 'rising'
+            elif falling[i]:
+                trend = 'falling'
+            else:
+                trend = 'stable'
+
+            rs_data[tags[i]] = {
+                'first_seen': format_date(stats[FIRST_SEEN]),
+                'last_seen': format_date(stats[LAST_SEEN]),
+                'current_position': int(stats[LAST_POSITION]) if on_list_now[i] else None,
+                'best_position': int(stats[BEST_POSITION]),
+                'days_on_list': int(stats[DAYS_ON_LIST]),
+                'appearances': int(stats[APPEARANCES]),
+                'trend': trend
+            }
+
+        return book_info, rs_data
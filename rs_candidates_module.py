@@ -0,0 +1,315 @@
+import discord
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from rising_stars_prediction import RisingStarsPrediction, BENCHMARK_LABELS
+import json_codec
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# How often all recently tracked books are rescanned (seconds)
+RS_SCAN_INTERVAL = 6 * 60 * 60
+# Days of daily follower counts pulled per book
+RS_SCAN_DAYS = 15
+# Number of ranked candidates kept for the leaderboard
+RS_LEADERBOARD_SIZE = 50
+# Representative position of each benchmark band, used to rank candidates
+BAND_POSITIONS = np.array([1.0, 2.5, 4.5, 6.5, 9.0, 15.0])
+# Discord's limit on the total characters of an embed
+EMBED_CHAR_LIMIT = 6000
+# Room kept for the promotional field (a full-size field name and value)
+PROMO_FIELD_RESERVE = 256 + 1024
+# Room kept for the "...and N more" note when rows are cut
+MORE_NOTE_RESERVE = 40
+
+
+class RSCandidatesModule:
+    """
+    Batch Rising Stars candidate scanner
+
+    Pulls daily follower counts and eligibility aggregates for every recently
+    tracked book in one request, applies the RisingStarsPrediction eligibility
+    rules and benchmark scoring to the whole set with NumPy, and keeps a
+    ranked table that /rr-rs-candidates serves from memory.
+    """
+
+    def __init__(self, bot, session, wp_api_url, wp_bot_token, add_promotional_field_func=None):
+        self.bot = bot
+        self.session = session
+        self.wp_api_url = wp_api_url
+        self.wp_bot_token = wp_bot_token
+        self.command_counter = 0
+
+        # Store the promotional field function
+        self.add_promotional_field = add_promotional_field_func or (lambda e, f=False: e)
+
+        # Latest scan results
+        self.candidates: List[Dict[str, Any]] = []
+        self.scanned_books = 0
+        self.eligible_books = 0
+        self.last_scan: Optional[datetime] = None
+        self.scan_lock = asyncio.Lock()
+        self.scan_task = asyncio.create_task(self.scan_loop())
+
+        # Register commands
+        self.register_commands()
+
+    def register_commands(self):
+        """Register Rising Stars candidate commands with the bot"""
+
+        @self.bot.tree.command(
+            name="rr-rs-candidates",
+            description="Show tracked books most likely to reach Main Rising Stars soon"
+        )
+        @discord.app_commands.describe(
+            count="Number of books to show (1-25, default: 10)"
+        )
+        async def rr_rs_candidates(interaction: discord.Interaction, count: int = 10):
+            await self.rs_candidates_handler(interaction, count)
+
+    async def scan_loop(self):
+        """Rescan all candidates every RS_SCAN_INTERVAL seconds"""
+        while True:
+            try:
+                await self.scan()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[RS_CANDIDATES] Scan failed: {e}")
+            await asyncio.sleep(RS_SCAN_INTERVAL)
+
+    async def scan(self) -> bool:
+        """
+        Fetch and score all recently tracked books
+
+        Returns:
+            True if the candidates table was rebuilt
+        """
+        async with self.scan_lock:
+            started = time.monotonic()
+            data = await self.fetch_candidate_data()
+            if not data:
+                return False
+
+            books = data.get('books', [])
+            self.candidates = self.rank_candidates(books)
+            self.scanned_books = len(books)
+            self.last_scan = datetime.now()
+
+            logger.info(
+                f"[RS_CANDIDATES] Scanned {len(books)} books, {self.eligible_books} eligible "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+            return True
+
+    async def fetch_candidate_data(self) -> Optional[Dict[str, Any]]:
+        """Bulk download daily followers and eligibility aggregates for recent books"""
+        request_data = {
+            'days': RS_SCAN_DAYS,
+            'bot_token': self.wp_bot_token
+        }
+
+        headers = {
+            'User-Agent': 'RR-Discord-Bot/1.0',
+            'Content-Type': 'application/json'
+        }
+
+        async with self.session.post(
+            f"{self.wp_api_url}/wp-json/rr-analytics/v1/rising-stars-candidates",
+            json=request_data,
+            headers=headers,
+            timeout=120
+        ) as response:
+            if response.status != 200:
+                logger.error(f"[RS_CANDIDATES] API error: {response.status}")
+                return None
+            data = await json_codec.read_json(response)
+
+        if not data.get('success'):
+            logger.error(f"[RS_CANDIDATES] Scan data not available: {data.get('message', 'unknown error')}")
+            return None
+
+        return data
+
+    def rank_candidates(self, books: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Score every book in one pass and return the best eligible ones
+
+        Each book has 'daily_followers' (last follower count per day, oldest
+        first, None for days without a snapshot) plus the eligibility
+        aggregates 'has_main_rs', 'has_old_records', 'old_max_followers'
+        and 'genre_rs_count'.
+        """
+        if not books:
+            self.eligible_books = 0
+            return []
+
+        days = max(len(book.get('daily_followers') or []) for book in books)
+        followers = np.full((len(books), max(days, 2)), np.nan)
+        for row, book in enumerate(books):
+            values = [np.nan if value is None else value for value in book.get('daily_followers') or []]
+            if values:
+                followers[row, -len(values):] = values
+
+        growth = np.diff(followers, axis=1)
+
+        eligible, _ = RisingStarsPrediction.check_eligibility_batch(
+            [bool(book.get('has_main_rs')) for book in books],
+            [bool(book.get('has_old_records')) for book in books],
+            [book.get('old_max_followers') or 0 for book in books],
+            [book.get('genre_rs_count') or 0 for book in books],
+            growth
+        )
+        self.eligible_books = int(eligible.sum())
+        if not self.eligible_books:
+            return []
+
+        indices = np.flatnonzero(eligible)
+        recent = np.nan_to_num(growth[indices, -7:])
+
+        # Same vectors as the single-book predict_position
+        vectors, recent_avg = RisingStarsPrediction.growth_vectors(growth[indices])
+        _, probabilities = RisingStarsPrediction.score_growth_matrix(vectors)
+        expected_position = probabilities @ BAND_POSITIONS
+        best_band = probabilities.argmax(axis=1)
+
+        # Best expected position first, faster growth breaks ties
+        order = np.lexsort((-recent_avg, expected_position))[:RS_LEADERBOARD_SIZE]
+
+        candidates = []
+        for i in order:
+            book = books[indices[i]]
+            candidates.append({
+                'book_id': book.get('book_id'),
+                'title': book.get('title', f"Book {book.get('book_id')}"),
+                'author_name': book.get('author_name', 'Unknown Author'),
+                'url': book.get('url') or f"https://www.royalroad.com/fiction/{book.get('book_id')}",
+                'best_match': BENCHMARK_LABELS[best_band[i]],
+                'probability': int(round(probabilities[i, best_band[i]] * 100)),
+                'expected_position': float(expected_position[i]),
+                'recent_avg_growth': float(recent_avg[i]),
+                'week_growth': int(recent.sum(axis=1)[i])
+            })
+
+        return candidates
+
+    async def rs_candidates_handler(self, interaction: discord.Interaction, count: int):
+        """Handle the RS candidates leaderboard command"""
+        self.command_counter += 1
+
+        logger.info(f"\n[RR-RS-CANDIDATES] Command called by {interaction.user}")
+        logger.info(f"[RR-RS-CANDIDATES] Count: {count}")
+
+        await interaction.response.defer()
+
+        try:
+            if count < 1 or count > 25:
+                await interaction.followup.send(
+                    "❌ Count must be between 1 and 25.",
+                    ephemeral=True
+                )
+                return
+
+            # The first scan may still be running right after startup
+            if self.last_scan is None:
+                await self.scan()
+
+            if self.last_scan is None:
+                await interaction.followup.send(
+                    "❌ Rising Stars candidates are not available yet. Please try again later.",
+                    ephemeral=True
+                )
+                return
+
+            embed = self.create_candidates_embed(count)
+            embed = self.add_promotional_field(embed)
+
+            await interaction.followup.send(embed=embed)
+            logger.info(f"[RR-RS-CANDIDATES] Sent {min(count, len(self.candidates))} candidates")
+
+        except Exception as e:
+            logger.error(f"[RR-RS-CANDIDATES] Error: {e}")
+            import traceback
+            traceback.print_exc()
+
+            try:
+                await interaction.followup.send(
+                    "❌ An error occurred while loading Rising Stars candidates.",
+                    ephemeral=True
+                )
+            except:
+                pass
+
+    def create_candidates_embed(self, count: int) -> discord.Embed:
+        """Create embed for the candidates leaderboard"""
+        embed = discord.Embed(
+            title="🌟 Rising Stars Candidates",
+            description=(
+                f"Eligible books whose last week of growth best matches past Main Rising Stars entries\n"
+                f"({self.eligible_books} eligible out of {self.scanned_books} recently tracked books)"
+            ),
+            color=0x00A8FF
+        )
+        footer = "Data from Stepan Chizhov's Royal Road Analytics\nRun /rr-followers with rs_prediction:True for a detailed analysis"
+        scanned_name = "📅 Last Scanned"
+        scanned_value = self.last_scan.strftime('%b %d, %Y at %I:%M %p') if self.last_scan else ''
+
+        if not self.candidates:
+            embed.add_field(
+                name="No candidates",
+                value="No tracked book currently meets the Rising Stars eligibility rules.",
+                inline=False
+            )
+        else:
+            lines = []
+            for rank, candidate in enumerate(self.candidates[:count], 1):
+                lines.append(
+                    f"**{rank}. [{candidate['title']}]({candidate['url']})** by {candidate['author_name']}\n"
+                    f"   Likely peak: #{candidate['best_match']} ({candidate['probability']}%) • "
+                    f"{candidate['recent_avg_growth']:.1f} followers/day • +{candidate['week_growth']:,} this week"
+                )
+
+            # Rows must fit Discord's 6000 character embed limit along with the
+            # footer, the Last Scanned field and a possible promotional field
+            budget = EMBED_CHAR_LIMIT - len(embed) - len(footer) - len(scanned_name) - len(scanned_value)
+            budget -= PROMO_FIELD_RESERVE + MORE_NOTE_RESERVE
+
+            # Stay under Discord's 1024 character field limit
+            fields = []
+            used = 0
+            for line in lines:
+                new_field = not fields or sum(len(l) + 1 for l in fields[-1]) + len(line) > 1000
+                cost = len(line) + 1 + (len("📋 Leaderboard (cont.)") if new_field else 0)
+                if used + cost > budget:
+                    break
+                used += cost
+                if new_field:
+                    fields.append([])
+                fields[-1].append(line)
+
+            shown = sum(len(field_lines) for field_lines in fields)
+            if shown < len(lines):
+                note = f"…and {len(lines) - shown} more"
+                if fields and sum(len(l) + 1 for l in fields[-1]) + len(note) <= 1000:
+                    fields[-1].append(note)
+                else:
+                    fields.append([note])
+
+            for field_number, field_lines in enumerate(fields, 1):
+                embed.add_field(
+                    name="📋 Leaderboard" if field_number == 1 else "📋 Leaderboard (cont.)",
+                    value="\n".join(field_lines),
+                    inline=False
+                )
+
+        if self.last_scan:
+            embed.add_field(name=scanned_name, value=scanned_value, inline=False)
+
+        embed.set_footer(text=footer)
+        return embed
@@ -10,21 +10,29 @@ import aiohttp
 import json
 import asyncio
 from typing import Optional, Dict, List, Any
-from datetime import datetime, timedelta
 import logging
-import random
-from collections import defaultdict
+import os
+
+from dm_dispatcher import DMDispatcher
+from user_resolver import UserResolver
+import json_codec
+from http_cache import http_cache
+import promotional_utils
 
 # Set up logging for this module
 logger = logging.getLogger('discord')
 
+# Number of campaigns requested and shown per page in /shoutout-browse
+CAMPAIGNS_PAGE_SIZE = 10
+
 class ShoutoutModule:
     """
     Modular shoutout swap system for Discord bot
     Handles campaign creation, browsing, application management, and user campaigns
     """
     
-    def __init__(self, bot: commands.Bot, session: aiohttp.ClientSession, wp_api_url: str, wp_bot_token: str, tag_autocomplete_func=None):
+    def __init__(self, bot: commands.Bot, session: aiohttp.ClientSession, wp_api_url: str, wp_bot_token: str, tag_autocomplete_func=None,
+                 user_resolver: Optional[UserResolver] = None, dm_dispatcher: Optional[DMDispatcher] = None):
         self.bot = bot
         self.session = session
         self.wp_api_url = wp_api_url
@@ -36,9 +44,15 @@ class ShoutoutModule:
         logger.info(f"[SHOUTOUT_MODULE] wp_api_url: {wp_api_url}")
         logger.info(f"[SHOUTOUT_MODULE] wp_bot_token: {'[SET]' if wp_bot_token else '[NOT SET]'}")
 
-        # Rate limiting for DMs
-        self.dm_cooldowns = defaultdict(lambda: datetime.min)
-        self.dm_rate_limit = timedelta(seconds=5)  # 5 seconds between DMs to same user
+        # Background DM delivery (rate limited, retried, persisted across restarts).
+        # The bot passes one shared dispatcher so reconnects don't start more workers
+        self.user_resolver = user_resolver or UserResolver(bot)
+        self.dm_dispatcher = dm_dispatcher or DMDispatcher(
+            bot,
+            state_path=os.getenv('DM_QUEUE_STATE_PATH', 'pending_dms.json'),
+            user_resolver=self.user_resolver
+        )
+        self.dm_dispatcher.start()
 
         # Initialize command counter for promotional messages
         self.command_counter = 0
@@ -147,7 +161,7 @@ class ShoutoutModule:
     
     def get_promotional_field(self, force_show=False):
         """
-        Get promotional field for embeds based on command counter
+        Get the shared promotional field, rotated by this module's command counter
         
         Args:
             force_show (bool): Force showing a promotional message regardless of counter
@@ -155,148 +169,7 @@ class ShoutoutModule:
         Returns:
             dict: Field data with name and value, or None if no promo should be shown
         """
-        # Only show promotional messages every 2 commands (or if forced)
-        #if not force_show and self.command_counter % 2 != 0:
-        #    return None
-        
-        # Define all promotional messages
-        promo_messages = [
-            {
-                "text": "📖 You can also read Stepan Chizhov's",
-                "url": "https://www.royalroad.com/fiction/105229/",
-                "link_text": "The Dark Lady's Guide to Villainy!"
-            },
-#            {
-#                "text": "❤️ If you like this and other tools made by Stepan Chizhov:",
-#                "url": "https://www.patreon.com/stepanchizhov",
-#                "link_text": "Support his work on Patreon!"
-#            },
-            {
-                "text": "🔍 Find more analytical tools for Royal Road authors and readers!",
-                "url": "https://stepan.chizhov.com",
-                "link_text": "Visit stepan.chizhov.com"
-            },
-            {
-                "text": "💬 Need help or have suggestions?",
-                "url": "https://discord.gg/xvw9vbvrwj",
-                "link_text": "Join our Support Discord"
-            },
-            {
-                "text": "📚 Join discussions about Royal Road and analytics!",
-                "url": "https://discord.gg/7Xrrf3Q5zp",
-                "link_text": "Immersive Ink Community Discord"
-            },
-            {
-                "text": "📚 Join discussions about Royal Road and analytics!",
-                "url": "https://discord.gg/v6SVD2Gbeh",
-                "link_text": "RR Writer's Guild Community Discord"
-            }
-        ]
-        
-        # Rotate through promotional messages based on how many promos have been shown
-        promo_index = (self.command_counter // 2 - 1) % len(promo_messages)
-        promo = promo_messages[promo_index]
-        
-        # Create the Patreon goal message
-        current_amount = 38  # Update this manually
-        goal_amount = 70
-        percentage = (current_amount / goal_amount) * 100
-        bar_length = 10
-        filled_length = int(bar_length * current_amount / goal_amount)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        
-        patreon_messages = [
-            f"💸 {current_amount}/{goal_amount} followers [{bar}]\n {percentage:.0f}% Help keep these tools alive past autumn!",
-            f"🎯 {current_amount}/{goal_amount} followers [{bar}]\n My hosting bills don't pay themselves, darling",
-            f"⚡ {current_amount}/{goal_amount} followers [{bar}]\n These servers run on money, not magic (sadly)",
-            f"🔥 {current_amount}/{goal_amount} followers [{bar}]\n Winter is coming... and so are the hosting bills",
-            f"☕ {current_amount}/{goal_amount} followers [{bar}]\n Less than a coffee a month keeps the bot alive",
-            f"🚀 {current_amount}/{goal_amount} followers [{bar}]\n Fuel the rocket, or it crashes in the autumn",
-            f"💀 {current_amount}/{goal_amount} followers [{bar}]\n Save the bot from its impending doom this autumn",
-            f"🎮 {current_amount}/{goal_amount} followers [{bar}]\n Insert coin to continue (autumn deadline approaching)",
-            f"🌟 {current_amount}/{goal_amount} followers [{bar}]\n Be a hero, save a bot (and my sanity)",
-            f"⏰ {current_amount}/{goal_amount} followers [{bar}]\n Tick tock, autumn's coming for these servers",
-            f"🏴‍☠️ {current_amount}/{goal_amount} followers [{bar}]\n Even pirates need to pay for hosting",
-            f"🎭 {current_amount}/{goal_amount} followers [{bar}]\n This bot's survival: a autumn tragedy in the making?",
-            f"🍂 {current_amount}/{goal_amount} followers [{bar}]\n When autumn leaves fall, will this bot too?",
-            f"💔 {current_amount}/{goal_amount} followers [{bar}]\n Don't let our beautiful friendship end this autumn",
-    
-            # Fantasy themed
-            f"🐉 {current_amount}/{goal_amount} followers [{bar}]\n Dragons hoard gold, I just need server money",
-            f"⚔️ {current_amount}/{goal_amount} followers [{bar}]\n Join the quest to defeat the Hosting Bill Boss",
-            f"🧙 {current_amount}/{goal_amount} followers [{bar}]\n Even wizards can't conjure free servers",
-            f"🏰 {current_amount}/{goal_amount} followers [{bar}]\n Help defend the castle from autumn's server shutdown",
-            f"📜 {current_amount}/{goal_amount} followers [{bar}]\n The prophecy says: 'No coins by the end of autumn = darkness'",
-            f"🦄 {current_amount}/{goal_amount} followers [{bar}]\n Unicorns are rare, but rarer still is free hosting",
-            f"🗡️ {current_amount}/{goal_amount} followers [{bar}]\n Your coin pouch vs. the autumn deadline",
-            f"🧝 {current_amount}/{goal_amount} followers [{bar}]\n Even elves pay their hosting bills (probably)",
-            f"🔮 {current_amount}/{goal_amount} followers [{bar}]\n The crystal ball shows server death this autumn",
-            f"👑 {current_amount}/{goal_amount} followers [{bar}]\n A kingdom for a server! (Or just 70 patrons)",
-            
-            # Sci-fi themed
-            f"🚀 {current_amount}/{goal_amount} followers [{bar}]\n Houston, we have a funding problem",
-            f"👽 {current_amount}/{goal_amount} followers [{bar}]\n Even aliens think 70 patrons can sustainable support our hosting",
-            f"🛸 {current_amount}/{goal_amount} followers [{bar}]\n Warp drive offline. Reason: insufficient credits",
-            f"🤖 {current_amount}/{goal_amount} followers [{bar}]\n CRITICAL ERROR: Funding.exe will terminate in the autumn",
-            f"⚡ {current_amount}/{goal_amount} followers [{bar}]\n Flux capacitor needs 70 patrons to survive past autumn",
-            f"🌌 {current_amount}/{goal_amount} followers [{bar}]\n In space, no one can hear servers die",
-            f"🔬 {current_amount}/{goal_amount} followers [{bar}]\n Scientific fact: Servers need money to exist",
-            f"🛰️ {current_amount}/{goal_amount} followers [{bar}]\n Ground control to Major Patron: please send funds",
-            f"💫 {current_amount}/{goal_amount} followers [{bar}]\n Initiating emergency funding protocol before winter",
-            f"🎛️ {current_amount}/{goal_amount} followers [{bar}]\n System critical: Power cells depleting by winter",
-            
-            # LitRPG themed
-            f"💰 {current_amount}/{goal_amount} followers [{bar}]\n [QUEST] Save the Server - Reward: Eternal gratitude",
-            f"📊 {current_amount}/{goal_amount} followers [{bar}]\n Server HP: {percentage:.0f}% - Critical damage at autumn!",
-            f"⬆️ {current_amount}/{goal_amount} followers [{bar}]\n Level up my hosting budget! EXP to autumn: Limited",
-            f"🎲 {current_amount}/{goal_amount} followers [{bar}]\n Roll for initiative against the Hosting Bill Monster",
-            f"⚡ {current_amount}/{goal_amount} followers [{bar}]\n Mana: {percentage:.0f}% - Full depletion = autumn shutdown",
-            f"🏆 {current_amount}/{goal_amount} followers [{bar}]\n Achievement Locked: 'Survive Past Autumn'",
-            f"💎 {current_amount}/{goal_amount} followers [{bar}]\n [LEGENDARY QUEST] Prevent the Autumn Server Apocalypse",
-            f"🗺️ {current_amount}/{goal_amount} followers [{bar}]\n Main Quest: Gather 70 Patrons Before Autumn's End",
-            f"⚔️ {current_amount}/{goal_amount} followers [{bar}]\n DPS: Donations Per Server-month needed!",
-            f"🛡️ {current_amount}/{goal_amount} followers [{bar}]\n Server Shield: {percentage:.0f}% - Breaks in the autumn",
-            f"📈 {current_amount}/{goal_amount} followers [{bar}]\n Stats: Funding {percentage:.0f}% | Time: Winter approaching",
-            f"🎯 {current_amount}/{goal_amount} followers [{bar}]\n Critical Hit needed on funding boss!",
-            
-            # Gaming themed
-            f"🎮 {current_amount}/{goal_amount} followers [{bar}]\n Server will ragequit in the autumn without support",
-            f"👾 {current_amount}/{goal_amount} followers [{bar}]\n Final boss: Autumn Hosting Bills - ${goal_amount} to defeat",
-            f"🕹️ {current_amount}/{goal_amount} followers [{bar}]\n Game Over in the autumn? Insert coin to continue",
-            f"🏁 {current_amount}/{goal_amount} followers [{bar}]\n Racing against autumn - currently in last place",
-            f"🎯 {current_amount}/{goal_amount} followers [{bar}]\n 360 no-scope the hosting bills before winter",
-            f"💣 {current_amount}/{goal_amount} followers [{bar}]\n Defuse the autumn shutdown bomb: 70 patrons required",
-            f"🏅 {current_amount}/{goal_amount} followers [{bar}]\n Speedrun: Fund the server before winter%",
-            f"🎪 {current_amount}/{goal_amount} followers [{bar}]\n This isn't pay-to-win, it's pay-to-exist",
-            f"🔥 {current_amount}/{goal_amount} followers [{bar}]\n Combo meter: {percentage:.0f}% - Don't drop it before winter!",
-            
-            # Mixed/General sassy
-            f"😅 {current_amount}/{goal_amount} followers [{bar}]\n Nervous laughter intensifies as winter approaches",
-            f"🎭 {current_amount}/{goal_amount} followers [{bar}]\n To be or not to be (online after autumn)",
-            f"📉 {current_amount}/{goal_amount} followers [{bar}]\n Hosting costs rise, patron support... help!",
-            f"🎪 {current_amount}/{goal_amount} followers [{bar}]\n Welcome to the 'Please Fund Me' circus!",
-            f"🌡️ {current_amount}/{goal_amount} followers [{bar}]\n Server health: {percentage:.0f}% - Terminal by winter",
-            f"⏳ {current_amount}/{goal_amount} followers [{bar}]\n The sands of time (and funding) run low",
-            f"🎨 {current_amount}/{goal_amount} followers [{bar}]\n Painting a masterpiece called 'Winter Server Death'",
-            f"🍕 {current_amount}/{goal_amount} followers [{bar}]\n Skip one pizza, save a bot's life this autumn"
-        ]
-        
-        patreon_text = random.choice(patreon_messages)
-        
-        # Combine both messages into the field value
-        combined_value = (
-            f"{promo['text']}\n[**{promo['link_text']}**]({promo['url']})\n\n"
-            f"**━━━━━━━━━━━━━━━━━━━━━**\n"
-            f"We achieved our extended goal (yay!), but currently, only two generous patrons cover more than a half of all contributions. We aren't out of the woods yet! We need to have {goal_amount} patrons to make the tool sustainable by the end of November. Please consider joining even at the lowest tier!\n"
-            f"{patreon_text}\n"
-            f"[**→ Support on Patreon**](https://patreon.com/stepanchizhov/membership)"
-        )
-        
-        return {
-            "name": "━━━━━━━━━━━━━━━━━━━━━",
-            "value": combined_value,
-            "inline": False
-        }
+        return promotional_utils.get_promotional_field(force_show, counter=self.command_counter)
     
     def add_promotional_field(self, embed, force_show=False):
         """
@@ -491,7 +364,7 @@ class ShoutoutModule:
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.session.get(url, params=params, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    campaign = await response.json()
+                    campaign = await json_codec.read_json(response)
                     
                     # Check if campaign exists and is active
                     if not campaign or campaign.get('campaign_status') != 'active':
@@ -589,41 +462,23 @@ class ShoutoutModule:
             # Always pass show_mine parameter (even if False) so the API knows what to do
             params['show_mine'] = 'true' if show_mine else 'false'
             
-            url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/shoutout/campaigns"
-            headers = {
-                'Authorization': f'Bearer {self.wp_bot_token}',
-                'User-Agent': 'Essence-Discord-Bot/1.0'
-            }
+            # Only the first page is fetched here; the view loads (and prefetches) the rest
+            page = await self.fetch_campaign_page(params, offset=0)
             
-            logger.info(f"[SHOUTOUT_MODULE] Fetching campaigns from: {url}")
-            # logger.info(f"[SHOUTOUT_MODULE] Request params: {params}")
-            
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with self.session.get(url, params=params, headers=headers, timeout=timeout) as response:
-                logger.info(f"[SHOUTOUT_MODULE] Browse response status: {response.status}")
-                
-                if response.status == 200:
-                    result = await response.json()
-                    campaigns = result.get('campaigns', [])
-                    
-                    logger.info(f"[SHOUTOUT_MODULE] Found {len(campaigns)} campaigns")
-                    
-                    if campaigns:
-                        embed = self.create_campaign_list_embed(campaigns)
-                        self.command_counter += 1
-                        embed = self.add_promotional_field(embed)
-                        await interaction.followup.send(embed=embed)
-                    else:
-                        await interaction.followup.send(
-                            "No campaigns found matching your criteria. Try adjusting your filters or check back later!",
-                            ephemeral=True
-                        )
-                else:
-                    logger.error(f"[SHOUTOUT_MODULE] Failed to fetch campaigns: {response.status}")
-                    await interaction.followup.send(
-                        "❌ Failed to fetch campaigns. Please try again later.",
-                        ephemeral=True
-                    )
+            if page is None:
+                await interaction.followup.send(
+                    "❌ Failed to fetch campaigns. Please try again later.",
+                    ephemeral=True
+                )
+            elif page['campaigns']:
+                self.command_counter += 1
+                view = CampaignBrowseView(self, params, page, interaction.user.id)
+                await interaction.followup.send(embed=view.create_page_embed(), view=view)
+            else:
+                await interaction.followup.send(
+                    "No campaigns found matching your criteria. Try adjusting your filters or check back later!",
+                    ephemeral=True
+                )
                     
         except asyncio.TimeoutError:
             logger.error(f"[SHOUTOUT_MODULE] Browse request timeout")
@@ -641,15 +496,87 @@ class ShoutoutModule:
                 ephemeral=True
             )
     
-    def create_campaign_list_embed(self, campaigns: List[Dict]) -> discord.Embed:
-        """Create embed showing list of campaigns"""
+    async def fetch_campaign_page(self, params: Dict, offset: int, limit: int = CAMPAIGNS_PAGE_SIZE) -> Optional[Dict]:
+        """
+        Fetch a single page of campaigns from the API
+        
+        Args:
+            params: Browse filters (as built by handle_browse_campaigns)
+            offset: Index of the first campaign to return
+            limit: Page size
+        
+        Returns:
+            Dict with 'campaigns', 'total' (None if unknown) and 'has_more',
+            or None if the request failed
+        """
+        page_params = dict(params)
+        page_params['offset'] = offset
+        page_params['limit'] = limit
+        
+        url = f"{self.wp_api_url}/wp-json/rr-analytics/v1/shoutout/campaigns"
+        headers = {
+            'Authorization': f'Bearer {self.wp_bot_token}',
+            'User-Agent': 'Essence-Discord-Bot/1.0'
+        }
+        
+        logger.info(f"[SHOUTOUT_MODULE] Fetching campaigns from: {url} (offset {offset}, limit {limit})")
+        
+        timeout = aiohttp.ClientTimeout(total=10)
+        status, body = await http_cache.request(
+            self.session, 'GET', url, params=page_params, headers=headers, timeout=timeout
+        )
+        logger.info(f"[SHOUTOUT_MODULE] Browse response status: {status}")
+        
+        if status != 200:
+            logger.error(f"[SHOUTOUT_MODULE] Failed to fetch campaigns: {status}")
+            return None
+        
+        result = json_codec.parse_body(body)
+        
+        campaigns = result.get('campaigns', [])
+        total = result.get('total')
+        
+        # Backends that page report 'total' or 'has_more'; older ones ignore
+        # offset/limit and return every campaign, so page those locally
+        if len(campaigns) > limit or ('total' not in result and 'has_more' not in result):
+            total = len(campaigns)
+            campaigns = campaigns[offset:offset + limit]
+            has_more = offset + len(campaigns) < total
+        elif 'has_more' in result:
+            has_more = bool(result['has_more'])
+        elif total is not None:
+            has_more = offset + len(campaigns) < int(total)
+        else:
+            has_more = len(campaigns) == limit
+        
+        logger.info(f"[SHOUTOUT_MODULE] Found {len(campaigns)} campaigns (total: {total})")
+        
+        return {
+            'campaigns': campaigns,
+            'total': int(total) if total is not None else None,
+            'has_more': has_more
+        }
+    
+    def create_campaign_list_embed(self, campaigns: List[Dict], offset: int = 0,
+                                   total: Optional[int] = None) -> discord.Embed:
+        """
+        Create embed showing a page of campaigns
+        
+        Args:
+            campaigns: Campaigns on this page
+            offset: Position of the first campaign in the full result set
+            total: Total number of matching campaigns, if known
+        """
+        if total is None and len(campaigns) > CAMPAIGNS_PAGE_SIZE:
+            total = len(campaigns)
+        
         embed = discord.Embed(
             title="📚 Available Shoutout Campaigns",
-            description=f"Found {len(campaigns)} campaign(s)",
+            description=f"Found {total} campaign(s)" if total is not None else "Browse available campaigns",
             color=0x00A86B
         )
         
-        for i, campaign in enumerate(campaigns[:10]):  # Show max 10
+        for i, campaign in enumerate(campaigns[:CAMPAIGNS_PAGE_SIZE], start=offset):
             campaign_id = campaign.get('id', 'Unknown')
             book_url = campaign.get('book_url', '#')
             book_title = campaign.get('book_title', 'Unknown Book')
@@ -705,14 +632,11 @@ class ShoutoutModule:
                 inline=False
             )
         
-        if len(campaigns) > 10:
-            embed.add_field(
-                name="More campaigns available",
-                value=f"Showing 10 of {len(campaigns)} campaigns. Use filters to narrow results",
-                inline=False
-            )
-        
-        embed.set_footer(text="💡 Apply to any campaign using: /shoutout-apply [campaign_id]\n❓ Check any campaign's info using: /shoutout-view-details [campaign_id]")
+        footer = "💡 Apply to any campaign using: /shoutout-apply [campaign_id]\n❓ Check any campaign's info using: /shoutout-view-details [campaign_id]"
+        shown = min(len(campaigns), CAMPAIGNS_PAGE_SIZE)
+        if total is not None and total > shown:
+            footer += f"\n📄 Showing {offset + 1}-{offset + shown} of {total}"
+        embed.set_footer(text=footer)
         
         return embed
         
@@ -746,7 +670,7 @@ class ShoutoutModule:
             timeout = aiohttp.ClientTimeout(total=5)
             async with self.session.get(url, params=params, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await json_codec.read_json(response)
             
             return None
             
@@ -777,7 +701,7 @@ class ShoutoutModule:
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.session.get(url, params=params, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     campaigns = result.get('campaigns', [])
                     
                     if not campaigns:
@@ -827,7 +751,7 @@ class ShoutoutModule:
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.session.get(url, params=params, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    campaign = await response.json()
+                    campaign = await json_codec.read_json(response)
                     
                     # Show campaign details and confirm application
                     embed = discord.Embed(
@@ -897,7 +821,7 @@ class ShoutoutModule:
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.session.get(url, params=params, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     applications = result.get('applications', [])
                     
                     # Filter applications if requested
@@ -1081,50 +1005,18 @@ class ShoutoutModule:
         
         return embed    
 
-    async def send_dm_with_ratelimit(self, user_id: int, embed: discord.Embed) -> bool:
-        """Send DM with rate limit protection"""
+    async def send_dm_with_ratelimit(self, user_id: int, embed: discord.Embed,
+                                     report_to: Optional[int] = None, description: Optional[str] = None) -> bool:
+        """
+        Queue a DM for rate-limited background delivery
+        
+        Returns immediately; the dispatcher handles pacing, retries and
+        reporting undeliverable DMs to report_to (e.g. the campaign owner).
+        """
         try:
-            # Check cooldown
-            now = datetime.now()
-            last_dm = self.dm_cooldowns[user_id]
-            
-            if now - last_dm < self.dm_rate_limit:
-                wait_time = (self.dm_rate_limit - (now - last_dm)).total_seconds()
-                logger.info(f"[SHOUTOUT_MODULE] Rate limit: waiting {wait_time:.1f}s before DMing user {user_id}")
-                await asyncio.sleep(wait_time)
-            
-            # Try to get the user
-            try:
-                user = await self.bot.fetch_user(user_id)
-            except discord.NotFound:
-                logger.error(f"[SHOUTOUT_MODULE] User {user_id} not found")
-                return False
-            except discord.HTTPException as e:
-                if e.status == 429:  # Rate limited
-                    logger.warning(f"[SHOUTOUT_MODULE] Rate limited when fetching user {user_id}")
-                    await asyncio.sleep(5)  # Wait 5 seconds and skip
-                    return False
-                raise
-            
-            # Send DM with error handling
-            try:
-                await user.send(embed=embed)
-                self.dm_cooldowns[user_id] = datetime.now()
-                logger.info(f"[SHOUTOUT_MODULE] DM sent successfully to {user_id}")
-                return True
-            except discord.Forbidden:
-                logger.info(f"[SHOUTOUT_MODULE] Cannot DM user {user_id} - DMs disabled")
-                return False
-            except discord.HTTPException as e:
-                if e.status == 429:  # Rate limited
-                    retry_after = e.retry_after if hasattr(e, 'retry_after') else 60
-                    logger.warning(f"[SHOUTOUT_MODULE] Rate limited sending DM. Retry after: {retry_after}s")
-                    # Don't retry, just log it
-                    return False
-                raise
-                
+            return self.dm_dispatcher.enqueue(user_id, embed=embed, report_to=report_to, description=description)
         except Exception as e:
-            logger.error(f"[SHOUTOUT_MODULE] Error sending DM to {user_id}: {e}")
+            logger.error(f"[SHOUTOUT_MODULE] Error queueing DM to {user_id}: {e}")
             return False
     
     def create_my_campaigns_embed(self, campaign: Dict, index: int, total: int) -> discord.Embed:
@@ -1457,6 +1349,119 @@ class EnhancedBookDetailsModal(discord.ui.Modal, title="Campaign Details"):
             logger.info(f"[SHOUTOUT_MODULE] ========== ENHANCED MODAL SUBMIT END ==========")
 
 
+class CampaignBrowseView(discord.ui.View):
+    """Paginated campaign browser that prefetches the next page in the background"""
+    
+    def __init__(self, module: ShoutoutModule, params: Dict, first_page: Dict, user_id: int):
+        super().__init__(timeout=600)
+        self.module = module
+        self.params = params
+        self.user_id = user_id
+        self.pages = {0: first_page}
+        self.prefetch_tasks = {}
+        self.page_index = 0
+        self.update_buttons()
+        self.prefetch(1)
+    
+    def update_buttons(self):
+        """Update button states based on current page"""
+        self.previous_button.disabled = self.page_index == 0
+        self.next_button.disabled = not self.pages[self.page_index]['has_more']
+    
+    def prefetch(self, page_index: int):
+        """Start loading a page in the background if it might exist"""
+        if page_index in self.pages or page_index in self.prefetch_tasks:
+            return
+        previous_page = self.pages.get(page_index - 1)
+        if not previous_page or not previous_page['has_more']:
+            return
+        
+        task = asyncio.create_task(
+            self.module.fetch_campaign_page(self.params, offset=page_index * CAMPAIGNS_PAGE_SIZE)
+        )
+        task.add_done_callback(self.on_prefetch_done)
+        self.prefetch_tasks[page_index] = task
+    
+    @staticmethod
+    def on_prefetch_done(task: asyncio.Task):
+        """Retrieve a failed prefetch's exception even if the page is never opened"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"[SHOUTOUT_MODULE] Campaign page prefetch failed: {task.exception()}")
+    
+    async def load_page(self, page_index: int) -> Optional[Dict]:
+        """Get a page, using the prefetched result when available"""
+        if page_index in self.pages:
+            return self.pages[page_index]
+        
+        task = self.prefetch_tasks.pop(page_index, None)
+        try:
+            if task:
+                page = await task
+            else:
+                page = await self.module.fetch_campaign_page(self.params, offset=page_index * CAMPAIGNS_PAGE_SIZE)
+        except Exception as e:
+            logger.error(f"[SHOUTOUT_MODULE] Error loading campaign page {page_index + 1}: {e}")
+            page = None
+        
+        if not page or not page['campaigns']:
+            return None
+        
+        # A backend that ignores offset answers every page with the first one
+        if page_index > 0 and page['campaigns'][0].get('id') == self.pages[0]['campaigns'][0].get('id'):
+            return None
+        
+        self.pages[page_index] = page
+        return page
+    
+    def create_page_embed(self) -> discord.Embed:
+        """Create embed for the current page"""
+        page = self.pages[self.page_index]
+        embed = self.module.create_campaign_list_embed(
+            page['campaigns'],
+            offset=self.page_index * CAMPAIGNS_PAGE_SIZE,
+            total=page['total']
+        )
+        return self.module.add_promotional_field(embed)
+    
+    async def show_page(self, interaction: discord.Interaction, page_index: int):
+        """Switch to another page and prefetch the one after it"""
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("Use `/shoutout-browse` to browse campaigns yourself.", ephemeral=True)
+            return
+        
+        if page_index not in self.pages:
+            await interaction.response.defer()
+        
+        page = await self.load_page(page_index)
+        if page is None:
+            # Nothing more to show; stay on the current page
+            self.pages[self.page_index]['has_more'] = False
+        else:
+            self.page_index = page_index
+            self.prefetch(page_index + 1)
+        
+        self.update_buttons()
+        
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=self.create_page_embed(), view=self)
+        else:
+            await interaction.response.edit_message(embed=self.create_page_embed(), view=self)
+    
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, max(0, self.page_index - 1))
+    
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.page_index + 1)
+    
+    async def on_timeout(self):
+        """Cancel any prefetches nobody will look at"""
+        for task in self.prefetch_tasks.values():
+            task.cancel()
+        self.prefetch_tasks.clear()
+
+
 class MyCampaignsView(discord.ui.View):
     """View for navigating through user's campaigns"""
     
@@ -1798,7 +1803,7 @@ class CampaignManagementView(discord.ui.View):
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.module.session.put(url, json=data, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     new_status = result.get('new_status', 'unknown')
                     
                     # Update button label
@@ -2257,7 +2262,7 @@ class EditBookDetailsModal(discord.ui.Modal, title="Edit Book Details"):
                     logger.info(f"[SHOUTOUT_MODULE] Response status: {response.status}")
                     
                     if response.status == 200:
-                        result = await response.json()
+                        result = await json_codec.read_json(response)
                         logger.info(f"[SHOUTOUT_MODULE] Book details updated successfully: {result}")
                         await interaction.followup.send(
                             "✅ Book details updated successfully!",
@@ -2408,7 +2413,7 @@ class EditCampaignSettingsModal(discord.ui.Modal, title="Edit Campaign Settings"
                 logger.info(f"[SHOUTOUT_MODULE] Response status: {response.status}")
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     logger.info(f"[SHOUTOUT_MODULE] Settings updated successfully: {result}")
                     
                     await interaction.followup.send(
@@ -2556,7 +2561,7 @@ class EditShoutoutDetailsModal(discord.ui.Modal, title="Edit Shoutout Details"):
                     logger.info(f"[SHOUTOUT_MODULE] Response status: {response.status}")
                     
                     if response.status == 200:
-                        result = await response.json()
+                        result = await json_codec.read_json(response)
                         logger.info(f"[SHOUTOUT_MODULE] Shoutout details updated successfully: {result}")
                         await interaction.followup.send(
                             "✅ Shoutout details updated successfully!",
@@ -2690,7 +2695,7 @@ class ServerSelectionView(discord.ui.View):
                 logger.info(f"[SHOUTOUT_MODULE] Response status: {response.status}")
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = await json_codec.read_json(response)
                     logger.info(f"[SHOUTOUT_MODULE] Server visibility updated successfully: {result}")
                     
                     if self.selected_servers:
@@ -3259,13 +3264,9 @@ class ApplicationReviewView(discord.ui.View):
                     if self.current_index < len(self.applications):
                         current_app = self.applications[self.current_index]
                         
-                        # Send notification with rate limiting
+                        # Queue notification (delivered in the background)
                         await self.notify_applicant(current_app, status, decline_reason, shout_date, chapter)
                         
-                        # Add a small delay if processing multiple applications
-                        if len(self.applications) > 1:
-                            await asyncio.sleep(1)  # 1 second delay between processing
-                        
                         # Remove the application from the list
                         self.applications.pop(self.current_index)
                     
@@ -3283,7 +3284,7 @@ class ApplicationReviewView(discord.ui.View):
                         
                         await interaction.followup.edit_message(
                             message_id=interaction.message.id,
-                            content=f"✅ Application {status}! Notification sent to applicant.",
+                            content=f"✅ Application {status}! Notification queued for the applicant.",
                             embed=embed,
                             view=self
                         )
@@ -3408,8 +3409,12 @@ class ApplicationReviewView(discord.ui.View):
             
             embed.set_footer(text=f"Campaign ID: #{self.campaign.get('id', 'Unknown')}")
             
-            # Use rate-limited DM sending
-            await self.module.send_dm_with_ratelimit(int(applicant_id), embed)
+            # Queue the DM; the campaign owner is told if it can't be delivered
+            await self.module.send_dm_with_ratelimit(
+                int(applicant_id), embed,
+                report_to=self.campaign.get('discord_user_id'),
+                description=f"the {status} notification for **{self.campaign.get('book_title', 'your campaign')}**"
+            )
             
         except Exception as e:
             logger.error(f"[SHOUTOUT_MODULE] Error notifying applicant: {e}")
@@ -3546,7 +3551,7 @@ class ApplicationModal(discord.ui.Modal, title="Shoutout Application"):
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.module.session.get(check_url, params=check_params, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
-                    campaign_check = await response.json()
+                    campaign_check = await json_codec.read_json(response)
                     if campaign_check.get('already_applied'):
                         await interaction.followup.send(
                             f"❌ You have already applied to this campaign with the book: **{self.book_title.value}**\n"
@@ -3600,7 +3605,7 @@ class ApplicationModal(discord.ui.Modal, title="Shoutout Application"):
             
             timeout = aiohttp.ClientTimeout(total=10)
             async with self.module.session.post(url, json=data, headers=headers, timeout=timeout) as response:
-                result = await response.json()
+                result = await json_codec.read_json(response)
                 
                 if response.status == 200 and result.get('success'):
                     # Success handling...
@@ -0,0 +1,129 @@
+"""
+Logging pipeline for Discord Essence Bot
+Records are queued on the calling thread and formatted and written by a
+background listener, so log I/O never happens on the event loop
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from tracing import current_trace_id, current_command
+
+# Level of the bot's 'discord' logger (the root logger stays at WARNING)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+# Output format: 'text' or 'json' (one object per line)
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+# Only 1 in LOG_SAMPLE_RATE records at or below LOG_SAMPLE_LEVEL is kept, per call site
+LOG_SAMPLE_RATE = int(os.getenv('LOG_SAMPLE_RATE', '10'))
+LOG_SAMPLE_LEVEL = logging.DEBUG
+# Records waiting for the writer thread; beyond this new records are dropped
+LOG_QUEUE_SIZE = 10000
+# Text format used when LOG_FORMAT is 'text'
+TEXT_FORMAT = '%(asctime)s %(levelname)-8s %(name)s: %(message)s'
+
+
+class ContextFilter(logging.Filter):
+    """Stamp records with the command and trace id of the task that logged them"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.command = current_command.get()
+        record.trace_id = current_trace_id()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep 1 in `rate` low-level records per logging call site
+
+    Each high-volume debug line is sampled independently, so a noisy loop
+    doesn't hide the occasional line logged elsewhere.
+    """
+
+    def __init__(self, rate: int = LOG_SAMPLE_RATE, level: int = LOG_SAMPLE_LEVEL):
+        super().__init__()
+        self.rate = max(1, rate)
+        self.level = level
+        self.counts = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate == 1 or record.levelno > self.level:
+            return True
+        key = (record.pathname, record.lineno)
+        with self.lock:
+            count = self.counts[key]
+            self.counts[key] = count + 1
+        return count % self.rate == 0
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record with command and trace fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'command': getattr(record, 'command', None),
+            'trace_id': getattr(record, 'trace_id', None),
+            'thread': record.threadName
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread
+
+    The stock handler formats every record before queueing it; here only
+    the record is copied, and a full queue drops the record instead of
+    blocking the caller.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return logging.makeLogRecord(record.__dict__)
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging(level: str = LOG_LEVEL, output: str = LOG_FORMAT) -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue to a background stderr writer
+
+    Returns:
+        The started listener (stopped automatically at exit)
+    """
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if output == 'json':
+        stream_handler.setFormatter(JSONFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    queue_handler = DeferredQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    queue_handler.addFilter(SamplingFilter())
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(logging.WARNING)
+    logging.getLogger('discord').setLevel(level)
+
+    listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
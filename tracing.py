@@ -0,0 +1,318 @@
+"""
+Tracing for Discord Essence Bot
+Lightweight spans around interactions, outbound HTTP calls and chart renders,
+exported as OTLP JSON to a local file or an OpenTelemetry collector
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+
+import aiohttp
+import discord
+
+from metrics import endpoint_label
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Where finished spans go: '' (not exported), 'file' or 'otlp'
+TRACE_EXPORT = os.getenv('TRACE_EXPORT', '')
+# OTLP JSON lines file used by the 'file' exporter
+TRACE_FILE = os.getenv('TRACE_FILE', 'traces.jsonl')
+# OTLP/HTTP traces endpoint used by the 'otlp' exporter
+TRACE_OTLP_URL = os.getenv('TRACE_OTLP_URL', 'http://127.0.0.1:4318/v1/traces')
+# How often buffered spans are exported (seconds)
+TRACE_EXPORT_INTERVAL = 5
+# Spans kept in memory between exports; older ones are dropped when full
+TRACE_BUFFER_SIZE = 5000
+# Service name reported with every span
+TRACE_SERVICE_NAME = 'discord-essence-bot'
+# Header carrying the trace id to WordPress for backend slow logs
+TRACE_ID_HEADER = 'X-Trace-Id'
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Span of the code currently running (per task)
+current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('current_span', default=None)
+# Name of the app command the current task is handling
+current_command: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('current_command', default=None)
+
+
+def otlp_value(value) -> Dict[str, Any]:
+    """Wrap an attribute value in its OTLP JSON type"""
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class Span:
+    """One timed operation; children share the trace id of their parent"""
+
+    def __init__(self, name: str, parent: Optional['Span'] = None, kind: int = SPAN_KIND_INTERNAL,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes or {})
+        self.status = STATUS_OK
+        self.status_message = ''
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context header value for this span"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def end(self):
+        """Finish the span and hand it to the exporter (only the first call counts)"""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            tracer.finish(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns),
+            'attributes': [{'key': key, 'value': otlp_value(value)} for key, value in self.attributes.items()],
+            'status': {'code': self.status, 'message': self.status_message}
+        }
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+        return span
+
+
+class Tracer:
+    """
+    Creates spans and exports finished ones in batches
+
+    Spans are always created so trace ids can be passed to WordPress and
+    written to logs; they are only buffered when an exporter is configured.
+    """
+
+    def __init__(self, export: str = TRACE_EXPORT, path: str = TRACE_FILE, url: str = TRACE_OTLP_URL):
+        self.export = export
+        self.path = path
+        self.url = url
+        self.buffer: deque = deque(maxlen=TRACE_BUFFER_SIZE)
+        self.task: Optional[asyncio.Task] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def start_span(self, name: str, kind: int = SPAN_KIND_INTERNAL, parent: Optional[Span] = None,
+                   root: bool = False, **attributes) -> Span:
+        """
+        Start a span under `parent` (default: the current span); the caller must end() it
+
+        A `root` span starts a new trace even when there is a current span.
+        """
+        if parent is None and not root:
+            parent = current_span.get()
+        return Span(name, parent, kind, attributes)
+
+    @contextmanager
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+        """Run a block inside a new child span of the current one"""
+        span = self.start_span(name, kind, **attributes)
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            current_span.reset(token)
+            span.end()
+
+    def finish(self, span: Span):
+        if self.export:
+            self.buffer.append(span)
+
+    def start(self):
+        """Start exporting in the background (does nothing without an exporter)"""
+        if self.export and self.task is None:
+            self.task = asyncio.create_task(self.export_loop())
+            logger.info(f"[TRACING] Exporting spans to {self.path if self.export == 'file' else self.url}")
+
+    async def export_loop(self):
+        while True:
+            await asyncio.sleep(TRACE_EXPORT_INTERVAL)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[TRACING] Export failed: {e}")
+
+    def build_payload(self, spans: List[Span]) -> Dict[str, Any]:
+        """OTLP/JSON ExportTraceServiceRequest for a batch of spans"""
+        return {
+            'resourceSpans': [{
+                'resource': {
+                    'attributes': [{'key': 'service.name', 'value': otlp_value(TRACE_SERVICE_NAME)}]
+                },
+                'scopeSpans': [{
+                    'scope': {'name': TRACE_SERVICE_NAME},
+                    'spans': [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+
+    async def flush(self):
+        """Export everything buffered so far"""
+        if not self.buffer:
+            return
+        spans = list(self.buffer)
+        self.buffer.clear()
+        payload = json.dumps(self.build_payload(spans))
+
+        if self.export == 'file':
+            await asyncio.to_thread(self.append_to_file, payload)
+        elif self.export == 'otlp':
+            # Own session so exports don't show up as traced WordPress calls
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession()
+            async with self.session.post(
+                self.url, data=payload, headers={'Content-Type': 'application/json'}
+            ) as response:
+                if response.status >= 400:
+                    logger.error(f"[TRACING] Collector returned {response.status}")
+
+    def append_to_file(self, payload: str):
+        with open(self.path, 'a') as f:
+            f.write(payload + '\n')
+
+    async def stop(self):
+        """Stop the export loop and export what's left"""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"[TRACING] Final export failed: {e}")
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+
+# Shared tracer used by all modules
+tracer = Tracer()
+
+
+def current_trace_id() -> Optional[str]:
+    """Trace id of the current span, if any"""
+    span = current_span.get()
+    return span.trace_id if span else None
+
+
+def instrument_trace_config(trace_config: aiohttp.TraceConfig, service: str, propagate: bool = False):
+    """
+    Add a client span per request to an aiohttp trace config
+
+    Args:
+        trace_config: Trace config whose context is a SimpleNamespace
+        service: Name of the remote service ('wordpress', 'discord', ...)
+        propagate: Send the trace id (X-Trace-Id and traceparent headers)
+    """
+    async def on_request_start(session, context, params):
+        span = tracer.start_span(
+            f"{params.method} {endpoint_label(params.url.path)}", SPAN_KIND_CLIENT,
+            **{'peer.service': service, 'http.method': params.method, 'http.url': str(params.url.with_query(None))}
+        )
+        context.span = span
+        if propagate:
+            params.headers[TRACE_ID_HEADER] = span.trace_id
+            params.headers['traceparent'] = span.traceparent
+
+    async def on_request_end(session, context, params):
+        context.span.set_attribute('http.status_code', params.response.status)
+        if params.response.status >= 400:
+            context.span.set_error(f"HTTP {params.response.status}")
+        context.span.end()
+
+    async def on_request_exception(session, context, params):
+        context.span.set_error(f"{type(params.exception).__name__}: {params.exception}")
+        context.span.end()
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def instrument_command_tree(bot):
+    """
+    Open a root span for every app command interaction
+
+    The span is started by the tree's interaction check and becomes the
+    current span for the rest of the command's task; it is ended by the
+    app_command_completion event or by end_interaction_span on errors.
+    Autocomplete requests never complete, so they don't get a span.
+    """
+    tree = bot.tree
+    interaction_check = tree.interaction_check
+
+    async def traced_interaction_check(interaction) -> bool:
+        if interaction.type is discord.InteractionType.autocomplete:
+            return await interaction_check(interaction)
+
+        command = getattr(getattr(interaction, 'command', None), 'qualified_name', 'unknown')
+        span = tracer.start_span(
+            f"/{command}", SPAN_KIND_SERVER, root=True,
+            **{
+                'discord.interaction_id': str(interaction.id),
+                'discord.user_id': str(interaction.user.id),
+                'discord.guild_id': str(interaction.guild_id or '')
+            }
+        )
+        interaction.extras['trace_span'] = span
+        current_span.set(span)
+        current_command.set(command)
+        return await interaction_check(interaction)
+
+    async def on_app_command_completion(interaction, command):
+        end_interaction_span(interaction)
+
+    tree.interaction_check = traced_interaction_check
+    bot.add_listener(on_app_command_completion, 'on_app_command_completion')
+
+
+def end_interaction_span(interaction, error: Optional[BaseException] = None):
+    """End an interaction's root span, marking it failed if there was an error"""
+    span = interaction.extras.pop('trace_span', None)
+    if span is None:
+        return
+    if error is not None:
+        span.set_error(f"{type(error).__name__}: {error}")
+    span.end()
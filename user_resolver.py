@@ -0,0 +1,99 @@
+"""
+User resolution for Discord Essence Bot
+Resolves Discord users and DM channels with caching so notifications
+don't need a fetch_user REST call every time
+"""
+
+import discord
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+from metrics import record_cache
+
+# Set up logging
+logger = logging.getLogger('discord')
+
+# Maximum number of fetched users / DM channels kept in memory
+USER_CACHE_SIZE = 1024
+
+
+class UserResolver:
+    """
+    Resolves user IDs to User and DMChannel objects
+
+    Lookup order: the client cache (bot.get_user), then an LRU of users
+    fetched earlier, and only then the API (bot.fetch_user). DM channels
+    are kept in a separate LRU and reused for later messages.
+    """
+
+    def __init__(self, bot, max_size: int = USER_CACHE_SIZE):
+        self.bot = bot
+        self.max_size = max_size
+        self.users: "OrderedDict[int, discord.User]" = OrderedDict()
+        self.dm_channels: "OrderedDict[int, discord.DMChannel]" = OrderedDict()
+
+    def remember(self, cache: OrderedDict, key: int, value):
+        """Store a value in an LRU cache, evicting the oldest entry if full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.max_size:
+            cache.popitem(last=False)
+
+    def get_cached_user(self, user_id: int) -> Optional[discord.User]:
+        """Get a user without making any API calls"""
+        user_id = int(user_id)
+
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+
+        user = self.users.get(user_id)
+        if user is not None:
+            self.users.move_to_end(user_id)
+        return user
+
+    async def get_user(self, user_id: int) -> discord.User:
+        """
+        Resolve a user, falling back to the API only on a cache miss
+
+        Raises:
+            discord.NotFound: If the user does not exist
+            discord.HTTPException: If fetching the user failed
+        """
+        user_id = int(user_id)
+
+        user = self.get_cached_user(user_id)
+        record_cache('users', 'miss' if user is None else 'hit')
+        if user is not None:
+            return user
+
+        user = await self.bot.fetch_user(user_id)
+        self.remember(self.users, user_id, user)
+        logger.info(f"[USER_RESOLVER] Fetched user {user_id} from API")
+        return user
+
+    async def get_dm_channel(self, user_id: int) -> discord.DMChannel:
+        """Get (or open once) the DM channel for a user"""
+        user_id = int(user_id)
+
+        channel = self.dm_channels.get(user_id)
+        if channel is not None:
+            self.dm_channels.move_to_end(user_id)
+            return channel
+
+        user = await self.get_user(user_id)
+        channel = user.dm_channel or await user.create_dm()
+        self.remember(self.dm_channels, user_id, channel)
+        return channel
+
+    async def send(self, user_id: int, **kwargs) -> discord.Message:
+        """Send a DM to a user through their cached DM channel"""
+        channel = await self.get_dm_channel(user_id)
+        return await channel.send(**kwargs)
+
+    def forget(self, user_id: int):
+        """Drop a user and their DM channel from the caches"""
+        user_id = int(user_id)
+        self.users.pop(user_id, None)
+        self.dm_channels.pop(user_id, None)